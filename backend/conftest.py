@@ -80,6 +80,23 @@ def db_session():
         _audit_module._session_factory = TestingSessionLocal  # reset
 
 
+@pytest.fixture(autouse=True)
+def uploads_dir(tmp_path, monkeypatch):
+    """
+    Point upload/font storage at a per-test temp directory so tests never
+    leave files in the repository's uploads/ and fonts/ directories.
+    """
+    from routers import assets as _assets_router
+    from services import canvas_project_service, font_service
+
+    uploads = tmp_path / "uploads"
+    monkeypatch.setattr(canvas_project_service, "UPLOADS_DIR", str(uploads))
+    monkeypatch.setattr(font_service, "UPLOADS_DIR", str(uploads))
+    monkeypatch.setattr(_assets_router, "UPLOAD_DIR", uploads / "assets")
+    (uploads / "assets").mkdir(parents=True)
+    return uploads
+
+
 @pytest.fixture()
 def client(db_session):
     """
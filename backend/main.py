@@ -169,6 +169,25 @@ async def lifespan(app: FastAPI):
         logger.info("ShortForge scheduler stopped")
     except Exception:
         pass
+    # Wake running timelines out of their segment waits and release the
+    # executor's pooled HTTP connections
+    try:
+        from services.timeline_executor import get_timeline_executor
+        executor = get_timeline_executor()
+        executor.request_shutdown()
+        await executor.aclose()
+    except Exception:
+        pass
+    try:
+        from services import weather_data_service
+        await weather_data_service.aclose()
+    except Exception:
+        pass
+    try:
+        from services import local_stream_watchdog
+        await local_stream_watchdog.aclose()
+    except Exception:
+        pass
     logger.info("All services stopped")
 
 
@@ -3,7 +3,7 @@ Database models and configuration
 """
 
 from contextlib import contextmanager
-from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Boolean, ForeignKey
+from sqlalchemy import create_engine, event, inspect, Column, Integer, String, Float, DateTime, Boolean, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime, timezone
@@ -158,6 +158,27 @@ class Preset(Base):
     # Relationships
     camera = relationship("Camera", back_populates="presets")
 
+
+# Bumped whenever a Camera or Preset row changes (health-check last_seen updates
+# excepted) so that long-running consumers such as the timeline executor know
+# to reload them.
+_camera_generation = 0
+
+
+@event.listens_for(Camera, "after_insert")
+@event.listens_for(Camera, "after_update")
+@event.listens_for(Camera, "after_delete")
+@event.listens_for(Preset, "after_insert")
+@event.listens_for(Preset, "after_update")
+@event.listens_for(Preset, "after_delete")
+def _invalidate_camera_caches(mapper, connection, target):
+    global _camera_generation
+    if isinstance(target, Camera) and inspect(target).modified:
+        changed = {attr.key for attr in inspect(target).attrs if attr.history.has_changes()}
+        if changed <= {"last_seen"}:
+            return
+    _camera_generation += 1
+
 class Asset(Base):
     __tablename__ = "assets"
     
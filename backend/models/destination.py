@@ -2,10 +2,14 @@
 Streaming destination models
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, event
 from datetime import datetime, timezone
 from .database import Base
 
+# Bumped whenever a StreamingDestination row is inserted/updated/deleted so that
+# caches derived from destinations (e.g. the executor's RTMP URL index) are rebuilt.
+_destination_generation = 0
+
 
 class StreamingDestination(Base):
     """Configured streaming destinations (YouTube, Facebook, Twitch, etc.)"""
@@ -54,3 +58,11 @@ class StreamingDestination(Base):
         from utils.crypto import decrypt
         key = decrypt(self.stream_key) if self.stream_key else ""
         return f"{self.rtmp_url}/{key}"
+
+
+@event.listens_for(StreamingDestination, "after_insert")
+@event.listens_for(StreamingDestination, "after_update")
+@event.listens_for(StreamingDestination, "after_delete")
+def _invalidate_destination_caches(mapper, connection, target):
+    global _destination_generation
+    _destination_generation += 1
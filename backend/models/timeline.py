@@ -3,11 +3,16 @@ Timeline models for composite streams with camera switching
 Based on docs/StreamingPipeline-TechnicalSpec.md Multi-Track Timeline System
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, JSON, DateTime, event
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
+from typing import Tuple
 from .database import Base
 
+# Bumped whenever a TimelineCue row is inserted/updated/deleted so that
+# per-instance cue caches on Timeline objects are invalidated.
+_cue_generation = 0
+
 
 class Timeline(Base):
     """Timeline for composite streams"""
@@ -36,6 +41,23 @@ class Timeline(Base):
     tracks = relationship("TimelineTrack", back_populates="timeline", cascade="all, delete-orphan")
     executions = relationship("TimelineExecution", back_populates="timeline")
 
+    @property
+    def cached_video_cues(self) -> Tuple["TimelineCue", ...]:
+        """Cues of the video track sorted by cue_order (empty if no video track).
+
+        Memoized on the instance and keyed by (updated_at, cue generation) so the
+        track scan and sort only run again after the timeline or its cues change.
+        """
+        key = (self.updated_at, _cue_generation)
+        cached = self.__dict__.get("_video_cues_cache")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        video_track = next((t for t in self.tracks if t.track_type == "video"), None)
+        cues = tuple(sorted(video_track.cues, key=lambda c: c.cue_order)) if video_track else ()
+        self.__dict__["_video_cues_cache"] = (key, cues)
+        return cues
+
 
 class TimelineTrack(Base):
     """Track within a timeline (video track or overlay track)"""
@@ -70,6 +92,14 @@ class TimelineCue(Base):
     track = relationship("TimelineTrack", back_populates="cues")
 
 
+@event.listens_for(TimelineCue, "after_insert")
+@event.listens_for(TimelineCue, "after_update")
+@event.listens_for(TimelineCue, "after_delete")
+def _invalidate_video_cue_cache(mapper, connection, target):
+    global _cue_generation
+    _cue_generation += 1
+
+
 class TimelineExecution(Base):
     """Execution history of a timeline"""
     __tablename__ = "timeline_executions"
@@ -16,7 +16,7 @@ import asyncio
 import logging
 
 from models.database import get_db, SessionLocal, Camera, Preset, ReelForgeSettings
-from services.weather_data_service import DEFAULT_TEMPEST_URL
+from services.weather_data_service import DEFAULT_TEMPEST_URL, invalidate_settings_cache
 from utils.crypto import encrypt, decrypt
 
 logger = logging.getLogger(__name__)
@@ -122,6 +122,7 @@ def update_settings(
     settings.updated_at = datetime.now(timezone.utc)
     db.commit()
     db.refresh(settings)
+    invalidate_settings_cache()
     
     return {
         "id": settings.id,
@@ -226,7 +227,7 @@ def categorize_variable(key: str) -> str:
 
 
 @router.get("/settings/variables/live")
-def get_live_variables():
+def get_live_variables(db: Session = Depends(get_db)):
     """Get template variables with their current live values from TempestWeather"""
     try:
         from services.weather_data_service import fetch_weather_data_sync, get_available_variables
@@ -235,7 +236,7 @@ def get_live_variables():
         variables = get_available_variables()
         
         # Get current values from TempestWeather
-        current_values = fetch_weather_data_sync() or {}
+        current_values = fetch_weather_data_sync(db=db) or {}
         
         # Build response with categories and live values
         result = []
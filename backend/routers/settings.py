@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from models.database import get_db, Settings, Asset
 from routers.auth import get_current_user
+from services.weather_data_service import invalidate_settings_cache
 
 router = APIRouter(prefix="/api/settings", tags=["settings"], dependencies=[Depends(get_current_user)])
 
@@ -85,6 +86,8 @@ def update_settings(settings_update: SettingsUpdate, db: Session = Depends(get_d
     
     db.commit()
     db.refresh(settings)
+    if settings_update.timezone is not None:
+        invalidate_settings_cache()
     
     # Sync location information to all assets
     if any([
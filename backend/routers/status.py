@@ -83,8 +83,7 @@ async def get_system_status(db: Session = Depends(get_db), current_user: User =
                 
                 # Get destination names from timeline metadata if available
                 # Note: We store this when starting the timeline
-                if hasattr(executor, 'timeline_destinations') and timeline_id in executor.timeline_destinations:
-                    timeline_destinations = executor.timeline_destinations[timeline_id]
+                timeline_destinations = executor.state[timeline_id].destinations or None
     except Exception as e:
         logger.warning(f"Failed to get timeline status: {e}")
     
@@ -149,6 +149,10 @@ async def stop_timeline(timeline_id: int, db: Session = Depends(get_db)):
     # TEMP: Back to old executor
     executor = get_timeline_executor()
     
+    # Capture destinations before stopping drops the timeline's runtime state
+    state = executor.state.get(timeline_id)
+    dest_ids = state.destination_ids if state is not None else []
+
     # Stop timeline
     success = await executor.stop_timeline(timeline_id)
 
@@ -156,7 +160,6 @@ async def stop_timeline(timeline_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Timeline is not running")
 
     # Clear stale broadcast IDs so the next start creates a fresh broadcast
-    dest_ids = getattr(executor, 'timeline_destination_ids', {}).get(timeline_id) or []
     if dest_ids:
         dests = db.query(StreamingDestination).filter(
             StreamingDestination.id.in_(dest_ids)
@@ -209,12 +212,11 @@ async def get_timeline_status(timeline_id: int, db: Session = Depends(get_db)):
     executor = get_timeline_executor()
     
     # Check if running
-    is_running = timeline_id in executor.active_timelines
+    state = executor.state.get(timeline_id)
+    is_running = state is not None
     
     # Get destination IDs if running
-    destination_ids = None
-    if is_running and hasattr(executor, 'timeline_destination_ids'):
-        destination_ids = executor.timeline_destination_ids.get(timeline_id)
+    destination_ids = (state.destination_ids or None) if state is not None else None
     
     return {
         "timeline_id": timeline_id,
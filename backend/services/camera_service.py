@@ -14,7 +14,7 @@ from datetime import datetime, timezone
 from urllib.parse import urlparse, quote, urlunparse, unquote
 
 from models.database import Camera, Preset
-from utils.crypto import encrypt, decrypt
+from utils.crypto import encrypt, decrypt_cached
 from utils.log_utils import redact_url
 from utils.time_utils import utcnow
 from models.schemas import (
@@ -280,7 +280,7 @@ class CameraService:
             # Decode password if encrypted
             password = None
             if password_enc:
-                password = decrypt(password_enc)
+                password = decrypt_cached(password_enc)
 
             # Parse URL and strip embedded credentials if present (always use provided username/password)
             parsed_url = urlparse(snapshot_url)
@@ -358,7 +358,7 @@ class CameraService:
         # Decode password if encrypted
         password = None
         if camera.password_enc:
-            password = decrypt(camera.password_enc)
+            password = decrypt_cached(camera.password_enc)
 
         logger.debug("Building RTSP URL for %s", camera.name)
         logger.debug("Username: %s, Password available: %s", camera.username, password is not None)
@@ -402,7 +402,7 @@ class CameraService:
         password = None
         if camera.password_enc:
             try:
-                password = decrypt(camera.password_enc)
+                password = decrypt_cached(camera.password_enc)
             except Exception as exc:
                 return False, f"Failed to decode camera credentials: {exc}"
 
@@ -485,7 +485,7 @@ class CameraService:
             # Decode password if encrypted
             password = None
             if camera.password_enc:
-                password = decrypt(camera.password_enc)
+                password = decrypt_cached(camera.password_enc)
 
             # Parse URL and strip embedded credentials if present (always use camera username/password fields)
             parsed_url = urlparse(camera.snapshot_url)
@@ -7,21 +7,27 @@ References:
 """
 
 import asyncio
+import itertools
 import re
 import signal
 import time
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, Tuple
 from enum import Enum
 import logging
-from utils.time_utils import utcnow
 
 from .hardware_detector import get_hardware_capabilities, HardwareCapabilities
 
 logger = logging.getLogger(__name__)
 
+# Temporary ids for replacement streams start above any database id
+HANDOFF_ID_START = 2 ** 31
+
+# How long a handoff waits for the replacement's first encoded frame (seconds)
+FIRST_FRAME_TIMEOUT = 5.0
+
 
 class StreamStatus(str, Enum):
     """Stream status states"""
@@ -110,10 +116,12 @@ class StreamProcess:
     metrics: StreamMetrics = field(default_factory=StreamMetrics)
     retry_count: int = 0
     started_at: Optional[datetime] = None
+    started_monotonic: Optional[float] = None  # For uptime math (immune to clock jumps)
     last_error: Optional[str] = None
     command: List[str] = field(default_factory=list)
     should_auto_restart: bool = True  # Set to False when manually stopped
     output_urls: List[str] = field(default_factory=list)  # Track destination URLs
+    first_frame: asyncio.Event = field(default_factory=asyncio.Event)  # Set on the first progress line
 
 
 class FFmpegProcessManager:
@@ -137,13 +145,18 @@ class FFmpegProcessManager:
         self._on_stream_died_callbacks: Dict[int, Callable] = {}
         # Lock to protect concurrent access to processes dict
         self._lock = asyncio.Lock()
+        # Overlay filter graphs reused across camera switches of the same timeline run
+        # (id(overlays), resolution, codec, timed, duration, loop) -> (overlays, (filter_complex, out_label))
+        self._filter_cache: Dict[tuple, tuple] = {}
+        # Unique temporary ids for seamless-handoff replacements
+        self._handoff_ids = itertools.count(HANDOFF_ID_START)
     
     async def initialize(self):
         """Initialize the manager and detect hardware"""
         logger.info("Initializing FFmpeg Process Manager...")
         self.hw_capabilities = await get_hardware_capabilities()
-        logger.info(f"Hardware capabilities: {self.hw_capabilities.encoder} "
-                   f"(max {self.hw_capabilities.max_concurrent_streams} streams)")
+        logger.info("Hardware capabilities: %s (max %s streams)",
+                    self.hw_capabilities.encoder, self.hw_capabilities.max_concurrent_streams)
     
     async def start_stream(
         self,
@@ -154,7 +167,8 @@ class FFmpegProcessManager:
         overlay_images: Optional[List[Dict]] = None,
         timed_overlays: Optional[List[Dict]] = None,
         timeline_duration: float = 0,
-        timeline_loop: bool = False
+        timeline_loop: bool = False,
+        replace: bool = False
     ) -> StreamProcess:
         """
         Start a new FFmpeg stream process.
@@ -168,6 +182,9 @@ class FFmpegProcessManager:
             timed_overlays: Optional list of time-based overlays with {path, x, y, opacity, start_time, end_time}
             timeline_duration: Total timeline duration in seconds (for looping mod() calculation)
             timeline_loop: Whether timeline loops (affects enable expression)
+            replace: If stream_id is already running, start the new process
+                alongside it and atomically take over stream_id once it is up
+                (seamless handoff), then stop the old process
         
         Returns:
             StreamProcess representing the running stream
@@ -175,6 +192,14 @@ class FFmpegProcessManager:
         Raises:
             RuntimeError: If stream is already running or too many streams active
         """
+        if replace:
+            current = self.processes.get(stream_id)
+            if current is not None and current.status == StreamStatus.RUNNING:
+                return await self._replace_stream(
+                    stream_id, input_url, output_urls, profile, overlay_images,
+                    timed_overlays, timeline_duration, timeline_loop
+                )
+
         async with self._lock:
             # Check if already running
             if stream_id in self.processes and self.processes[stream_id].status == StreamStatus.RUNNING:
@@ -191,11 +216,11 @@ class FFmpegProcessManager:
             if profile is None:
                 profile = EncodingProfile.reliability_profile(self.hw_capabilities)
 
-            logger.info(f"Starting stream {stream_id} with {len(output_urls)} destinations")
+            logger.info("Starting stream %s with %s destinations", stream_id, len(output_urls))
             if overlay_images:
-                logger.info(f"  🎨 With {len(overlay_images)} static overlay(s)")
+                logger.info("  🎨 With %s static overlay(s)", len(overlay_images))
             if timed_overlays:
-                logger.info(f"  🎨 With {len(timed_overlays)} timed overlay(s) (dynamic switching enabled)")
+                logger.info("  🎨 With %s timed overlay(s) (dynamic switching enabled)", len(timed_overlays))
             logger.debug("FFmpeg start_stream called: stream_id=%s, timed_overlays=%d, duration=%s, loop=%s",
                          stream_id, len(timed_overlays) if timed_overlays else 0, timeline_duration, timeline_loop)
 
@@ -226,22 +251,119 @@ class FFmpegProcessManager:
 
                 stream_process.process = process
                 stream_process.status = StreamStatus.RUNNING
+                stream_process.started_monotonic = time.monotonic()
                 self.processes[stream_id] = stream_process
 
                 # Start monitoring task
                 monitor_task = asyncio.create_task(self._monitor_process(stream_id))
                 self._monitoring_tasks[stream_id] = monitor_task
 
-                logger.info(f"Stream {stream_id} started successfully (PID: {process.pid})")
+                logger.info("Stream %s started successfully (PID: %s)", stream_id, process.pid)
 
                 return stream_process
 
             except Exception as e:
                 stream_process.status = StreamStatus.ERROR
                 stream_process.last_error = str(e)
-                logger.error(f"Failed to start stream {stream_id}: {e}")
+                logger.error("Failed to start stream %s: %s", stream_id, e)
                 raise
     
+    async def _replace_stream(
+        self,
+        stream_id: int,
+        input_url: str,
+        output_urls: List[str],
+        profile: Optional[EncodingProfile],
+        overlay_images: Optional[List[Dict]],
+        timed_overlays: Optional[List[Dict]],
+        timeline_duration: float,
+        timeline_loop: bool
+    ) -> StreamProcess:
+        """
+        Start a replacement for a running stream and hand stream_id over to it.
+
+        The new process runs under a temporary id until it reports its first
+        encoded frame (or FIRST_FRAME_TIMEOUT passes), so the old stream keeps
+        feeding viewers until the replacement is actually producing output. The
+        processes/_monitoring_tasks entries are then swapped under the lock, so
+        no monitor or lookup ever sees a half-remapped stream. The old monitor
+        is cancelled before the old process is stopped, so its exit never fires
+        the stream-died callback that now belongs to the new process.
+        """
+        temp_id = next(self._handoff_ids)
+        try:
+            new_process = await self.start_stream(
+                temp_id, input_url, output_urls, profile, overlay_images,
+                timed_overlays=timed_overlays,
+                timeline_duration=timeline_duration,
+                timeline_loop=timeline_loop
+            )
+            # A replacement that dies during the handoff is abandoned, not restarted
+            new_process.should_auto_restart = False
+            if not await self.wait_for_first_frame(temp_id, timeout=FIRST_FRAME_TIMEOUT):
+                process = new_process.process
+                if process is None or process.returncode is not None:
+                    raise RuntimeError(f"Replacement for stream {stream_id} exited before producing a frame")
+                logger.warning("No frame from replacement for stream %s within %ss - swapping anyway",
+                               stream_id, FIRST_FRAME_TIMEOUT)
+        except BaseException:
+            if temp_id in self.processes:
+                try:
+                    await asyncio.shield(self.stop_stream(temp_id, graceful=False))
+                except Exception:
+                    pass
+                self.processes.pop(temp_id, None)
+            raise
+
+        async with self._lock:
+            old_process = self.processes.get(stream_id)
+            old_monitor = self._monitoring_tasks.pop(stream_id, None)
+            self.processes.pop(temp_id, None)
+            new_process.stream_id = stream_id
+            new_process.should_auto_restart = True
+            self.processes[stream_id] = new_process
+            monitor_task = self._monitoring_tasks.pop(temp_id, None)
+            if monitor_task is not None:
+                self._monitoring_tasks[stream_id] = monitor_task
+        logger.info("Stream %s handed over to new process (PID: %s)", stream_id, new_process.process.pid)
+
+        if old_process is not None:
+            old_process.should_auto_restart = False
+            if old_monitor is not None:
+                old_monitor.cancel()
+                await asyncio.wait({old_monitor}, timeout=5.0)
+            if old_process.process:
+                await asyncio.shield(self._graceful_shutdown(old_process.process))
+            old_process.process = None
+            old_process.status = StreamStatus.STOPPED
+
+        return new_process
+
+    async def wait_for_first_frame(self, stream_id: int, timeout: float) -> bool:
+        """
+        Wait until a stream's FFmpeg reports its first encoded frame.
+        
+        Returns:
+            True once a frame= progress line has been seen, False on timeout
+            or if the stream exits first
+        """
+        stream_process = self.processes.get(stream_id)
+        if stream_process is None:
+            return False
+        if stream_process.first_frame.is_set():
+            return True
+
+        ready = asyncio.ensure_future(stream_process.first_frame.wait())
+        waiters = {ready}
+        if stream_process.process is not None:
+            waiters.add(asyncio.ensure_future(stream_process.process.wait()))
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return stream_process.first_frame.is_set()
+
     async def stop_stream(self, stream_id: int, graceful: bool = True) -> None:
         """
         Stop a running stream process.
@@ -260,10 +382,10 @@ class FFmpegProcessManager:
             stream_process = self.processes[stream_id]
 
             if stream_process.status == StreamStatus.STOPPED:
-                logger.info(f"Stream {stream_id} is already stopped")
+                logger.info("Stream %s is already stopped", stream_id)
                 return
 
-            logger.info(f"Stopping stream {stream_id}...")
+            logger.info("Stopping stream %s...", stream_id)
 
             # Disable auto-restart before stopping
             stream_process.should_auto_restart = False
@@ -276,7 +398,7 @@ class FFmpegProcessManager:
                 except Exception:
                     pass
                 if not self._monitoring_tasks[stream_id].done():
-                    logger.warning(f"Monitoring task for stream {stream_id} did not cancel within 5s — proceeding anyway")
+                    logger.warning("Monitoring task for stream %s did not cancel within 5s — proceeding anyway", stream_id)
                 self._monitoring_tasks.pop(stream_id, None)
 
             # Stop the process
@@ -285,7 +407,7 @@ class FFmpegProcessManager:
 
             stream_process.process = None  # Release process object for GC
             stream_process.status = StreamStatus.STOPPED
-            logger.info(f"Stream {stream_id} stopped")
+            logger.info("Stream %s stopped", stream_id)
     
     async def restart_stream(self, stream_id: int) -> StreamProcess:
         """
@@ -308,7 +430,7 @@ class FFmpegProcessManager:
 
             # Check max retries (10 per spec)
             if stream_process.retry_count > 10:
-                logger.error(f"Stream {stream_id} exceeded max retries (10)")
+                logger.error("Stream %s exceeded max retries (10)", stream_id)
                 stream_process.status = StreamStatus.ERROR
                 stream_process.last_error = "Max retries exceeded"
                 raise RuntimeError("Max retries exceeded")
@@ -316,7 +438,7 @@ class FFmpegProcessManager:
             # Calculate backoff: 2s, 4s, 8s, 16s, 32s, 60s (max)
             wait_time = min(2 ** stream_process.retry_count, 60)
 
-            logger.info(f"Restarting stream {stream_id} in {wait_time}s (attempt {stream_process.retry_count}/10)")
+            logger.info("Restarting stream %s in %ss (attempt %s/10)", stream_id, wait_time, stream_process.retry_count)
             stream_process.status = StreamStatus.RESTARTING
 
             await asyncio.sleep(wait_time)
@@ -336,19 +458,21 @@ class FFmpegProcessManager:
                 stream_process.process = process
                 stream_process.status = StreamStatus.RUNNING
                 stream_process.started_at = datetime.now(timezone.utc)
+                stream_process.started_monotonic = time.monotonic()
+                stream_process.first_frame.clear()
 
                 # Restart monitoring
                 monitor_task = asyncio.create_task(self._monitor_process(stream_id))
                 self._monitoring_tasks[stream_id] = monitor_task
 
-                logger.info(f"Stream {stream_id} restarted successfully")
+                logger.info("Stream %s restarted successfully", stream_id)
 
                 return stream_process
 
             except Exception as e:
                 stream_process.status = StreamStatus.ERROR
                 stream_process.last_error = str(e)
-                logger.error(f"Failed to restart stream {stream_id}: {e}")
+                logger.error("Failed to restart stream %s: %s", stream_id, e)
                 raise
     
     async def get_stream_status(self, stream_id: int) -> Optional[StreamProcess]:
@@ -368,7 +492,7 @@ class FFmpegProcessManager:
             callback: Async callable that takes (stream_id: int, error_msg: str)
         """
         self._on_stream_died_callbacks[stream_id] = callback
-        logger.debug(f"Registered stream died callback for stream {stream_id}")
+        logger.debug("Registered stream died callback for stream %s", stream_id)
     
     def unregister_stream_died_callback(self, stream_id: int):
         """Remove the stream died callback for a stream"""
@@ -392,6 +516,115 @@ class FFmpegProcessManager:
     
     # Private methods
     
+    def _overlay_filter_graph(
+        self,
+        overlays_to_add: List[Dict],
+        profile: EncodingProfile,
+        use_timed: bool,
+        timeline_duration: float,
+        timeline_loop: bool
+    ) -> Tuple[str, str]:
+        """
+        Build the overlay filter_complex and its output label.
+
+        A timeline passes the same prefetched overlay list on every camera
+        switch, so the graph is built once per run and reused; the cache holds
+        the list itself and matches it by identity.
+        """
+        key = (id(overlays_to_add), profile.resolution, profile.codec, use_timed,
+               timeline_duration, timeline_loop)
+        cached = self._filter_cache.get(key)
+        if cached is not None and cached[0] is overlays_to_add:
+            return cached[1]
+
+        resolution_str = f"{profile.resolution[0]}x{profile.resolution[1]}"
+        filter_parts = []
+
+        # Start with base video scaled to output resolution
+        filter_parts.append(f"[0:v]scale={resolution_str}[base]")
+        
+        # Layer each overlay on top
+        current_label = "base"
+        for idx, overlay in enumerate(overlays_to_add):
+            next_label = f"tmp{idx}" if idx < len(overlays_to_add) - 1 else "out"
+            # Prefer normalized 0-1 coords (converted to output resolution pixels)
+            if 'norm_x' in overlay:
+                x = int(overlay['norm_x'] * profile.resolution[0])
+                y = int(overlay['norm_y'] * profile.resolution[1])
+            else:
+                x = int(overlay.get('x', 0))
+                y = int(overlay.get('y', 0))
+            opacity = overlay.get('opacity', 1.0)
+            width = overlay.get('width')
+            height = overlay.get('height')
+
+            # Scale dimensions from source (timeline) resolution to output resolution
+            src_res = overlay.get('source_resolution')
+            if src_res and (width or height):
+                scale_w = profile.resolution[0] / src_res[0]
+                scale_h = profile.resolution[1] / src_res[1]
+                if width:
+                    width = int(width * scale_w)
+                if height:
+                    height = int(height * scale_h)
+
+            # Scale overlay if dimensions specified
+            overlay_input = f"[{idx+1}:v]"
+            if width or height:
+                # Build scale filter (width:height, -1 means maintain aspect ratio)
+                w = width if width else -1
+                h = height if height else -1
+                scaled_label = f"scaled{idx}"
+                filter_parts.append(f"{overlay_input}scale={w}:{h}[{scaled_label}]")
+                overlay_input = f"[{scaled_label}]"
+            
+            # Overlay filter with positioning
+            overlay_filter = f"[{current_label}]{overlay_input}overlay=x={x}:y={y}"
+            
+            if opacity < 1.0:
+                overlay_filter += f":alpha={opacity}"
+            
+            # Add time-based enable expression for timed overlays
+            if use_timed:
+                # One overlay may cover several disjoint intervals (cues sharing an asset)
+                intervals = overlay.get('intervals') or [
+                    (overlay.get('start_time', 0), overlay.get('end_time', 999999))
+                ]
+                
+                # For looping timelines, use mod() to wrap time
+                if timeline_loop and timeline_duration > 0:
+                    # FFmpeg filter expressions need escaped commas
+                    t_expr = f"mod(t\\,{timeline_duration})"
+                else:
+                    t_expr = "t"
+                enable_expr = "+".join(
+                    f"between({t_expr}\\,{start_time}\\,{end_time})" for start_time, end_time in intervals
+                )
+                
+                overlay_filter += f":enable='{enable_expr}'"
+                logger.debug("Overlay %s: enable='%s' (%s)", idx, enable_expr, overlay.get('asset_name', 'unknown'))
+            
+            overlay_filter += f"[{next_label}]"
+            
+            filter_parts.append(overlay_filter)
+            current_label = next_label
+        
+        # VAAPI needs pixel format conversion + GPU upload after CPU-side compositing
+        if profile.codec == 'h264_vaapi':
+            filter_parts.append("[out]format=nv12,hwupload[vout]")
+            out_label = "[vout]"
+        else:
+            out_label = "[out]"
+
+        filter_complex = ";".join(filter_parts)
+        logger.debug("FFmpeg filter_complex built: num_overlays=%d, loop=%s, duration=%s",
+                     len(overlays_to_add), timeline_loop, timeline_duration)
+        result = (filter_complex, out_label)
+        if len(self._filter_cache) >= 16:
+            self._filter_cache.clear()
+        self._filter_cache[key] = (overlays_to_add, result)
+        return result
+
     def _build_ffmpeg_command(
         self,
         input_url: str,
@@ -445,84 +678,10 @@ class FFmpegProcessManager:
         # Video encoding options
         resolution_str = f"{profile.resolution[0]}x{profile.resolution[1]}"
         
-        # Build filter complex for overlays
-        filter_parts = []
-        
         if overlays_to_add:
-            # Start with base video scaled to output resolution
-            filter_parts.append(f"[0:v]scale={resolution_str}[base]")
-            
-            # Layer each overlay on top
-            current_label = "base"
-            for idx, overlay in enumerate(overlays_to_add):
-                next_label = f"tmp{idx}" if idx < len(overlays_to_add) - 1 else "out"
-                # Prefer normalized 0-1 coords (converted to output resolution pixels)
-                if 'norm_x' in overlay:
-                    x = int(overlay['norm_x'] * profile.resolution[0])
-                    y = int(overlay['norm_y'] * profile.resolution[1])
-                else:
-                    x = int(overlay.get('x', 0))
-                    y = int(overlay.get('y', 0))
-                opacity = overlay.get('opacity', 1.0)
-                width = overlay.get('width')
-                height = overlay.get('height')
-
-                # Scale dimensions from source (timeline) resolution to output resolution
-                src_res = overlay.get('source_resolution')
-                if src_res and (width or height):
-                    scale_w = profile.resolution[0] / src_res[0]
-                    scale_h = profile.resolution[1] / src_res[1]
-                    if width:
-                        width = int(width * scale_w)
-                    if height:
-                        height = int(height * scale_h)
-
-                # Scale overlay if dimensions specified
-                overlay_input = f"[{idx+1}:v]"
-                if width or height:
-                    # Build scale filter (width:height, -1 means maintain aspect ratio)
-                    w = width if width else -1
-                    h = height if height else -1
-                    scaled_label = f"scaled{idx}"
-                    filter_parts.append(f"{overlay_input}scale={w}:{h}[{scaled_label}]")
-                    overlay_input = f"[{scaled_label}]"
-                
-                # Overlay filter with positioning
-                overlay_filter = f"[{current_label}]{overlay_input}overlay=x={x}:y={y}"
-                
-                if opacity < 1.0:
-                    overlay_filter += f":alpha={opacity}"
-                
-                # Add time-based enable expression for timed overlays
-                if use_timed:
-                    start_time = overlay.get('start_time', 0)
-                    end_time = overlay.get('end_time', 999999)
-                    
-                    # For looping timelines, use mod() to wrap time
-                    if timeline_loop and timeline_duration > 0:
-                        # FFmpeg filter expressions need escaped commas
-                        enable_expr = f"between(mod(t\\,{timeline_duration})\\,{start_time}\\,{end_time})"
-                    else:
-                        enable_expr = f"between(t\\,{start_time}\\,{end_time})"
-                    
-                    overlay_filter += f":enable='{enable_expr}'"
-                    logger.debug(f"Overlay {idx}: enable='{enable_expr}' ({overlay.get('asset_name', 'unknown')})")
-                
-                overlay_filter += f"[{next_label}]"
-                
-                filter_parts.append(overlay_filter)
-                current_label = next_label
-            
-            # VAAPI needs pixel format conversion + GPU upload after CPU-side compositing
-            if profile.codec == 'h264_vaapi':
-                filter_parts.append("[out]format=nv12,hwupload[vout]")
-                out_label = "[vout]"
-            else:
-                out_label = "[out]"
-
-            filter_complex = ";".join(filter_parts)
-            logger.debug("FFmpeg filter_complex built: num_overlays=%d, loop=%s, duration=%s",
-                         len(overlays_to_add), timeline_loop, timeline_duration)
+            filter_complex, out_label = self._overlay_filter_graph(
+                overlays_to_add, profile, bool(use_timed), timeline_duration, timeline_loop
+            )
             cmd.extend(['-filter_complex', filter_complex, '-map', out_label])
         else:
             # No overlays, just scale video
@@ -621,10 +780,10 @@ class FFmpegProcessManager:
         process = stream_process.process
         
         if not process or not process.stderr:
-            logger.error(f"No process stderr for stream {stream_id}")
+            logger.error("No process stderr for stream %s", stream_id)
             return
         
-        logger.info(f"Started monitoring stream {stream_id}")
+        logger.info("Started monitoring stream %s", stream_id)
         
         # Keep last 20 lines of FFmpeg output for error diagnosis
         last_output_lines = []
@@ -657,21 +816,22 @@ class FFmpegProcessManager:
                         pass
                     
                     # Process ended
+                    stream_id = stream_process.stream_id
                     returncode = await process.wait()
-                    logger.warning(f"Stream {stream_id} process ended (exit code: {returncode})")
+                    logger.warning("Stream %s process ended (exit code: %s)", stream_id, returncode)
                     
                     # Log the last output lines to help diagnose the issue
                     if last_output_lines:
-                        logger.error(f"Last FFmpeg output before stream {stream_id} died:")
+                        logger.error("Last FFmpeg output before stream %s died:", stream_id)
                         for i, log_line in enumerate(last_output_lines[-20:], 1):  # Last 20 lines
-                            logger.error(f"  [{i}] {log_line}")
+                            logger.error("  [%s] %s", i, log_line)
                     
                     # Check for specific error patterns in the last output
                     error_found = False
                     for line in last_output_lines[-20:]:
                         for pattern in error_patterns:
                             if pattern in line:
-                                logger.error(f"⚠️  Error pattern detected in FFmpeg output: '{pattern}' in: {line[:200]}")
+                                logger.error("⚠️  Error pattern detected in FFmpeg output: '%s' in: %s", pattern, line[:200])
                                 error_found = True
                                 break
                         if error_found:
@@ -691,10 +851,10 @@ class FFmpegProcessManager:
                     if stream_id in self._on_stream_died_callbacks:
                         try:
                             callback = self._on_stream_died_callbacks[stream_id]
-                            logger.info(f"Invoking stream died callback for stream {stream_id}")
+                            logger.info("Invoking stream died callback for stream %s", stream_id)
                             asyncio.create_task(callback(stream_id, error_msg))
                         except Exception as e:
-                            logger.error(f"Error invoking stream died callback: {e}")
+                            logger.error("Error invoking stream died callback: %s", e)
                     
                     # Check if stream should auto-restart by checking database status
                     should_restart = stream_process.should_auto_restart
@@ -706,26 +866,27 @@ class FFmpegProcessManager:
                         try:
                             db_stream = db.query(Stream).filter(Stream.id == stream_id).first()
                             if db_stream and db_stream.status == 'stopped':
-                                logger.info(f"Stream {stream_id} is marked as stopped in database, not restarting")
+                                logger.info("Stream %s is marked as stopped in database, not restarting", stream_id)
                                 should_restart = False
                         finally:
                             db.close()
                     except Exception as e:
-                        logger.error(f"Failed to check database status for stream {stream_id}: {e}")
+                        logger.error("Failed to check database status for stream %s: %s", stream_id, e)
                     
                     # Only attempt restart if auto-restart is enabled AND database allows it
                     if should_restart:
-                        logger.info(f"Auto-restart enabled for stream {stream_id}, attempting restart...")
+                        logger.info("Auto-restart enabled for stream %s, attempting restart...", stream_id)
                         try:
                             await self.restart_stream(stream_id)
                         except Exception as e:
-                            logger.error(f"Failed to restart stream {stream_id}: {e}")
+                            logger.error("Failed to restart stream %s: %s", stream_id, e)
                     else:
-                        logger.info(f"Auto-restart disabled for stream {stream_id}, not restarting")
+                        logger.info("Auto-restart disabled for stream %s, not restarting", stream_id)
                     
                     break
                 
                 # Parse output line
+                stream_id = stream_process.stream_id  # Follows a replace handoff
                 line_str = line.decode('utf-8', errors='ignore').strip()
                 
                 # Keep last 20 lines for error diagnosis
@@ -735,16 +896,19 @@ class FFmpegProcessManager:
                 
                 # Log errors and warnings immediately for visibility
                 if any(pattern in line_str for pattern in error_patterns):
-                    logger.warning(f"⚠️  FFmpeg [stream {stream_id}]: {line_str}")
+                    logger.warning("⚠️  FFmpeg [stream %s]: %s", stream_id, line_str)
                 
+                if not stream_process.first_frame.is_set() and 'frame=' in line_str:
+                    stream_process.first_frame.set()
+
                 # Update metrics from FFmpeg output
                 self._parse_ffmpeg_output(stream_id, line_str)
                 
         except asyncio.CancelledError:
-            logger.info(f"Monitoring cancelled for stream {stream_id}")
+            logger.info("Monitoring cancelled for stream %s", stream_id)
             raise
         except Exception as e:
-            logger.error(f"Error monitoring stream {stream_id}: {e}")
+            logger.error("Error monitoring stream %s: %s", stream_id, e)
             stream_process.status = StreamStatus.ERROR
             stream_process.last_error = str(e)
     
@@ -786,13 +950,13 @@ class FFmpegProcessManager:
                     metrics.encoding_time_ms = (1000.0 / metrics.framerate_target) / speed
             
             # Calculate uptime
-            if stream_process.started_at:
-                metrics.uptime_seconds = int((utcnow() - stream_process.started_at).total_seconds())
+            if stream_process.started_monotonic is not None:
+                metrics.uptime_seconds = int(time.monotonic() - stream_process.started_monotonic)
             
             metrics.last_update = datetime.now(timezone.utc)
             
         except Exception as e:
-            logger.debug(f"Error parsing FFmpeg output: {e}")
+            logger.debug("Error parsing FFmpeg output: %s", e)
             # Don't fail on parse errors, just continue
     
     async def _graceful_shutdown(self, process: asyncio.subprocess.Process, graceful: bool = True):
@@ -814,24 +978,24 @@ class FFmpegProcessManager:
 
                 try:
                     await asyncio.wait_for(process.wait(), timeout=5.0)
-                    logger.debug(f"Process {process.pid} terminated gracefully")
+                    logger.debug("Process %s terminated gracefully", process.pid)
                     return
                 except asyncio.TimeoutError:
-                    logger.warning(f"Process {process.pid} did not respond to SIGTERM, sending SIGKILL")
+                    logger.warning("Process %s did not respond to SIGTERM, sending SIGKILL", process.pid)
 
             # Force kill
             process.kill()  # SIGKILL
             try:
                 await asyncio.wait_for(process.wait(), timeout=10.0)
-                logger.debug(f"Process {process.pid} killed")
+                logger.debug("Process %s killed", process.pid)
             except asyncio.TimeoutError:
-                logger.error(f"Process {process.pid} did not die after SIGKILL within 10s — giving up")
+                logger.error("Process %s did not die after SIGKILL within 10s — giving up", process.pid)
 
         except ProcessLookupError:
             # Process already dead
             pass
         except Exception as e:
-            logger.error(f"Error shutting down process: {e}")
+            logger.error("Error shutting down process: %s", e)
     
     def find_stream_by_destination_url(self, destination_url: str) -> Optional[int]:
         """
@@ -849,3 +1013,17 @@ class FFmpegProcessManager:
                     return stream_id
         return None
 
+    def get_url_to_stream_map(self) -> Dict[str, int]:
+        """
+        Map every destination URL of a running stream to its stream ID.
+        
+        One pass over the processes, for callers resolving many destinations
+        (find_stream_by_destination_url rescans them on every call).
+        """
+        url_map: Dict[str, int] = {}
+        for stream_id, stream_process in self.processes.items():
+            if stream_process.status == StreamStatus.RUNNING:
+                for url in stream_process.output_urls:
+                    url_map.setdefault(url, stream_id)
+        return url_map
+
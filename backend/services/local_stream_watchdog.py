@@ -13,12 +13,38 @@ This simplified watchdog:
 import asyncio
 import logging
 import psutil
+import time
 import aiohttp
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Shared session for YouTube live checks, so watchdogs reuse keep-alive
+# connections instead of a TCP+TLS handshake per check; see _get_http_session
+_http_session: Optional[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Shared ClientSession for the running event loop (a session cannot cross loops)"""
+    global _http_session
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session[0] is not loop or _http_session[1].closed:
+        _http_session = (loop, aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=75, ttl_dns_cache=300),
+            # Every check stays cookieless, as with a fresh session per check
+            cookie_jar=aiohttp.DummyCookieJar(),
+        ))
+    return _http_session[1]
+
+
+async def aclose():
+    """Close the shared HTTP session (called on application shutdown)"""
+    global _http_session
+    if _http_session is not None:
+        await _http_session[1].close()
+        _http_session = None
+
 
 class StreamHealthState:
     """Track stream health state over time"""
@@ -35,11 +61,13 @@ class StreamHealthState:
         self.last_healthy_time: Optional[datetime] = None
         self.last_recovery_time: Optional[datetime] = None
         self.recovery_count = 0
+        self.version = 0  # Bumped on every state change; keys status snapshots
     
     def mark_healthy(self):
         """Mark stream as healthy"""
         self.consecutive_unhealthy = 0
         self.last_healthy_time = datetime.now(timezone.utc)
+        self.version += 1
     
     def mark_unhealthy(self) -> bool:
         """
@@ -49,6 +77,7 @@ class StreamHealthState:
             True if threshold reached and recovery should be triggered
         """
         self.consecutive_unhealthy += 1
+        self.version += 1
         return self.consecutive_unhealthy >= self.unhealthy_threshold
     
     def mark_recovery(self):
@@ -56,6 +85,12 @@ class StreamHealthState:
         self.last_recovery_time = datetime.now(timezone.utc)
         self.recovery_count += 1
         self.consecutive_unhealthy = 0
+        self.version += 1
+
+    def reset_unhealthy(self):
+        """Clear the consecutive unhealthy counter"""
+        self.consecutive_unhealthy = 0
+        self.version += 1
     
     def should_allow_recovery(self, cooldown_seconds: int = 120) -> bool:
         """
@@ -108,6 +143,7 @@ class LocalStreamWatchdog:
         self.health_state = StreamHealthState(unhealthy_threshold=3)
         self.running = False
         self._suppress_until: Optional[datetime] = None
+        self._status_cache: Optional[tuple] = None  # (health_state.version, status dict)
 
         self.logger = logging.getLogger(f'watchdog.dest{destination_id}')
 
@@ -117,7 +153,7 @@ class LocalStreamWatchdog:
         Also resets the consecutive unhealthy counter to prevent stale state.
         """
         self._suppress_until = datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)
-        self.health_state.consecutive_unhealthy = 0
+        self.health_state.reset_unhealthy()
         self.logger.info(f"Health checks suppressed for {duration_seconds}s (intentional restart)")
     
     async def start(self):
@@ -168,12 +204,12 @@ class LocalStreamWatchdog:
             # Get the timeline executor instance
             executor = get_timeline_executor()
             
-            # Check if the timeline has an FFmpeg manager
-            if self.stream_id not in executor.ffmpeg_managers:
-                self.logger.warning(f"Stream {self.stream_id} has no FFmpeg manager (timeline may have stopped)")
+            # Check if the timeline is still running
+            if self.stream_id not in executor.active_timelines:
+                self.logger.warning(f"Stream {self.stream_id} has no running timeline (timeline may have stopped)")
                 is_healthy = False
             else:
-                ffmpeg_manager = executor.ffmpeg_managers[self.stream_id]
+                ffmpeg_manager = executor.ffmpeg_manager
                 
                 # Check if stream exists in the manager's processes
                 if self.stream_id not in ffmpeg_manager.processes:
@@ -238,9 +274,10 @@ class LocalStreamWatchdog:
             # Check timeline progress (detect stalled timeline even if FFmpeg is healthy)
             if is_healthy:
                 stall_threshold = 300  # 5 minutes without segment progress
-                if self.stream_id in executor._last_segment_time:
-                    last_progress = executor._last_segment_time[self.stream_id]
-                    stall_duration = (datetime.now(timezone.utc) - last_progress).total_seconds()
+                state = executor.state.get(self.stream_id)
+                if state is not None:
+                    last_progress = state.last_segment
+                    stall_duration = time.monotonic() - last_progress
                     if stall_duration > stall_threshold:
                         self.logger.warning(
                             f"Timeline {self.stream_id} appears stalled - no segment progress for {stall_duration:.0f}s "
@@ -286,67 +323,66 @@ class LocalStreamWatchdog:
             True if stream appears to be live, False otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.youtube_channel_live_url,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                    allow_redirects=True,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    }
-                ) as response:
-                    final_url = str(response.url)
-                    text = await response.text()
-                    
-                    # Offline indicators - these mean stream is NOT live
-                    offline_indicators = [
-                        '"isLive":false',
-                        'This video is unavailable',
-                        'This live stream recording is not available',
-                        'Video unavailable',
-                        '"playabilityStatus":{"status":"LIVE_STREAM_OFFLINE"',
-                        '"playabilityStatus":{"status":"ERROR"',
-                        'This video has been removed',
-                        'This video is private',
-                        'Scheduled for',
-                        '"status":"LIVE_STREAM_OFFLINE"',
-                        '"status":"ERROR"',
-                        'is offline',
-                        'stream has ended',
-                        'Stream offline',
+            async with _get_http_session().get(
+                self.youtube_channel_live_url,
+                timeout=aiohttp.ClientTimeout(total=15),
+                allow_redirects=True,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                }
+            ) as response:
+                final_url = str(response.url)
+                text = await response.text()
+                
+                # Offline indicators - these mean stream is NOT live
+                offline_indicators = [
+                    '"isLive":false',
+                    'This video is unavailable',
+                    'This live stream recording is not available',
+                    'Video unavailable',
+                    '"playabilityStatus":{"status":"LIVE_STREAM_OFFLINE"',
+                    '"playabilityStatus":{"status":"ERROR"',
+                    'This video has been removed',
+                    'This video is private',
+                    'Scheduled for',
+                    '"status":"LIVE_STREAM_OFFLINE"',
+                    '"status":"ERROR"',
+                    'is offline',
+                    'stream has ended',
+                    'Stream offline',
+                ]
+                
+                # Check for offline indicators first (higher priority)
+                is_offline = any(indicator.lower() in text.lower() for indicator in offline_indicators)
+                if is_offline:
+                    self.logger.warning(f"YouTube shows stream as OFFLINE (found offline indicator)")
+                    return False
+                
+                # Check if we're on a valid video page
+                if '/live' in final_url or '/watch?v=' in final_url:
+                    # Look for common indicators that stream is live
+                    live_indicators = [
+                        '"isLive":true',
+                        '"isLiveContent":true',
+                        'watching now',
+                        'Started streaming',
+                        '"isLiveNow":true',
                     ]
                     
-                    # Check for offline indicators first (higher priority)
-                    is_offline = any(indicator.lower() in text.lower() for indicator in offline_indicators)
-                    if is_offline:
-                        self.logger.warning(f"YouTube shows stream as OFFLINE (found offline indicator)")
-                        return False
+                    is_live = any(indicator in text for indicator in live_indicators)
                     
-                    # Check if we're on a valid video page
-                    if '/live' in final_url or '/watch?v=' in final_url:
-                        # Look for common indicators that stream is live
-                        live_indicators = [
-                            '"isLive":true',
-                            '"isLiveContent":true',
-                            'watching now',
-                            'Started streaming',
-                            '"isLiveNow":true',
-                        ]
-                        
-                        is_live = any(indicator in text for indicator in live_indicators)
-                        
-                        if is_live:
-                            self.logger.debug(f"YouTube live check: Stream is LIVE")
-                            return True
-                        else:
-                            self.logger.warning(f"YouTube live check: No live indicators found - stream may be OFFLINE")
-                            return False
+                    if is_live:
+                        self.logger.debug(f"YouTube live check: Stream is LIVE")
+                        return True
                     else:
-                        self.logger.warning(
-                            f"YouTube live check: Redirected to {final_url} (stream offline)"
-                        )
+                        self.logger.warning(f"YouTube live check: No live indicators found - stream may be OFFLINE")
                         return False
-                        
+                else:
+                    self.logger.warning(
+                        f"YouTube live check: Redirected to {final_url} (stream offline)"
+                    )
+                    return False
+                    
         except asyncio.TimeoutError:
             self.logger.warning("YouTube live check timed out")
             # Don't mark as unhealthy on timeout - might be network issue
@@ -380,12 +416,12 @@ class LocalStreamWatchdog:
 
             executor = get_timeline_executor()
 
-            # Check if the timeline has an FFmpeg manager
-            if self.stream_id not in executor.ffmpeg_managers:
-                self.logger.error(f"Stream {self.stream_id} has no FFmpeg manager - cannot recover")
+            # Check if the timeline is still running
+            if self.stream_id not in executor.active_timelines:
+                self.logger.error(f"Stream {self.stream_id} has no running timeline - cannot recover")
                 return
 
-            ffmpeg_manager = executor.ffmpeg_managers[self.stream_id]
+            ffmpeg_manager = executor.ffmpeg_manager
 
             # Stop the stream if it's running
             if self.stream_id in ffmpeg_manager.processes:
@@ -414,6 +450,28 @@ class LocalStreamWatchdog:
         except Exception as e:
             self.logger.error(f"Failed to recover stream: {e}", exc_info=True)
     
+    def status(self) -> dict:
+        """
+        Serialized health status, rebuilt only after the health state changes.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        health_state = self.health_state
+        cached = self._status_cache
+        if cached is not None and cached[0] == health_state.version:
+            return cached[1]
+
+        status = {
+            "running": True,
+            "consecutive_unhealthy": health_state.consecutive_unhealthy,
+            "last_healthy_time": health_state.last_healthy_time.isoformat() if health_state.last_healthy_time else None,
+            "last_recovery_time": health_state.last_recovery_time.isoformat() if health_state.last_recovery_time else None,
+            "recovery_count": health_state.recovery_count,
+            "check_interval": self.check_interval
+        }
+        self._status_cache = (health_state.version, status)
+        return status
+
     def stop(self):
         """Stop the watchdog service"""
         self.logger.info("Stopping watchdog service...")
@@ -7,7 +7,7 @@ import logging
 import os
 import platform
 from functools import partial
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
 # Lazy import ONVIF to avoid startup issues
@@ -26,6 +26,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on waiting for a preset move to finish, and GetStatus poll rate
+SETTLE_TIMEOUT = 2.0
+SETTLE_POLL_INTERVAL = 0.1
+
 
 def _env_flag(value: Optional[str]) -> bool:
     if value is None:
@@ -56,6 +60,9 @@ class PTZService:
     
     def __init__(self):
         self._camera_connections = {}  # Cache ONVIF connections
+        # (address, port) -> (preset_token, pan, tilt, zoom) of the last completed
+        # move_to_preset; dropped when any other move is issued to the camera
+        self._last_pose: Dict[Tuple[str, int], tuple] = {}
         self._onvif_available = ONVIFCamera is not None
         self._ptz_debug = _env_flag(os.getenv("PTZ_DEBUG"))
         self._device_override = self._parse_override_url(os.getenv("ONVIF_DEVICE_URL"))
@@ -218,6 +225,14 @@ class PTZService:
         resolved_key = f"{resolved_address}:{resolved_port}"
         return self._camera_connections[resolved_key]
 
+    def last_pose(self, address: str, port: int) -> Optional[tuple]:
+        """Pose left by the last successful move_to_preset, if nothing moved the camera since."""
+        return self._last_pose.get((address, port))
+
+    def forget_pose(self, address: str, port: int) -> None:
+        """Drop the recorded pose (call when the camera may have been moved externally)."""
+        self._last_pose.pop((address, port), None)
+
     @staticmethod
     def _build_absolute_position(
         pan: Optional[float],
@@ -253,6 +268,7 @@ class PTZService:
             logger.warning("ONVIF not available, cannot perform continuous move")
             return False
 
+        self.forget_pose(address, port)
         try:
             camera = await self.get_onvif_camera(address, port, username, password)
             loop = asyncio.get_event_loop()
@@ -337,6 +353,7 @@ class PTZService:
         if not position:
             return False
 
+        self.forget_pose(address, port)
         try:
             camera = await self.get_onvif_camera(address, port, username, password)
             loop = asyncio.get_event_loop()
@@ -388,6 +405,8 @@ class PTZService:
             logger.warning("⚠️  ONVIF not available, cannot move to preset")
             return False
             
+        self.forget_pose(address, port)
+        pose = (preset_token, pan, tilt, zoom)
         try:
             masked_user = _mask_secret(username)
             logger.info(
@@ -460,8 +479,9 @@ class PTZService:
                             preset_token,
                         )
                         # Wait for camera to settle after absolute move
-                        await asyncio.sleep(2)
+                        await self._wait_until_stopped(ptz_service, media_profile.token)
                         logger.info("✅ Camera %s moved to preset %s", address, preset_token)
+                        self._last_pose[(address, port)] = pose
                         return True
                     except Exception as exc:
                         logger.error(
@@ -493,9 +513,10 @@ class PTZService:
             await loop.run_in_executor(None, ptz_service.GotoPreset, request)
             
             # Wait for camera to settle after GotoPreset
-            await asyncio.sleep(2)
+            await self._wait_until_stopped(ptz_service, media_profile.token)
             
             logger.info("✅ Camera %s moved to preset %s via GotoPreset", address, preset_token)
+            self._last_pose[(address, port)] = pose
             return True
             
         except ONVIFError as e:
@@ -503,11 +524,49 @@ class PTZService:
             self._debug("ONVIFError context", error_type=type(e).__name__)
             return False
         except Exception as e:
-            logger.error("❌ Error moving to preset: %s", e)
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error moving to preset: %s", e)
             return False
     
+    async def _wait_until_stopped(
+        self,
+        ptz_service,
+        profile_token: str,
+        timeout: float = SETTLE_TIMEOUT,
+        poll_interval: float = SETTLE_POLL_INTERVAL,
+    ) -> None:
+        """
+        Wait for a PTZ move to finish by polling GetStatus.
+
+        Returns as soon as PanTilt and Zoom both report IDLE (an axis the
+        camera doesn't report counts as idle). Cameras that don't report
+        MoveStatus at all, or fail GetStatus, get the full timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        request = ptz_service.create_type('GetStatus')
+        request.ProfileToken = profile_token
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            # Give the move a moment to start before trusting an IDLE report
+            await asyncio.sleep(min(poll_interval, remaining))
+            try:
+                status = await loop.run_in_executor(None, ptz_service.GetStatus, request)
+                move_status = getattr(status, 'MoveStatus', None)
+            except Exception as exc:
+                self._debug("GetStatus failed while settling", error=str(exc))
+                move_status = None
+            pan_tilt = getattr(move_status, 'PanTilt', None)
+            zoom = getattr(move_status, 'Zoom', None)
+            if pan_tilt is None and zoom is None:
+                await asyncio.sleep(max(deadline - loop.time(), 0))
+                return
+            if str(pan_tilt or 'IDLE').upper() == 'IDLE' and str(zoom or 'IDLE').upper() == 'IDLE':
+                self._debug("PTZ settled", elapsed=round(timeout - (deadline - loop.time()), 2))
+                return
+
     async def get_current_position(
         self,
         address: str,
@@ -567,9 +626,7 @@ class PTZService:
             return None
             
         except Exception as e:
-            logger.error("❌ Error getting current position: %s", e)
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error getting current position: %s", e)
             return None
     
     async def set_preset(
@@ -685,9 +742,7 @@ class PTZService:
             return token
 
         except Exception as e:
-            logger.error(f"❌ Error saving preset: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error saving preset: %s", e)
             raise
 
 
@@ -5,7 +5,6 @@ This is the SECRET SAUCE for professional multi-camera streaming!
 
 import asyncio
 import logging
-import tempfile
 import os
 import httpx
 from datetime import datetime, timezone
@@ -18,7 +17,8 @@ from services.ffmpeg_manager import FFmpegProcessManager, EncodingProfile
 from services.ptz_service import get_ptz_service
 from services.rtmp_relay_service import get_rtmp_relay_service
 from utils.google_drive import parse_google_drawing_url
-from utils.crypto import decrypt
+from utils.http_download import stream_to_temp_file
+from utils.crypto import decrypt_cached
 from utils.rtsp import build_rtsp_url
 
 logger = logging.getLogger(__name__)
@@ -390,7 +390,7 @@ class SeamlessTimelineExecutor:
             logger.info(f"   🎯 Moving {camera.name} to '{preset.name}'")
             
             try:
-                password = decrypt(camera.password_enc) if camera.password_enc else None
+                password = decrypt_cached(camera.password_enc) if camera.password_enc else None
                 if password:
                     ptz_service = get_ptz_service()
                     pan = preset.pan if preset.pan is not None else 0.0
@@ -633,12 +633,9 @@ class SeamlessTimelineExecutor:
         try:
             if asset.type == 'api_image' and asset.api_url:
                 async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(asset.api_url)
-                    if response.status_code == 200:
-                        suffix = '.png' if 'png' in response.headers.get('content-type', '') else '.jpg'
-                        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                            tmp.write(response.content)
-                            return tmp.name
+                    path, _ = await stream_to_temp_file(client, asset.api_url)
+                    if path:
+                        return path
             elif asset.type == 'google_drawing' and asset.file_path:
                 # Parse Google Drive Drawing URL and download PNG
                 export_url = parse_google_drawing_url(asset.file_path)
@@ -647,12 +644,10 @@ class SeamlessTimelineExecutor:
                     return None
                 
                 async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                    response = await client.get(export_url)
-                    if response.status_code == 200:
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                            tmp.write(response.content)
-                            logger.info(f"Downloaded Google Drawing PNG for asset '{asset.name}' to {tmp.name}")
-                            return tmp.name
+                    path, response = await stream_to_temp_file(client, export_url, suffix='.png')
+                    if path:
+                        logger.info(f"Downloaded Google Drawing PNG for asset '{asset.name}' to {path}")
+                        return path
                     else:
                         logger.warning(f"Failed to download Google Drawing for asset '{asset.name}': HTTP {response.status_code}")
             elif asset.type in ('static_image', 'canvas_composite') and asset.file_path:
@@ -679,7 +674,7 @@ class SeamlessTimelineExecutor:
         password = None
         if camera.password_enc:
             try:
-                password = decrypt(camera.password_enc)
+                password = decrypt_cached(camera.password_enc)
             except Exception:
                 pass
 
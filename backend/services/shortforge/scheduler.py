@@ -21,7 +21,7 @@ from services.shortforge.headline_generator import generate_headline, fetch_weat
 from services.shortforge.vertical_renderer import render_vertical
 from services.shortforge.publisher import publish_short, refresh_view_counts
 from services.shortforge.moment_detector import get_moment_detector
-from utils.crypto import decrypt
+from utils.crypto import decrypt_cached
 from utils.rtsp import build_rtsp_url
 
 logger = logging.getLogger(__name__)
@@ -119,7 +119,7 @@ class ShortForgeScheduler:
         password = None
         if camera.password_enc:
             try:
-                password = decrypt(camera.password_enc)
+                password = decrypt_cached(camera.password_enc)
             except Exception:
                 pass
         return build_rtsp_url(camera.address, camera.port, camera.username, password, camera.stream_path)
@@ -134,7 +134,7 @@ class ShortForgeScheduler:
             # Decrypt password and substitute if needed
             if camera.password_enc and "password=" in snapshot_url:
                 try:
-                    password = decrypt(camera.password_enc)
+                    password = decrypt_cached(camera.password_enc)
                     # URL might have a placeholder or the encrypted value
                     # The snapshot_url in the DB should already have the correct creds
                 except Exception:
@@ -4,27 +4,107 @@ Based on docs/StreamingPipeline-TechnicalSpec.md Timeline Orchestrator
 """
 
 import asyncio
+import bisect
+import itertools
 import logging
 import time
-import traceback
 import tempfile
 import os
+import shutil
 import httpx
+import numpy as np
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional, Dict, List, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
-from models.database import SessionLocal, Asset
+from models.database import SessionLocal, Asset, get_session
+import models.database as database_models
+import models.destination as destination_models
+import models.timeline as timeline_models
 from models.timeline import Timeline, TimelineCue, TimelineExecution, TimelineTrack
 from models.database import Camera, Preset
 from services.ffmpeg_manager import FFmpegProcessManager, EncodingProfile, StreamStatus
 from services.ptz_service import get_ptz_service
 from utils.google_drive import parse_google_drawing_url
+from utils.http_download import stream_to_temp_file
 from utils.crypto import decrypt
 from utils.rtsp import build_rtsp_url
+from utils.logging_config import bind_logger
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Enable debug logging
+
+# HTTP/2 for overlay downloads needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Asset types whose images change upstream and are refreshed at loop boundaries
+DYNAMIC_ASSET_TYPES = ('api_image', 'google_drawing')
+
+# Fallback freshness window for downloaded overlay images without Cache-Control
+DEFAULT_ASSET_CACHE_TTL = 30.0
+
+# Camera switches begin this early (seconds) so the new stream's RTSP connect and
+# first keyframe land on the cue boundary; refined from measured handoff startups
+DEFAULT_SWITCH_LEAD = 1.5
+MAX_SWITCH_LEAD = 3.0
+
+
+def _cache_ttl(headers: httpx.Headers, default: float = DEFAULT_ASSET_CACHE_TTL) -> float:
+    """Freshness lifetime in seconds from a response's Cache-Control header."""
+    cache_control = headers.get('cache-control', '').lower()
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0.0
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'max-age':
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                break
+    return default
+
+
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Sort intervals and coalesce any that overlap or touch."""
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _cue_target(cue: TimelineCue) -> Tuple[Optional[int], Optional[int]]:
+    """(camera_id, preset_id) of a video cue.
+
+    Read out of the JSON action_params once and memoized on the cue until any
+    cue changes (see models.timeline), since the segment loop asks every segment.
+    """
+    cached = cue.__dict__.get('_target')
+    if cached is not None and cached[0] == timeline_models._cue_generation:
+        return cached[1]
+    params = cue.action_params or {}
+    target = (params.get('camera_id'), params.get('preset_id'))
+    cue.__dict__['_target'] = (timeline_models._cue_generation, target)
+    return target
+
+
+@dataclass
+class TimelineRuntimeState:
+    """Bookkeeping for one running timeline, created on start and dropped on stop."""
+    task: asyncio.Task
+    destinations: List[str] = field(default_factory=list)  # destination names for status display
+    destination_ids: List[int] = field(default_factory=list)  # destination IDs for UI auto-selection
+    last_segment: float = field(default_factory=time.monotonic)  # last segment completion, for stall detection
+    ffmpeg_started_at: Optional[float] = None  # monotonic time of last FFmpeg start
+    rapid_failures: int = 0  # consecutive FFmpeg deaths shortly after start (drives backoff)
+    notify_task: Optional[asyncio.Task] = None  # in-flight watchdog "stream started" notification
+    switch_lead: float = DEFAULT_SWITCH_LEAD  # last measured seamless-handoff startup (seconds)
 
 
 class TimelineExecutor:
@@ -39,21 +119,43 @@ class TimelineExecutor:
     """
     
     def __init__(self):
-        self.active_timelines: Dict[int, asyncio.Task] = {}
-        self.ffmpeg_managers: Dict[int, FFmpegProcessManager] = {}
+        # timeline_id -> runtime state; membership means the timeline is running
+        self.state: Dict[int, TimelineRuntimeState] = {}
+        # One FFmpeg manager shared by all timelines (streams keyed by timeline_id).
+        # Hardware probing in initialize() runs once, lazily, under the lock.
+        self.ffmpeg_manager = FFmpegProcessManager()
+        self._ffmpeg_initialized = False
+        self._ffmpeg_init_lock = asyncio.Lock()
         self._shutdown_event = asyncio.Event()
         # Track current playback position for each timeline
         self.playback_positions: Dict[int, dict] = {}  # timeline_id -> {current_time, current_cue_id, loop_count}
-        self._position_update_tasks: Dict[int, asyncio.Task] = {}  # Tasks for position updates
-        # Track destination names for each active timeline
-        self.timeline_destinations: Dict[int, List[str]] = {}  # timeline_id -> [destination names]
-        # Track destination IDs for each active timeline (for auto-selection in UI)
-        self.timeline_destination_ids: Dict[int, List[int]] = {}  # timeline_id -> [destination IDs]
-        # Track last segment completion time for stall detection
-        self._last_segment_time: Dict[int, datetime] = {}  # timeline_id -> last segment completion time
-        # Track FFmpeg start times and rapid failure counts for backoff
-        self._ffmpeg_start_times: Dict[int, float] = {}  # timeline_id -> monotonic time of last start
-        self._ffmpeg_rapid_failures: Dict[int, int] = {}  # timeline_id -> consecutive rapid failure count
+        # Downloaded overlay images: asset_id -> {path, etag, expires_at (monotonic), revision}.
+        # Cached files are owned by this cache, not by per-timeline temp file cleanup.
+        self._asset_cache: Dict[int, dict] = {}
+        # Shared HTTP client for overlay downloads (created lazily, closed when idle)
+        self._http: Optional[httpx.AsyncClient] = None
+        # (asset_id, last_updated, placement, src_w, src_h) -> resolved overlay geometry
+        self._overlay_geom_cache: Dict[Tuple, Dict] = {}
+        # Directory holding overlay image files (created lazily, see _overlay_dir)
+        self._tmpdir: Optional[str] = None
+        # timeline_id -> subdirectory of _overlay_dir holding that run's live overlay files
+        self._overlay_dirs: Dict[int, str] = {}
+        # (destination generation, {full RTMP URL: destination id}), see _destination_ids_for
+        self._dest_url_index: Optional[Tuple[int, Dict[str, int]]] = None
+        # asset_id -> (source (inode, size, mtime_ns), local copy in _overlay_dir) for static images
+        self._static_copies: Dict[int, Tuple[tuple, str]] = {}
+        # camera_id -> (connection fields, decrypted password, RTSP URL)
+        self._camera_cache: Dict[int, Tuple[tuple, Optional[str], str]] = {}
+        # Bounds concurrent overlay downloads when fetches are gathered
+        self._download_semaphore = asyncio.Semaphore(8)
+        self._inflight_downloads: Dict[int, asyncio.Task] = {}  # asset_id -> in-flight download
+        self._segment_cache: Dict[int, Tuple[tuple, list]] = {}  # timeline_id -> (version, segments)
+        self._segment_clock: Dict[int, Tuple[float, float, float]] = {}  # timeline_id -> (monotonic start, seg_start, duration)
+
+    @property
+    def active_timelines(self) -> Dict[int, TimelineRuntimeState]:
+        """Running timelines keyed by timeline_id (alias of ``state``)."""
+        return self.state
         
     async def start_timeline(
         self,
@@ -78,39 +180,42 @@ class TimelineExecutor:
         Returns:
             bool: Success status
         """
-        if timeline_id in self.active_timelines:
-            logger.warning(f"Timeline {timeline_id} is already running")
+        # Initialize first: the check-and-register below must not be split by an
+        # await, or two concurrent starts could both pass the check
+        await self._get_ffmpeg_manager()
+
+        if timeline_id in self.state:
+            logger.warning("Timeline %s is already running", timeline_id)
             return False
-            
-        # Store destination names for status display
-        if destination_names:
-            self.timeline_destinations[timeline_id] = destination_names
-        
-        # Store destination IDs for UI auto-selection
-        if destination_ids:
-            self.timeline_destination_ids[timeline_id] = destination_ids
-            
-        # Initialize heartbeat for stall detection
-        self._last_segment_time[timeline_id] = datetime.now(timezone.utc)
-        
-        # Create execution task
+
+        # Create execution task; it first runs at the next await, after the state is registered
         task = asyncio.create_task(
             self._execute_timeline(timeline_id, output_urls, encoding_profile, start_position)
         )
-        self.active_timelines[timeline_id] = task
+        self.state[timeline_id] = TimelineRuntimeState(
+            task=task,
+            destinations=destination_names or [],
+            destination_ids=destination_ids or [],
+        )
         
         start_info = f" from {start_position}s" if start_position else ""
-        logger.info(f"Started timeline {timeline_id}{start_info}")
+        logger.info("Started timeline %s%s", timeline_id, start_info)
+        # uvicorn[standard] runs on uvloop when it is installed (loop="auto")
+        logger.debug("Timeline %s running on %s", timeline_id, type(asyncio.get_running_loop()).__module__)
         return True
         
     async def stop_timeline(self, timeline_id: int) -> bool:
         """Stop a running timeline"""
-        if timeline_id not in self.active_timelines:
-            logger.warning(f"Timeline {timeline_id} is not running")
+        state = self.state.get(timeline_id)
+        if state is None:
+            logger.warning("Timeline %s is not running", timeline_id)
             return False
             
-        # Cancel the timeline task
-        task = self.active_timelines[timeline_id]
+        # Cancel the timeline task (and any pending "stream started" notification,
+        # which must not re-arm watchdogs after the stop below)
+        if state.notify_task is not None:
+            state.notify_task.cancel()
+        task = state.task
         task.cancel()
         
         try:
@@ -118,58 +223,105 @@ class TimelineExecutor:
         except asyncio.CancelledError:
             pass
             
-        # Clean up destination names and IDs
-        if timeline_id in self.timeline_destinations:
-            del self.timeline_destinations[timeline_id]
-        if timeline_id in self.timeline_destination_ids:
-            del self.timeline_destination_ids[timeline_id]
-        if timeline_id in self._last_segment_time:
-            del self._last_segment_time[timeline_id]
-        self._ffmpeg_start_times.pop(timeline_id, None)
-        self._ffmpeg_rapid_failures.pop(timeline_id, None)
-
         # Notify watchdog manager that stream is stopping
         try:
             from services.watchdog_manager import get_watchdog_manager
             watchdog_manager = get_watchdog_manager()
             await watchdog_manager.notify_stream_stopped(timeline_id)
-            logger.info(f"🐕 Notified watchdog manager: stream {timeline_id} stopped")
+            logger.info("🐕 Notified watchdog manager: stream %s stopped", timeline_id)
         except Exception as e:
-            logger.warning(f"Failed to notify watchdog manager: {e}")
+            logger.warning("Failed to notify watchdog manager: %s", e)
         
         # Stop FFmpeg if running
-        if timeline_id in self.ffmpeg_managers:
-            ffmpeg_manager = self.ffmpeg_managers[timeline_id]
+        if timeline_id in self.ffmpeg_manager.processes:
             try:
                 # Unregister callback before stopping
-                ffmpeg_manager.unregister_stream_died_callback(timeline_id)
-                await ffmpeg_manager.stop_stream(timeline_id)
+                self.ffmpeg_manager.unregister_stream_died_callback(timeline_id)
+                await self.ffmpeg_manager.stop_stream(timeline_id)
             except Exception as e:
-                logger.error(f"Error stopping FFmpeg for timeline {timeline_id}: {e}")
-            del self.ffmpeg_managers[timeline_id]
-            
-        del self.active_timelines[timeline_id]
-        logger.info(f"Stopped timeline {timeline_id}")
+                logger.error("Error stopping FFmpeg for timeline %s: %s", timeline_id, e)
+
+
+        del self.state[timeline_id]
+        self._segment_cache.pop(timeline_id, None)
+
+        # Release pooled HTTP connections once no timeline needs them
+        if not self.state:
+            await self.aclose()
+
+        logger.info("Stopped timeline %s", timeline_id)
         return True
     
+    def request_shutdown(self):
+        """Make running timelines leave their segment waits and stop looping."""
+        self._shutdown_event.set()
+
+    async def _wait_until(self, deadline: float) -> bool:
+        """Sleep until event-loop time deadline, waking early on shutdown.
+
+        Returns True if shutdown was requested.
+        """
+        remaining = deadline - asyncio.get_running_loop().time()
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=max(0.0, remaining))
+        except asyncio.TimeoutError:
+            pass
+        return self._shutdown_event.is_set()
+
+    async def aclose(self):
+        """Close the shared HTTP client (reopened lazily on next download)."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._http
+
+    async def _get_ffmpeg_manager(self) -> FFmpegProcessManager:
+        """Return the shared FFmpeg manager, initializing it on first use."""
+        if not self._ffmpeg_initialized:
+            async with self._ffmpeg_init_lock:
+                if not self._ffmpeg_initialized:
+                    await self.ffmpeg_manager.initialize()
+                    self._ffmpeg_initialized = True
+        return self.ffmpeg_manager
+
+    def _mark_progress(self, timeline_id: int):
+        """Record segment completion as the stall-detection heartbeat."""
+        state = self.state.get(timeline_id)
+        if state is not None:
+            state.last_segment = time.monotonic()
+
+    def _mark_ffmpeg_started(self, timeline_id: int):
+        """Record the FFmpeg start time used to detect rapid failures."""
+        state = self.state.get(timeline_id)
+        if state is not None:
+            state.ffmpeg_started_at = time.monotonic()
+
     async def _on_ffmpeg_died(self, stream_id: int, error_msg: str):
         """
         Callback when FFmpeg process dies unexpectedly.
         This updates the timeline state so status endpoints reflect reality.
         """
-        logger.error(f"💀 FFmpeg died for timeline {stream_id}: {error_msg}")
+        logger.error("💀 FFmpeg died for timeline %s: %s", stream_id, error_msg)
 
         # Track rapid failures for backoff logic
-        start_time = self._ffmpeg_start_times.get(stream_id)
-        if start_time is not None:
-            elapsed = time.monotonic() - start_time
+        state = self.state.get(stream_id)
+        if state is not None and state.ffmpeg_started_at is not None:
+            elapsed = time.monotonic() - state.ffmpeg_started_at
             if elapsed < 15:
-                count = self._ffmpeg_rapid_failures.get(stream_id, 0) + 1
-                self._ffmpeg_rapid_failures[stream_id] = count
-                logger.warning(f"⚡ FFmpeg died {elapsed:.1f}s after start (rapid failure #{count} for timeline {stream_id})")
+                state.rapid_failures += 1
+                logger.warning("⚡ FFmpeg died %.1fs after start (rapid failure #%s for timeline %s)", elapsed, state.rapid_failures, stream_id)
             else:
                 # Died after running for a while — not a rapid failure, reset counter
-                self._ffmpeg_rapid_failures[stream_id] = 0
+                state.rapid_failures = 0
 
         # Update playback position to indicate error
         if stream_id in self.playback_positions:
@@ -179,7 +331,7 @@ class TimelineExecutor:
         # Note: We don't cancel the timeline task here because the watchdog
         # should handle recovery. If watchdog is disabled, the timeline
         # will eventually error out when it tries to use the dead FFmpeg.
-        logger.warning(f"Timeline {stream_id} FFmpeg died - watchdog should attempt recovery")
+        logger.warning("Timeline %s FFmpeg died - watchdog should attempt recovery", stream_id)
         
     async def _execute_timeline(
         self,
@@ -197,15 +349,24 @@ class TimelineExecutor:
             start_position: If provided, skip segments before this time and start from here
         """
         db = SessionLocal()
-        overlay_temp_files = []
+        execution: Optional[TimelineExecution] = None
+        finalize: Optional[asyncio.Future] = None
         timed_overlays = []
+        log = bind_logger(logger, timeline_id=timeline_id)
 
         try:
-            # Load timeline
-            timeline = db.query(Timeline).filter(Timeline.id == timeline_id).first()
+            # Load timeline with its tracks and cues in one go so the segment loop
+            # never triggers lazy loads on the hot path
+            timeline = await asyncio.to_thread(
+                lambda: db.query(Timeline)
+                .options(selectinload(Timeline.tracks).selectinload(TimelineTrack.cues))
+                .filter(Timeline.id == timeline_id)
+                .first()
+            )
             if not timeline:
-                logger.error(f"Timeline {timeline_id} not found")
+                log.error("Timeline %s not found", timeline_id)
                 return
+            log = log.bind(timeline=timeline.name)
                 
             # Create execution record
             execution = TimelineExecution(
@@ -216,61 +377,60 @@ class TimelineExecutor:
             db.add(execution)
             db.commit()
             
-            # Get video track cues (camera switching)
-            video_track = next((t for t in timeline.tracks if t.track_type == "video"), None)
-            if not video_track:
-                logger.error(f"No video track found in timeline {timeline_id}")
-                return
-                
-            cues = sorted(video_track.cues, key=lambda c: c.cue_order)
+            # Get video track cues (camera switching) - pre-sorted and memoized on the model
+            cues = timeline.cached_video_cues
             if not cues:
-                logger.error(f"No cues found in timeline {timeline_id}")
+                log.error("No video track cues found in timeline %s", timeline_id)
                 return
                 
-            logger.info(f"Executing timeline {timeline.name} with {len(cues)} cues")
+            log.info("Executing timeline %s with %d cues", timeline.name, len(cues))
             
-            # Initialize FFmpeg manager
-            ffmpeg_manager = FFmpegProcessManager()
-            await ffmpeg_manager.initialize()
-            self.ffmpeg_managers[timeline_id] = ffmpeg_manager
+            # Shared FFmpeg manager (hardware already probed once)
+            ffmpeg_manager = await self._get_ffmpeg_manager()
+            # Resolve the encoding profile once; every (re)start in this run reuses it
+            if encoding_profile is None:
+                encoding_profile = EncodingProfile.reliability_profile(ffmpeg_manager.hw_capabilities)
             
             # PRE-FETCH ALL OVERLAYS for time-based switching (no FFmpeg restarts!)
-            logger.info(f"🎨 Pre-fetching overlays for dynamic switching...")
-            timed_overlays, overlay_temp_files = await self._prefetch_all_overlays(timeline, db)
+            log.info("🎨 Pre-fetching overlays for dynamic switching...")
+            timed_overlays = await self._prefetch_all_overlays(timeline, db)
             
             # Main execution loop (segment-based: overlays handled by time-based enables in FFmpeg)
             loop_count = 0
+            loaded_camera_version: Optional[tuple] = None
             last_camera_id: Optional[int] = None
             last_preset_id: Optional[int] = None
+            clock = asyncio.get_running_loop()
+            next_epoch: Optional[float] = None  # where the previous loop's schedule ends
             while not self._shutdown_event.is_set():
                 loop_count += 1
-                logger.info(f"Timeline {timeline.name} - Loop {loop_count}")
+                log.info("Timeline %s - Loop %d", timeline.name, loop_count)
 
-                # Refresh API overlay images at each loop boundary (after first loop)
-                # Uses seamless handoff: start new FFmpeg with fresh overlays before
-                # stopping the old one, so viewers see no gap.
+                # Refresh API overlay images at each loop boundary (after first loop).
+                # Files are swapped in place, so the running FFmpeg picks them up
+                # without a restart or handoff.
                 if loop_count > 1 and timed_overlays:
-                    new_overlays, new_temp_files, refreshed = await self._refresh_overlay_images(
-                        timed_overlays, overlay_temp_files, db
-                    )
+                    refreshed = await self._refresh_overlay_images(timed_overlays, db)
                     if refreshed:
-                        timed_overlays = new_overlays
-                        overlay_temp_files = new_temp_files
-                        # Force seamless handoff on next segment by resetting camera tracking
-                        # The existing seamless handoff code (start new, stop old) handles
-                        # the transition invisibly for viewers.
-                        if timeline_id in ffmpeg_manager.processes:
-                            logger.info(f"🔄 Overlays refreshed - seamless handoff on next segment")
-                            from services.watchdog_manager import get_watchdog_manager
-                            get_watchdog_manager().notify_intentional_restart(timeline_id, duration_seconds=30)
-                            last_camera_id = None
-                            last_preset_id = None
-
-                # Compute segment boundaries as union of all cue boundaries across enabled tracks
-                segments = self._compute_segments(timeline)
-                logger.debug(f"Computed {len(segments)} segments from track boundaries")
-
-                for seg_index, (seg_start, seg_end) in enumerate(segments):
+                        log.info("🔄 Refreshed %d overlay image(s) in place (no FFmpeg restart)", refreshed)
+
+                # Segment boundaries (union of all cue boundaries across enabled tracks)
+                # with the cues active in each; recomputed only after an edit
+                segments = self._cached_segments(timeline)
+
+                # Cameras and presets for every video cue: one batched load, repeated
+                # only after a camera/preset (or cue) edit
+                camera_version = (database_models._camera_generation, timeline_models._cue_generation)
+                if camera_version != loaded_camera_version:
+                    cameras_by_id, presets_by_id = await self._load_cameras_and_presets(db, cues)
+                    loaded_camera_version = camera_version
+
+                # Segments end at absolute deadlines relative to this loop's epoch, so
+                # variable per-segment work (PTZ, FFmpeg spawn, DB) doesn't accumulate drift.
+                # A mid-timeline start shifts the epoch back by the skipped offset.
+                loop_epoch = self._loop_epoch(clock.time(), next_epoch, start_position)
+
+                for seg_index, (seg_start, seg_end, active_by_type) in enumerate(segments):
                     if self._shutdown_event.is_set():
                         break
 
@@ -282,57 +442,53 @@ class TimelineExecutor:
                     if start_position is not None and start_position > 0:
                         if seg_end <= start_position:
                             # This segment ends before our start position, skip it entirely
-                            logger.debug(f"Skipping segment {seg_index+1} (ends at {seg_end:.2f}s, before start_position {start_position:.2f}s)")
+                            log.debug("Skipping segment %d (ends at %.2fs, before start_position %.2fs)", seg_index + 1, seg_end, start_position)
                             continue
                         
                         if seg_start < start_position < seg_end:
                             # This segment contains our start position - adjust duration
                             time_to_skip = start_position - seg_start
                             duration = duration - time_to_skip
-                            logger.info(f"Starting mid-segment at {start_position:.2f}s (skipping {time_to_skip:.2f}s of segment)")
+                            log.info("Starting mid-segment at %.2fs (skipping %.2fs of segment)", start_position, time_to_skip)
                             # Clear start_position so we don't skip again on subsequent loops
                             start_position = None
 
                     # Determine active video cue at segment start
-                    active_video_cues = [
-                        c for c in cues
-                        if seg_start >= c.start_time and seg_start < (c.start_time + c.duration)
-                    ]
+                    active_video_cues = active_by_type['video']
                     if not active_video_cues:
                         # No video cue at this time - check if FFmpeg is already running
                         stream_running = timeline_id in ffmpeg_manager.processes
                         if stream_running:
                             # FFmpeg is running from previous cue - continue streaming that content
-                            logger.info(f"📋 Gap segment at t={seg_start:.2f}s for {duration:.2f}s - continuing last camera (FFmpeg running)")
-                            await asyncio.sleep(duration)
-                            self._last_segment_time[timeline_id] = datetime.now(timezone.utc)
+                            log.info("📋 Gap segment at t=%.2fs for %.2fs - continuing last camera (FFmpeg running)", seg_start, duration)
+                            if await self._wait_until(loop_epoch + seg_end):
+                                break
+                            self._mark_progress(timeline_id)
                             continue
                         else:
                             # No FFmpeg running and no cue - this is a gap at timeline start
-                            logger.warning(f"⚠️  No video cue at t={seg_start:.2f}s and no stream running - skipping gap")
+                            log.warning("⚠️  No video cue at t=%.2fs and no stream running - skipping gap", seg_start)
                             continue
 
                     video_cue = active_video_cues[0]  # single video track expected
-                    logger.info(f"📋 Segment {seg_index+1}/{len(segments)} at t={seg_start:.2f}s for {duration:.2f}s (video cue ID: {video_cue.id})")
-
-                    # Start continuous position updates for this segment
-                    update_task = asyncio.create_task(
-                        self._update_position_during_segment(
-                            timeline_id=timeline_id,
-                            start_time=seg_start,
-                            duration=duration,
-                            current_cue_id=video_cue.id,
-                            current_cue_index=video_cue.cue_order,
-                            total_cues=len(cues),
-                            loop_count=loop_count,
-                        )
+                    log.info(
+                        "📋 Segment %d/%d at t=%.2fs for %.2fs (video cue ID: %s)",
+                        seg_index + 1, len(segments), seg_start, duration, video_cue.id,
                     )
-                    self._position_update_tasks[timeline_id] = update_task
 
                     # Get camera/preset for this segment BEFORE executing
                     # (so we can update tracking even if segment throws an error)
-                    segment_camera_id = video_cue.action_params.get("camera_id")
-                    segment_preset_id = video_cue.action_params.get("preset_id")
+                    segment_camera_id, segment_preset_id = _cue_target(video_cue)
+
+                    self._begin_segment_position(
+                        timeline_id=timeline_id,
+                        start_time=seg_start,
+                        duration=duration,
+                        current_cue_id=video_cue.id,
+                        current_cue_index=video_cue.cue_order,
+                        total_cues=len(cues),
+                        loop_count=loop_count,
+                    )
 
                     # Execute this segment (overlays handled by time-based enables in FFmpeg)
                     try:
@@ -348,37 +504,40 @@ class TimelineExecutor:
                             last_camera_preset=(last_camera_id, last_preset_id),
                             timed_overlays=timed_overlays,
                             timeline_duration=timeline.duration,
-                            timeline_loop=timeline.loop
+                            timeline_loop=timeline.loop,
+                            deadline=loop_epoch + seg_end - self._switch_lead(
+                                timeline_id, segments, seg_index, segment_camera_id, duration, timeline.loop
+                            ),
+                            cameras_by_id=cameras_by_id,
+                            presets_by_id=presets_by_id
                         )
                     except asyncio.CancelledError:
                         raise  # Re-raise cancellation
                     except Exception as seg_error:
-                        logger.error(
-                            f"Error executing segment {seg_index+1}/{len(segments)} at t={seg_start:.2f}s: {seg_error}",
-                            exc_info=True
+                        # Recovery storms hit this path repeatedly; only pay for the
+                        # traceback when debug logging is on.
+                        log.error(
+                            "Error executing segment %d/%d at t=%.2fs: %s",
+                            seg_index + 1, len(segments), seg_start, seg_error
                         )
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("Segment %d failure traceback", seg_index + 1, exc_info=True)
                         # Update heartbeat even on error so watchdog knows we're making progress
-                        self._last_segment_time[timeline_id] = datetime.now(timezone.utc)
+                        self._mark_progress(timeline_id)
                         # Update camera tracking even on error to prevent false "camera changed" detection
                         last_camera_id = segment_camera_id
                         last_preset_id = segment_preset_id
                         # Continue to next segment instead of crashing the whole timeline
                         continue
 
-                    # Cancel position updates
-                    if timeline_id in self._position_update_tasks:
-                        self._position_update_tasks[timeline_id].cancel()
-                        try:
-                            await self._position_update_tasks[timeline_id]
-                        except asyncio.CancelledError:
-                            pass
-
                     # Track last camera/preset for next segment
                     last_camera_id = segment_camera_id
                     last_preset_id = segment_preset_id
 
+                next_epoch = loop_epoch + float(timeline.duration)
+
                 if not timeline.loop:
-                    logger.info(f"Timeline {timeline.name} completed (loop=False)")
+                    log.info("Timeline %s completed (loop=False)", timeline.name)
                     break
                     
             # Mark execution as completed
@@ -387,44 +546,90 @@ class TimelineExecutor:
             db.commit()
             
         except asyncio.CancelledError:
-            logger.info(f"Timeline {timeline_id} execution cancelled")
+            log.info("Timeline %s execution cancelled", timeline_id)
             # Clear playback position
             if timeline_id in self.playback_positions:
                 del self.playback_positions[timeline_id]
-            try:
-                # Try to update execution status, but don't fail if object is deleted
-                db.refresh(execution)
-                execution.status = "stopped"
-                db.commit()
-            except Exception as db_error:
-                logger.warning(f"Could not update execution status (already deleted?): {db_error}")
-                db.rollback()
+            if execution is not None:
+                # Shielded so a second cancellation (e.g. shutdown right after
+                # stop) cannot abandon the status update halfway through
+                finalize = asyncio.ensure_future(
+                    asyncio.to_thread(self._record_execution_status, db, execution, "stopped", log)
+                )
+                await asyncio.shield(finalize)
             raise
         except Exception as e:
-            logger.error(f"Error executing timeline {timeline_id}: {e}")
+            log.error("Error executing timeline %s: %s", timeline_id, e)
             # Clear playback position
             if timeline_id in self.playback_positions:
                 del self.playback_positions[timeline_id]
-            try:
-                db.refresh(execution)
-                execution.status = "error"
-                execution.error_message = str(e)
-                db.commit()
-            except Exception as db_error:
-                logger.warning(f"Could not update execution status: {db_error}")
-                db.rollback()
+            if execution is not None:
+                finalize = asyncio.ensure_future(
+                    asyncio.to_thread(self._record_execution_status, db, execution, "error", log, str(e))
+                )
+                await asyncio.shield(finalize)
         finally:
-            # Clean up overlay temp files
-            if overlay_temp_files:
-                for temp_file in overlay_temp_files:
-                    try:
-                        if temp_file.startswith('/tmp/') or temp_file.startswith(tempfile.gettempdir()):
-                            os.unlink(temp_file)
-                            logger.debug(f"🗑️  Cleaned up temp overlay file: {temp_file}")
-                    except Exception:
-                        pass
-            db.close()
+            self._segment_clock.pop(timeline_id, None)
+            # Remove this run's live overlay files (cached downloads stay cache-owned)
+            overlay_dir = self._overlay_dirs.pop(timeline_id, None)
+            if overlay_dir is not None:
+                shutil.rmtree(overlay_dir, ignore_errors=True)
+                log.debug("🗑️  Cleaned up overlay directory: %s", overlay_dir)
+            if finalize is not None and not finalize.done():
+                # Status update still running in its thread; close the session after it
+                finalize.add_done_callback(lambda _: db.close())
+            else:
+                db.close()
+
+    @staticmethod
+    def _record_execution_status(db: Session, execution: TimelineExecution, status: str,
+                                 log, error_message: Optional[str] = None):
+        """Persist the final status of an execution record (runs in a worker thread)."""
+        try:
+            # Don't fail if the execution row was deleted while the timeline ran
+            db.refresh(execution)
+            execution.status = status
+            if error_message is not None:
+                execution.error_message = error_message
+            db.commit()
+        except Exception as db_error:
+            log.warning("Could not update execution status (already deleted?): %s", db_error)
+            db.rollback()
             
+    @staticmethod
+    def _loop_epoch(now: float, next_epoch: Optional[float], start_position: Optional[float]) -> float:
+        """Event-loop time at which this loop's t=0 falls.
+
+        Later loops continue the previous loop's schedule, so the switch lead
+        taken off its last segment is made up in this loop's first one instead
+        of shortening every loop. A loop that overran by more than any lead
+        (e.g. a stalled handoff) restarts the schedule from now rather than
+        rushing through segments to catch up.
+        """
+        if next_epoch is not None and now - next_epoch <= MAX_SWITCH_LEAD:
+            return next_epoch
+        return now - (start_position or 0.0)
+
+    def _switch_lead(self, timeline_id: int, segments, seg_index: int,
+                     camera_id: Optional[int], duration: float, loop: bool) -> float:
+        """Seconds to end this segment early because the next one switches camera.
+
+        The next segment's seamless handoff then runs while this camera is still
+        on air, so the cut lands near the boundary instead of one startup late.
+        Never more than half the segment.
+        """
+        next_index = seg_index + 1
+        if next_index >= len(segments):
+            if not loop:
+                return 0.0
+            next_index = 0
+        next_video = segments[next_index][2]['video']
+        if not next_video or _cue_target(next_video[0])[0] in (None, camera_id):
+            return 0.0
+        state = self.state.get(timeline_id)
+        lead = state.switch_lead if state is not None else DEFAULT_SWITCH_LEAD
+        return min(lead, duration / 2)
+
     def _get_active_cues_at_time(self, timeline: Timeline, current_time: float) -> Dict[str, List[TimelineCue]]:
         """Get all active cues at a specific time, grouped by track type"""
         active_cues = {'video': [], 'overlay': [], 'audio': []}
@@ -432,13 +637,7 @@ class TimelineExecutor:
         for track in timeline.tracks:
             if not track.is_enabled:
                 continue
-                
-            for cue in track.cues:
-                cue_start = cue.start_time
-                cue_end = cue.start_time + cue.duration
-                
-                if current_time >= cue_start and current_time < cue_end:
-                    active_cues[track.track_type].append(cue)
+            active_cues[track.track_type].extend(self._cues_active_in_track(track, current_time))
         
         return active_cues
 
@@ -448,64 +647,398 @@ class TimelineExecutor:
         for track in timeline.tracks:
             if not track.is_enabled or track.track_type != 'overlay':
                 continue
-            for cue in track.cues:
-                cue_start = cue.start_time
-                cue_end = cue.start_time + cue.duration
-                if current_time >= cue_start and current_time < cue_end:
-                    asset_id = cue.action_params.get('asset_id')
-                    if asset_id:
-                        overlay_ids.append(asset_id)
+            for cue in self._cues_active_in_track(track, current_time):
+                asset_id = cue.action_params.get('asset_id')
+                if asset_id:
+                    overlay_ids.append(asset_id)
         return sorted(overlay_ids)
 
+    def _track_cue_index(self, track: TimelineTrack):
+        """Start-sorted cues of a track with a running max of their end times.
+
+        Memoized on the track until any cue changes (see models.timeline).
+        """
+        key = (timeline_models._cue_generation, len(track.cues))
+        cached = track.__dict__.get('_cue_index')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        cues = sorted(track.cues, key=lambda c: c.start_time)
+        starts = [cue.start_time for cue in cues]
+        max_ends = list(itertools.accumulate((cue.start_time + cue.duration for cue in cues), max))
+        index = (starts, max_ends, cues)
+        track.__dict__['_cue_index'] = (key, index)
+        return index
+
+    def _cues_active_in_track(self, track: TimelineTrack, current_time: float) -> List[TimelineCue]:
+        """Cues of one track covering current_time, ordered by start time."""
+        starts, max_ends, cues = self._track_cue_index(track)
+        # Candidates start at or before current_time; walk back only while some
+        # earlier cue can still reach past it (a single step for video tracks)
+        idx = bisect.bisect_right(starts, current_time) - 1
+        active = []
+        while idx >= 0 and max_ends[idx] > current_time:
+            cue = cues[idx]
+            if cue.start_time + cue.duration > current_time:
+                active.append(cue)
+            idx -= 1
+        active.reverse()
+        return active
+
     def _compute_segments(self, timeline: Timeline) -> List[Tuple[float, float]]:
         """Compute contiguous time segments from union of all cue boundaries across enabled tracks."""
-        boundaries: List[float] = [0.0, timeline.duration]
-        for track in timeline.tracks:
-            if not track.is_enabled:
-                continue
-            for cue in track.cues:
-                boundaries.append(float(cue.start_time))
-                boundaries.append(float(cue.start_time + cue.duration))
-        # Unique and sort within [0, duration]
-        uniq = sorted(set(t for t in boundaries if t >= 0.0 and t <= timeline.duration))
-        segments: List[Tuple[float, float]] = []
-        for i in range(len(uniq) - 1):
-            start = uniq[i]
-            end = uniq[i + 1]
-            if end - start > 0.0:
-                segments.append((start, end))
+        duration = float(timeline.duration)
+        boundaries = np.fromiter(
+            itertools.chain(
+                (0.0, duration),
+                itertools.chain.from_iterable(
+                    (cue.start_time, cue.start_time + cue.duration)
+                    for track in timeline.tracks
+                    if track.is_enabled
+                    for cue in track.cues
+                ),
+            ),
+            dtype=np.float64,
+        )
+        # Unique and sort within [0, duration]; np.unique returns sorted values
+        uniq = np.unique(boundaries[(boundaries >= 0.0) & (boundaries <= duration)]).tolist()
+        return [(start, end) for start, end in zip(uniq, uniq[1:]) if end - start > 0.0]
+
+    def _cached_segments(self, timeline: Timeline) -> List[Tuple[float, float, Dict[str, List[TimelineCue]]]]:
+        """_compute_segments_with_cues, memoized per timeline until it or its cues change."""
+        version = (timeline.updated_at, timeline.duration, timeline_models._cue_generation)
+        cached = self._segment_cache.get(timeline.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        segments = self._compute_segments_with_cues(timeline)
+        logger.debug("Computed %d segments from track boundaries", len(segments))
+        self._segment_cache[timeline.id] = (version, segments)
         return segments
-    
+
+    def _compute_segments_with_cues(
+        self, timeline: Timeline
+    ) -> List[Tuple[float, float, Dict[str, List[TimelineCue]]]]:
+        """Compute segments along with the cues active at each segment start.
+
+        Each enabled track's cues are sorted by start time once and swept with a
+        cursor as segment starts advance, instead of rescanning every cue of
+        every track per segment.
+        """
+        segments = self._compute_segments(timeline)
+        tracks = [
+            (track.track_type, sorted(track.cues, key=lambda c: c.start_time))
+            for track in timeline.tracks
+            if track.is_enabled
+        ]
+        cursors = [0] * len(tracks)
+        open_cues: List[List[TimelineCue]] = [[] for _ in tracks]
+
+        result = []
+        for seg_start, seg_end in segments:
+            active: Dict[str, List[TimelineCue]] = {'video': [], 'overlay': [], 'audio': []}
+            for i, (track_type, track_cues) in enumerate(tracks):
+                while cursors[i] < len(track_cues) and track_cues[cursors[i]].start_time <= seg_start:
+                    open_cues[i].append(track_cues[cursors[i]])
+                    cursors[i] += 1
+                open_cues[i] = [c for c in open_cues[i] if seg_start < c.start_time + c.duration]
+                active.setdefault(track_type, []).extend(open_cues[i])
+            result.append((seg_start, seg_end, active))
+        return result
+
+    async def _fetch_cached_image(
+        self,
+        asset_id: int,
+        client: httpx.AsyncClient,
+        url: str,
+        suffix: Optional[str] = None,
+        follow_redirects: bool = False,
+        revision=None,
+        default_ttl: float = DEFAULT_ASSET_CACHE_TTL
+    ) -> Tuple[Optional[str], int]:
+        """Download an overlay image through the per-asset cache.
+
+        A fresh entry is returned without any request. A stale one is
+        revalidated with If-None-Match; a 304 just extends its lifetime. A new
+        body replaces the cached file. Returns (path or None, HTTP status).
+
+        Entries are tied to (url, revision) - pass the asset's last_updated so
+        an edited asset is fetched again even while its old image is fresh.
+        default_ttl applies when the response carries no Cache-Control max-age.
+        """
+        entry = self._asset_cache.get(asset_id)
+        if entry and (entry['revision'] != (url, revision) or not os.path.exists(entry['path'])):
+            # Asset edited, or file removed behind our back - fetch unconditionally
+            try:
+                os.unlink(entry['path'])
+            except OSError:
+                pass
+            del self._asset_cache[asset_id]
+            entry = None
+        if entry and time.monotonic() < entry['expires_at']:
+            return entry['path'], 200
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry['etag'] else None
+        async with self._download_semaphore:
+            path, response = await stream_to_temp_file(
+                client, url, suffix, dir=self._overlay_dir(), headers=headers,
+                follow_redirects=follow_redirects
+            )
+        if entry and response.status_code == 304:
+            entry['expires_at'] = time.monotonic() + _cache_ttl(response.headers, default_ttl)
+            return entry['path'], 304
+        if not path:
+            return None, response.status_code
+
+        if entry and entry['path'] != path:
+            try:
+                os.unlink(entry['path'])
+            except OSError:
+                pass
+        self._asset_cache[asset_id] = {
+            'path': path,
+            'etag': response.headers.get('etag'),
+            'expires_at': time.monotonic() + _cache_ttl(response.headers, default_ttl),
+            'revision': (url, revision),
+        }
+        return path, response.status_code
+
+    def _overlay_geometry(
+        self,
+        asset: Asset,
+        image_path: str,
+        placement: Tuple,
+        src_w: int,
+        src_h: int
+    ) -> Dict:
+        """Resolve an overlay's norm_x/norm_y, opacity and optional width/height.
+
+        placement is (pos_x, pos_y, opacity, width, height) after per-cue
+        overrides. Results are cached per asset revision, placement and timeline
+        resolution, so the PIL auto-size probe for overlays without explicit
+        dimensions runs once rather than on every prefetch.
+        """
+        key = (asset.id, asset.last_updated, placement, src_w, src_h)
+        geometry = self._overlay_geom_cache.get(key)
+        if geometry is not None:
+            return geometry
+
+        pos_x, pos_y, opacity, width, height = placement
+        # Auto-size overlays that have no explicit dimensions.
+        if not width and not height:
+            try:
+                from PIL import Image as PILImage
+                img = PILImage.open(image_path)
+                img_w, img_h = img.size
+                img.close()
+                ratio = img_w / img_h if img_h else 1
+                width = min(img_w, src_w)
+                height = round(width / ratio)
+                if height > src_h:
+                    height = src_h
+                    width = round(height * ratio)
+                logger.info(
+                    "  📐 Auto-sized '%s': native=%dx%d → %sx%s", asset.name, img_w, img_h, width, height
+                )
+            except Exception as e:
+                logger.warning("Failed to auto-size overlay '%s': %s", asset.name, e)
+                return {'norm_x': pos_x, 'norm_y': pos_y, 'opacity': opacity}
+
+        geometry = {'norm_x': pos_x, 'norm_y': pos_y, 'opacity': opacity}
+        if width:
+            geometry['width'] = width
+        if height:
+            geometry['height'] = height
+        self._overlay_geom_cache[key] = geometry
+        return geometry
+
+    def _overlay_dir(self) -> str:
+        """Dedicated temp directory for downloaded and published overlay images."""
+        if self._tmpdir is None or not os.path.isdir(self._tmpdir):
+            self._tmpdir = tempfile.mkdtemp(prefix='vistter_overlays_')
+        return self._tmpdir
+
+    def _localize_static_image(self, asset_id: int, file_path: str) -> str:
+        """Mirror an uploaded image into the overlay dir so FFmpeg opens a local file.
+
+        Hard-links when the upload shares the filesystem (no bytes copied) and
+        falls back to shutil.copyfile, which uses the kernel's sendfile/fcopyfile
+        path, across filesystems. Re-mirrored only when the upload changes.
+        """
+        st = os.stat(file_path)
+        source = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = self._static_copies.get(asset_id)
+        if cached is not None and cached[0] == source and os.path.exists(cached[1]):
+            return cached[1]
+
+        local_path = os.path.join(self._overlay_dir(), f"static_{asset_id}{os.path.splitext(file_path)[1]}")
+        staging = f"{local_path}.staging"
+        try:
+            os.link(file_path, staging)
+        except OSError:
+            shutil.copyfile(file_path, staging)
+        os.replace(staging, local_path)
+        self._static_copies[asset_id] = (source, local_path)
+        return local_path
+
+    async def _move_camera_to_preset(self, log, camera: Camera, preset: Preset,
+                                     preset_id: int, password: str) -> None:
+        """Move a PTZ camera to a preset; failures are logged, never raised."""
+        # Use configured ONVIF port for PTZ control
+        ptz_service = get_ptz_service()
+        pan = preset.pan if preset.pan is not None else 0.0
+        tilt = preset.tilt if preset.tilt is not None else 0.0
+        zoom = preset.zoom if preset.zoom is not None else 1.0
+        preset_token = preset.camera_preset_token or str(preset_id)
+        try:
+            if ptz_service.last_pose(camera.address, camera.onvif_port) == (preset_token, pan, tilt, zoom):
+                # An earlier segment left this camera at the pose and nothing moved it since
+                log.info("PTZ already at preset '%s', skipping move", preset.name)
+                return
+            success = await ptz_service.move_to_preset(
+                address=camera.address,
+                port=camera.onvif_port,
+                username=camera.username,
+                password=password,
+                preset_token=preset_token,
+                pan=pan,
+                tilt=tilt,
+                zoom=zoom,
+            )
+            if success:
+                log.info("✅ Camera moved to preset '%s' (pan=%s, tilt=%s, zoom=%s)", preset.name, pan, tilt, zoom)
+            else:
+                log.warning("⚠️  Failed to move camera to preset, continuing anyway")
+        except Exception as e:
+            # Continue anyway - don't fail the whole timeline
+            log.error("❌ Error moving camera to preset: %s", e)
+
+    async def _notify_watchdog_async(self, timeline_id: int, output_urls: List[str]):
+        """Tell the watchdog manager which destinations a (re)started stream feeds."""
+        log = bind_logger(logger, timeline_id=timeline_id)
+        try:
+            from services.watchdog_manager import get_watchdog_manager
+
+            watchdog_manager = get_watchdog_manager()
+            # Usually a dict hit; any index rebuild queries off the event loop
+            dest_ids = await asyncio.to_thread(self._destination_ids_for, output_urls)
+            if dest_ids:
+                with get_session() as dest_db:
+                    await watchdog_manager.notify_stream_started(
+                        destination_ids=dest_ids,
+                        stream_id=timeline_id,
+                        db_session=dest_db
+                    )
+                log.info("🐕 Notified watchdog manager: stream %s → destinations %s", timeline_id, dest_ids)
+        except Exception as e:
+            log.warning("Failed to notify watchdog manager: %s", e)
+
+    def _destination_ids_for(self, output_urls: List[str], db: Optional[Session] = None) -> List[int]:
+        """Destination ids whose full RTMP URL matches each output URL.
+
+        The URL -> id index (one query plus a stream-key decrypt per destination)
+        is rebuilt only after a destination row changes; a session is opened for
+        the rebuild when db is not given, so a fresh index needs no DB at all.
+        """
+        generation = destination_models._destination_generation
+        if self._dest_url_index is None or self._dest_url_index[0] != generation:
+            if db is not None:
+                index = self._build_destination_index(db)
+            else:
+                with get_session() as session:
+                    index = self._build_destination_index(session)
+            self._dest_url_index = (generation, index)
+        index = self._dest_url_index[1]
+        return [index[url] for url in output_urls if url in index]
+
+    @staticmethod
+    def _build_destination_index(db: Session) -> Dict[str, int]:
+        index: Dict[str, int] = {}
+        for dest in db.query(destination_models.StreamingDestination).order_by(
+            destination_models.StreamingDestination.id
+        ):
+            index.setdefault(dest.get_full_rtmp_url(), dest.id)
+        return index
+
+    def _timeline_overlay_dir(self, timeline_id: int) -> str:
+        """Per-timeline directory for live overlay files, removed as a whole on stop."""
+        path = self._overlay_dirs.get(timeline_id)
+        if path is None or not os.path.isdir(path):
+            path = tempfile.mkdtemp(prefix=f'tl{timeline_id}_', dir=self._overlay_dir())
+            self._overlay_dirs[timeline_id] = path
+        return path
+
+    def _publish_overlay_file(self, source_path: str, live_path: Optional[str] = None,
+                              directory: Optional[str] = None) -> str:
+        """Expose an image at a stable per-timeline path that FFmpeg reads.
+
+        FFmpeg's image2 demuxer reopens a looped (-loop 1) still image on every
+        frame, so atomically replacing the file at live_path swaps the overlay
+        inside the running process. Creates a new temp path in directory
+        (default: the shared overlay dir) when live_path is None.
+        """
+        if live_path is None:
+            fd, live_path = tempfile.mkstemp(
+                suffix=os.path.splitext(source_path)[1], prefix='live_',
+                dir=directory or self._overlay_dir()
+            )
+            os.close(fd)
+        staging = f"{live_path}.staging"
+        try:
+            os.link(source_path, staging)
+        except OSError:
+            shutil.copyfile(source_path, staging)
+        os.replace(staging, live_path)
+        return live_path
+
     async def _download_asset_image(self, asset: Asset) -> Optional[str]:
-        """Download an asset image to a temp file. Returns temp file path or None."""
+        """Download an asset image to a temp file. Returns temp file path or None.
+
+        Concurrent calls for the same asset (overlapping cues, or several
+        timelines sharing a weather feed) share one in-flight download.
+        """
+        task = self._inflight_downloads.get(asset.id)
+        if task is None:
+            task = asyncio.create_task(self._resolve_asset_image(asset))
+            self._inflight_downloads[asset.id] = task
+
+            def _forget(done, asset_id=asset.id):
+                if self._inflight_downloads.get(asset_id) is done:
+                    del self._inflight_downloads[asset_id]
+
+            task.add_done_callback(_forget)
+        # Shielded so one cancelled waiter doesn't abort the download for the others
+        return await asyncio.shield(task)
+
+    async def _resolve_asset_image(self, asset: Asset) -> Optional[str]:
         try:
             if asset.type == 'api_image' and asset.api_url:
                 # Download from API
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(asset.api_url)
-                    if response.status_code == 200:
-                        # Create temp file
-                        suffix = '.png' if 'png' in response.headers.get('content-type', '') else '.jpg'
-                        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                            tmp.write(response.content)
-                            logger.info(f"📥 Downloaded API image for asset '{asset.name}' to {tmp.name}")
-                            return tmp.name
+                client = await self._get_http()
+                path, _ = await self._fetch_cached_image(
+                    asset.id, client, asset.api_url, revision=asset.last_updated,
+                    default_ttl=asset.api_refresh_interval or DEFAULT_ASSET_CACHE_TTL
+                )
+                if path:
+                    logger.info("📥 Downloaded API image for asset '%s' to %s", asset.name, path)
+                    return path
             elif asset.type == 'google_drawing' and asset.file_path:
                 # Parse Google Drive Drawing URL and download PNG
                 export_url = parse_google_drawing_url(asset.file_path)
                 if not export_url:
-                    logger.warning(f"⚠️  Invalid Google Drive Drawing URL for asset '{asset.name}': {asset.file_path}")
+                    logger.warning("⚠️  Invalid Google Drive Drawing URL for asset '%s': %s", asset.name, asset.file_path)
                     return None
                 
-                async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                    response = await client.get(export_url)
-                    if response.status_code == 200:
-                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                            tmp.write(response.content)
-                            logger.info(f"📥 Downloaded Google Drawing PNG for asset '{asset.name}' to {tmp.name}")
-                            return tmp.name
-                    else:
-                        logger.warning(f"⚠️  Failed to download Google Drawing for asset '{asset.name}': HTTP {response.status_code}")
+                client = await self._get_http()
+                path, status_code = await self._fetch_cached_image(
+                    asset.id, client, export_url, suffix='.png', follow_redirects=True,
+                    revision=asset.last_updated
+                )
+                if path:
+                    logger.info("📥 Downloaded Google Drawing PNG for asset '%s' to %s", asset.name, path)
+                    return path
+                else:
+                    logger.warning("⚠️  Failed to download Google Drawing for asset '%s': HTTP %s", asset.name, status_code)
             elif asset.type == 'static_image' and asset.file_path:
                 # Convert URL path to filesystem path if needed
                 file_path = asset.file_path
@@ -516,12 +1049,13 @@ class TimelineExecutor:
                     file_path = str(backend_dir / file_path.lstrip('/'))
                 
                 if os.path.exists(file_path):
-                    logger.info(f"📁 Using local image for asset '{asset.name}': {file_path}")
-                    return file_path
+                    local_path = await asyncio.to_thread(self._localize_static_image, asset.id, file_path)
+                    logger.info("📁 Using local image for asset '%s': %s", asset.name, local_path)
+                    return local_path
                 else:
-                    logger.warning(f"⚠️  File not found for asset '{asset.name}': {file_path}")
+                    logger.warning("⚠️  File not found for asset '%s': %s", asset.name, file_path)
         except Exception as e:
-            logger.error(f"Failed to download asset {asset.id}: {e}")
+            logger.error("Failed to download asset %s: %s", asset.id, e)
         
         return None
     
@@ -541,99 +1075,144 @@ class TimelineExecutor:
         so overlays can change without restarting FFmpeg.
         """
         timed_overlays = []
-        temp_files = []
         
-        logger.info(f"🎨 Pre-fetching all overlay images for timeline...")
+        logger.info("🎨 Pre-fetching all overlay images for timeline...")
         
-        for track in timeline.tracks:
-            if track.track_type != 'overlay' or not track.is_enabled:
+        # Resolve overlay cues to active assets first (DB only)
+        overlay_cues = [
+            cue
+            for track in timeline.tracks
+            if track.track_type == 'overlay' and track.is_enabled
+            for cue in track.cues
+            if cue.action_params.get('asset_id')
+        ]
+        assets = await self._load_assets(db, {cue.action_params['asset_id'] for cue in overlay_cues})
+
+        pending: List[Tuple[TimelineCue, Asset]] = []
+        for cue in overlay_cues:
+            asset_id = cue.action_params['asset_id']
+            asset = assets.get(asset_id)
+            if not asset or not asset.is_active:
+                logger.warning("Asset %s not found or inactive, skipping", asset_id)
+                continue
+            pending.append((cue, asset))
+
+        # Download/get each referenced asset once, concurrently
+        image_by_asset = await self._download_assets(asset for _, asset in pending)
+
+        # Pass normalized 0-1 coordinates; FFmpeg manager converts to
+        # pixels using its actual output resolution (which may differ
+        # from the timeline's declared resolution).
+        res_parts = timeline.resolution.split('x') if timeline.resolution else ['1920', '1080']
+        src_w = int(res_parts[0]) if len(res_parts) == 2 else 1920
+        src_h = int(res_parts[1]) if len(res_parts) == 2 else 1080
+
+        # Cues showing the same asset with the same placement share one overlay
+        # (one FFmpeg input + filter) enabled over the union of their intervals
+        by_placement: Dict[tuple, Dict] = {}
+        for cue, asset in pending:
+            asset_id = asset.id
+            image_path = image_by_asset[asset_id]
+
+            # Per-cue overrides from action_params take priority over asset defaults
+            params = cue.action_params or {}
+            pos_x = params.get('position_x', asset.position_x)
+            pos_y = params.get('position_y', asset.position_y)
+            cue_opacity = params.get('opacity', asset.opacity)
+            cue_width = params.get('width', asset.width)
+            cue_height = params.get('height', asset.height)
+
+            if isinstance(image_path, BaseException) or not image_path:
+                logger.warning("Failed to get image for asset '%s', skipping", asset.name)
                 continue
-            
-            for cue in track.cues:
-                asset_id = cue.action_params.get('asset_id')
-                if not asset_id:
-                    continue
-                
-                # Get asset from database
-                asset = db.query(Asset).filter(Asset.id == asset_id).first()
-                if not asset or not asset.is_active:
-                    logger.warning(f"Asset {asset_id} not found or inactive, skipping")
-                    continue
-                
-                # Per-cue overrides from action_params take priority over asset defaults
-                params = cue.action_params or {}
-                pos_x = params.get('position_x', asset.position_x)
-                pos_y = params.get('position_y', asset.position_y)
-                cue_opacity = params.get('opacity', asset.opacity)
-                cue_width = params.get('width', asset.width)
-                cue_height = params.get('height', asset.height)
-
-                # Pass normalized 0-1 coordinates; FFmpeg manager converts to
-                # pixels using its actual output resolution (which may differ
-                # from the timeline's declared resolution).
-                res_parts = timeline.resolution.split('x') if timeline.resolution else ['1920', '1080']
-                src_w = int(res_parts[0]) if len(res_parts) == 2 else 1920
-                src_h = int(res_parts[1]) if len(res_parts) == 2 else 1080
-
-                # Download/get image path
-                image_path = await self._download_asset_image(asset)
-                if not image_path:
-                    logger.warning(f"Failed to get image for asset '{asset.name}', skipping")
-                    continue
-
-                # Track temp files for cleanup later
-                if image_path.startswith('/tmp/') or image_path.startswith(tempfile.gettempdir()):
-                    temp_files.append(image_path)
-
-                timed_overlay = {
-                    'path': image_path,
-                    'norm_x': pos_x,
-                    'norm_y': pos_y,
-                    'source_resolution': (src_w, src_h),
-                    'opacity': cue_opacity,
-                    'start_time': float(cue.start_time),
-                    'end_time': float(cue.start_time + cue.duration),
-                    'asset_id': asset_id,
-                    'asset_name': asset.name
-                }
-
-                # Auto-size overlays that have no explicit dimensions.
-                if not cue_width and not cue_height:
-                    try:
-                        from PIL import Image as PILImage
-                        img = PILImage.open(image_path)
-                        img_w, img_h = img.size
-                        img.close()
-                        ratio = img_w / img_h if img_h else 1
-                        cue_width = min(img_w, src_w)
-                        cue_height = round(cue_width / ratio)
-                        if cue_height > src_h:
-                            cue_height = src_h
-                            cue_width = round(cue_height * ratio)
-                        logger.info(
-                            f"  📐 Auto-sized '{asset.name}': native={img_w}x{img_h} → {cue_width}x{cue_height}"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to auto-size overlay '{asset.name}': {e}")
 
-                if cue_width:
-                    timed_overlay['width'] = cue_width
-                if cue_height:
-                    timed_overlay['height'] = cue_height
-                
-                timed_overlays.append(timed_overlay)
-                
-                logger.info(
-                    f"  🖼️  {asset.name}: t={cue.start_time:.1f}s-{cue.start_time + cue.duration:.1f}s "
-                    f"at norm({pos_x:.3f}, {pos_y:.3f})"
+            interval = (float(cue.start_time), float(cue.start_time + cue.duration))
+            placement = (pos_x, pos_y, cue_opacity, cue_width, cue_height)
+            existing = by_placement.get((asset_id, placement))
+            if existing is not None:
+                existing['intervals'] = _merge_intervals(existing['intervals'] + [interval])
+                existing['start_time'] = existing['intervals'][0][0]
+                existing['end_time'] = existing['intervals'][-1][1]
+                logger.info("  🖼️  %s: +t=%.1fs-%.1fs (shared overlay)", asset.name, *interval)
+                continue
+
+            # Dynamic images are served to FFmpeg from a stable live path so
+            # loop-boundary refreshes can replace them in place
+            source_path = None
+            if asset.type in DYNAMIC_ASSET_TYPES:
+                source_path = image_path
+                image_path = self._publish_overlay_file(
+                    source_path, directory=self._timeline_overlay_dir(timeline.id)
                 )
+
+            timed_overlay = {
+                'path': image_path,
+                'source_resolution': (src_w, src_h),
+                'start_time': interval[0],
+                'end_time': interval[1],
+                'intervals': [interval],
+                'asset_id': asset_id,
+                'asset_name': asset.name,
+                'source_path': source_path
+            }
+            timed_overlay.update(self._overlay_geometry(asset, image_path, placement, src_w, src_h))
+            
+            timed_overlays.append(timed_overlay)
+            by_placement[(asset_id, placement)] = timed_overlay
+            
+            logger.info(
+                "  🖼️  %s: t=%.1fs-%.1fs at norm(%.3f, %.3f)",
+                asset.name, cue.start_time, cue.start_time + cue.duration, pos_x, pos_y,
+            )
         
-        logger.info(f"🎨 Pre-fetched {len(timed_overlays)} overlay(s) for timeline")
-        
-        logger.debug("Overlays prefetched: count=%d, temp_files=%d", len(timed_overlays), len(temp_files))
+        logger.info("🎨 Pre-fetched %d overlay(s) for timeline", len(timed_overlays))
         
-        # Store temp files for cleanup (will be cleaned up when timeline stops)
-        return timed_overlays, temp_files
+        # Live overlay files are removed with the timeline's overlay dir when it stops
+        return timed_overlays
+
+    async def _load_assets(self, db: Session, asset_ids) -> Dict[int, Asset]:
+        """Fetch assets by id in one query, off the event loop."""
+        if not asset_ids:
+            return {}
+        assets = await asyncio.to_thread(
+            lambda: db.query(Asset).filter(Asset.id.in_(asset_ids)).all()
+        )
+        return {asset.id: asset for asset in assets}
+
+    async def _load_cameras_and_presets(
+        self, db: Session, cues
+    ) -> Tuple[Dict[int, Camera], Dict[int, Preset]]:
+        """Fetch the cameras and presets referenced by video cues in two IN queries.
+
+        populate_existing() refreshes rows already in the session's identity map,
+        so a reload after an edit sees the new values.
+        """
+        targets = [_cue_target(c) for c in cues]
+        camera_ids = {camera_id for camera_id, _ in targets} - {None}
+        preset_ids = {preset_id for _, preset_id in targets} - {None}
+
+        def load():
+            cameras = (db.query(Camera).populate_existing().filter(Camera.id.in_(camera_ids)).all()
+                       if camera_ids else [])
+            presets = (db.query(Preset).populate_existing().filter(Preset.id.in_(preset_ids)).all()
+                       if preset_ids else [])
+            return cameras, presets
+
+        cameras, presets = await asyncio.to_thread(load)
+        return {c.id: c for c in cameras}, {p.id: p for p in presets}
+
+    async def _download_assets(self, assets) -> Dict[int, object]:
+        """Download each distinct asset once, concurrently.
+
+        Overlay cues often share an asset; the result maps asset id to the
+        image path, None, or the exception raised for it.
+        """
+        unique = {asset.id: asset for asset in assets}
+        results = await asyncio.gather(
+            *(self._download_asset_image(asset) for asset in unique.values()),
+            return_exceptions=True
+        )
+        return dict(zip(unique, results))
 
     async def _force_kill_ffmpeg(self, ffmpeg_manager, stream_id: int):
         """Force-kill FFmpeg process when stop_stream is deadlocked.
@@ -644,81 +1223,63 @@ class TimelineExecutor:
                 sp = ffmpeg_manager.processes[stream_id]
                 proc = sp.process
                 if proc and proc.returncode is None:
-                    logger.warning(f"Force-killing FFmpeg PID {proc.pid}")
+                    logger.warning("Force-killing FFmpeg PID %s", proc.pid)
                     try:
                         proc.kill()
                         await asyncio.wait_for(proc.wait(), timeout=10.0)
-                        logger.info(f"FFmpeg PID {proc.pid} force-killed successfully")
+                        logger.info("FFmpeg PID %s force-killed successfully", proc.pid)
                     except (ProcessLookupError, asyncio.TimeoutError) as e:
-                        logger.error(f"Force-kill failed for PID {proc.pid}: {e}")
+                        logger.error("Force-kill failed for PID %s: %s", proc.pid, e)
                 sp.process = None
                 sp.status = StreamStatus.STOPPED
         except Exception as e:
-            logger.error(f"_force_kill_ffmpeg error: {e}")
+            logger.error("_force_kill_ffmpeg error: %s", e)
 
-    async def _refresh_overlay_images(
-        self,
-        timed_overlays: List[Dict],
-        old_temp_files: List[str],
-        db: Session
-    ) -> Tuple[List[Dict], List[str], bool]:
+    async def _refresh_overlay_images(self, timed_overlays: List[Dict], db: Session) -> int:
         """
         Re-download API overlay images at loop boundary for fresh weather/data overlays.
 
+        Changed images are published over the overlay's existing live path
+        (see _publish_overlay_file), so the running FFmpeg shows them without
+        a restart and the overlay list itself is left unchanged.
+
         Returns:
-            (updated_overlays, new_temp_files, was_refreshed)
+            Number of overlay images that were replaced
         """
-        new_temp_files = []
-        refreshed = False
+        candidates = [o for o in timed_overlays if o.get('asset_id') and o.get('source_path')]
+        assets = await self._load_assets(db, {o['asset_id'] for o in candidates})
 
-        for overlay in timed_overlays:
-            asset_id = overlay.get('asset_id')
-            if not asset_id:
-                continue
-
-            asset = db.query(Asset).filter(Asset.id == asset_id).first()
+        pending: List[Tuple[Dict, Asset]] = []
+        for overlay in candidates:
+            asset = assets.get(overlay['asset_id'])
             if not asset or not asset.is_active:
                 continue
 
             # Only refresh API images and Google Drawings (static images don't change)
-            if asset.type not in ('api_image', 'google_drawing'):
-                continue
-
-            old_path = overlay.get('path', '')
-            new_path = await self._download_asset_image(asset)
-            if not new_path:
-                logger.warning(f"⚠️  Failed to refresh overlay '{asset.name}', keeping old image")
+            if asset.type not in DYNAMIC_ASSET_TYPES:
                 continue
+            pending.append((overlay, asset))
 
-            # Track new temp file for cleanup
-            if new_path.startswith('/tmp/') or new_path.startswith(tempfile.gettempdir()):
-                new_temp_files.append(new_path)
+        new_by_asset = await self._download_assets(asset for _, asset in pending)
 
-            # Update the overlay entry with new path
-            overlay['path'] = new_path
-            refreshed = True
-
-            # Clean up the old temp file
-            if old_path and old_path != new_path:
-                if old_path.startswith('/tmp/') or old_path.startswith(tempfile.gettempdir()):
-                    try:
-                        os.unlink(old_path)
-                    except Exception:
-                        pass
-
-        if refreshed:
-            logger.info(f"🔄 Refreshed overlay images at loop boundary")
-
-            # Build updated temp files list: keep non-API temp files, add new ones
-            kept_temp_files = [
-                f for f in old_temp_files
-                if os.path.exists(f)
-            ]
-            # Merge: existing files still in use + newly downloaded
-            all_temp_files = list(set(kept_temp_files + new_temp_files))
-            return timed_overlays, all_temp_files, True
+        refreshed = 0
+        for overlay, asset in pending:
+            new_path = new_by_asset[asset.id]
+            if isinstance(new_path, BaseException) or not new_path:
+                logger.warning("⚠️  Failed to refresh overlay '%s', keeping old image", asset.name)
+                continue
+            if new_path == overlay['source_path']:
+                # Still fresh in the cache or not modified upstream - nothing to swap
+                continue
+            try:
+                self._publish_overlay_file(new_path, overlay['path'])
+            except OSError as e:
+                logger.warning("⚠️  Failed to publish refreshed overlay '%s': %s", asset.name, e)
+                continue
+            overlay['source_path'] = new_path
+            refreshed += 1
 
-        return timed_overlays, old_temp_files, False
+        return refreshed
 
     async def _execute_segment(
         self,
@@ -728,15 +1289,22 @@ class TimelineExecutor:
         video_cue: TimelineCue,
         ffmpeg_manager: FFmpegProcessManager,
         output_urls: list[str],
-        encoding_profile: Optional[EncodingProfile],
+        encoding_profile: EncodingProfile,
         db: Session,
         last_camera_preset: Tuple[Optional[int], Optional[int]],
         timed_overlays: Optional[List[Dict]] = None,
         timeline_duration: float = 0,
-        timeline_loop: bool = False
+        timeline_loop: bool = False,
+        deadline: Optional[float] = None,
+        cameras_by_id: Optional[Dict[int, Camera]] = None,
+        presets_by_id: Optional[Dict[int, Preset]] = None
     ):
         """Execute a single time segment with current video.
 
+        deadline is the event-loop time (loop.time()) at which the segment ends;
+        the tail wait sleeps until then rather than for a fixed duration.
+        Failures propagate to the segment loop, which logs them once.
+
         Overlays are handled by time-based enable expressions in FFmpeg - 
         they were pre-fetched at timeline start and don't trigger restarts.
         
@@ -744,363 +1312,287 @@ class TimelineExecutor:
         the stream running and just move the camera. This shows smooth PTZ
         movement instead of stream interruption.
         """
-        try:
-            if video_cue.action_type == "show_camera":
-                camera_id = video_cue.action_params.get("camera_id")
-                preset_id = video_cue.action_params.get("preset_id")  # Optional
-                
-                if not camera_id:
-                    logger.error(f"Cue {video_cue.id} has no camera_id")
-                    return
-                    
-                # Get camera
-                camera = db.query(Camera).filter(Camera.id == camera_id).first()
-                if not camera:
-                    logger.error(f"Camera {camera_id} not found")
-                    return
-                
-                # Check if this is the same camera as last segment
-                same_camera = (last_camera_preset[0] == camera_id)
-                preset_changed = (last_camera_preset[1] != preset_id)
-                
-                # Get preset info for logging
-                preset = None
-                if preset_id:
-                    preset = db.query(Preset).filter(Preset.id == preset_id).first()
+        log = bind_logger(logger, timeline_id=timeline_id, cue_id=video_cue.id)
+        if video_cue.action_type == "show_camera":
+            camera_id, preset_id = _cue_target(video_cue)  # preset is optional
+            
+            if not camera_id:
+                log.error("Cue %s has no camera_id", video_cue.id)
+                return
                 
-                # Determine if we need to restart FFmpeg
-                # Only restart if: camera changed OR stream not running
-                # NOTE: Overlays use time-based enables in FFmpeg - no restart needed!
-                # Check BOTH presence AND status - stream may exist but be STOPPED (e.g., by watchdog)
-                stream_proc = ffmpeg_manager.processes.get(timeline_id)
-                stream_running = (stream_proc is not None and 
-                                  stream_proc.status == StreamStatus.RUNNING)
-                needs_restart = (not same_camera) or (not stream_running)
-                logger.debug("FFmpeg restart decision: seg_start=%s, same_camera=%s, stream_running=%s, needs_restart=%s",
-                             seg_start, same_camera, stream_running, needs_restart)
+            # Get camera
+            camera = (cameras_by_id or {}).get(camera_id)
+            if camera is None:
+                camera = await asyncio.to_thread(
+                    lambda: db.query(Camera).filter(Camera.id == camera_id).first()
+                )
+            if not camera:
+                log.error("Camera %s not found", camera_id)
+                return
+            log = log.bind(camera=camera.name)
+            
+            # Check if this is the same camera as last segment
+            same_camera = (last_camera_preset[0] == camera_id)
+            preset_changed = (last_camera_preset[1] != preset_id)
+            
+            # Same (camera, preset) as the last segment: the camera is already in
+            # position, so skip the preset lookup and credential decrypt entirely
+            ptz_unchanged = (last_camera_preset == (camera_id, preset_id))
+            preset = None
+            if preset_id and not ptz_unchanged:
+                preset = (presets_by_id or {}).get(preset_id)
+                if preset is None:
+                    preset = await asyncio.to_thread(
+                        lambda: db.query(Preset).filter(Preset.id == preset_id).first()
+                    )
+            elif preset_id:
+                log.debug("PTZ unchanged (camera %s, preset %s), skipping move", camera_id, preset_id)
+            
+            # Determine if we need to restart FFmpeg
+            # Only restart if: camera changed OR stream not running
+            # NOTE: Overlays use time-based enables in FFmpeg - no restart needed!
+            # Check BOTH presence AND status - stream may exist but be STOPPED (e.g., by watchdog)
+            stream_proc = ffmpeg_manager.processes.get(timeline_id)
+            stream_running = (stream_proc is not None and 
+                              stream_proc.status == StreamStatus.RUNNING)
+            needs_restart = (not same_camera) or (not stream_running)
+            debug_enabled = log.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                log.debug("FFmpeg restart decision: seg_start=%s, same_camera=%s, stream_running=%s, needs_restart=%s",
+                          seg_start, same_camera, stream_running, needs_restart)
+            
+            # If preset specified and changed, move camera.
+            # Same camera: move DURING the running stream (viewers see the movement).
+            # Camera changed: move WHILE the new FFmpeg stream connects, joined below.
+            ptz_task: Optional[asyncio.Task] = None
+            if preset_id and preset and preset_changed:
+                # Get camera credentials (decrypted once per camera configuration)
+                password, _ = self._camera_connection(camera)
                 
-                # If preset specified and changed, move camera
-                # Do this BEFORE restarting stream if camera changed, or DURING stream if same camera
-                if preset_id and preset and preset_changed:
-                    # Get camera credentials
-                    password = None
-                    if camera.password_enc:
-                        try:
-                            password = decrypt(camera.password_enc)
-                        except Exception as e:
-                            logger.error(f"Failed to decrypt camera password: {e}")
-                    
-                    if password:
-                        if same_camera and stream_running:
-                            # Same camera, stream running - move PTZ while streaming (shows movement!)
-                            logger.info(f"🎬 Moving camera {camera.name} to preset '{preset.name}' (viewers will see movement)")
-                        else:
-                            logger.info(f"🎯 Moving camera {camera.name} to preset '{preset.name}'")
-                        
-                        # Use configured ONVIF port for PTZ control
-                        ptz_service = get_ptz_service()
-                        pan = preset.pan if preset.pan is not None else 0.0
-                        tilt = preset.tilt if preset.tilt is not None else 0.0
-                        zoom = preset.zoom if preset.zoom is not None else 1.0
-                        try:
-                            success = await ptz_service.move_to_preset(
-                                address=camera.address,
-                                port=camera.onvif_port,
-                                username=camera.username,
-                                password=password,
-                                preset_token=preset.camera_preset_token or str(preset_id),
-                                pan=pan,
-                                tilt=tilt,
-                                zoom=zoom,
-                            )
-                           
-                            if success:
-                                logger.info(
-                                    "✅ Camera moved to preset '%s' (pan=%s, tilt=%s, zoom=%s)",
-                                    preset.name,
-                                    pan,
-                                    tilt,
-                                    zoom,
-                                )
-                            else:
-                                logger.warning(f"⚠️  Failed to move camera to preset, continuing anyway")
-                        except Exception as e:
-                            logger.error(f"❌ Error moving camera to preset: {e}")
-                            # Continue anyway - don't fail the whole timeline
+                if password:
+                    if same_camera and stream_running:
+                        # Same camera, stream running - move PTZ while streaming (shows movement!)
+                        log.info("🎬 Moving camera %s to preset '%s' (viewers will see movement)", camera.name, preset.name)
                     else:
-                        logger.warning(f"⚠️  No camera credentials available for PTZ control")
-                
-                # Build RTSP URL
-                rtsp_url = self._build_rtsp_url(camera)
-                preset_info = f" at preset '{preset.name}'" if preset_id and preset else ""
-                logger.info(f"🎬 Segment streaming from camera {camera.name}{preset_info} for {duration}s")
-                logger.debug(f"RTSP URL: {rtsp_url}")
-                logger.debug(f"Output URLs: {output_urls}")
-                
-                # Only restart FFmpeg if needed
-                if needs_restart:
-                    # Backoff on rapid failures (FFmpeg dying within seconds of start)
-                    # Prevents tight restart loops when internet is down or broadcast is stale
-                    rapid_failures = self._ffmpeg_rapid_failures.get(timeline_id, 0)
-                    if rapid_failures > 0:
-                        # Exponential backoff: 10s, 20s, 40s, 60s, 60s, ...
-                        backoff = min(10 * (2 ** (rapid_failures - 1)), 60)
-                        logger.warning(
-                            f"⏳ FFmpeg rapid failure backoff: waiting {backoff}s before retry "
-                            f"(failure #{rapid_failures} for timeline {timeline_id})"
+                        log.info("🎯 Moving camera %s to preset '%s'", camera.name, preset.name)
+                    ptz_task = asyncio.create_task(
+                        self._move_camera_to_preset(log, camera, preset, preset_id, password)
+                    )
+                    if not needs_restart:
+                        await ptz_task
+                else:
+                    log.warning("⚠️  No camera credentials available for PTZ control")
+            
+            # Build RTSP URL
+            rtsp_url = self._build_rtsp_url(camera)
+            if log.isEnabledFor(logging.INFO):
+                preset_info = f" at preset '{preset.name}'" if preset else (f" at preset #{preset_id}" if preset_id else "")
+                log.info("🎬 Segment streaming from camera %s%s for %ss", camera.name, preset_info, duration)
+            if debug_enabled:
+                log.debug("RTSP URL: %s", rtsp_url)
+                log.debug("Output URLs: %s", output_urls)
+            
+            # Only restart FFmpeg if needed
+            if needs_restart:
+                # Backoff on rapid failures (FFmpeg dying within seconds of start)
+                # Prevents tight restart loops when internet is down or broadcast is stale
+                state = self.state.get(timeline_id)
+                rapid_failures = state.rapid_failures if state is not None else 0
+                if rapid_failures > 0:
+                    # Exponential backoff: 10s, 20s, 40s, 60s, 60s, ...
+                    backoff = min(10 * (2 ** (rapid_failures - 1)), 60)
+                    log.warning(
+                        "⏳ FFmpeg rapid failure backoff: waiting %ss before retry "
+                        "(failure #%d for timeline %s)",
+                        backoff, rapid_failures, timeline_id,
+                    )
+                    # Use shutdown event so we can still be cancelled during backoff
+                    try:
+                        await asyncio.wait_for(
+                            self._shutdown_event.wait(),
+                            timeout=backoff
                         )
-                        # Use shutdown event so we can still be cancelled during backoff
-                        try:
-                            await asyncio.wait_for(
-                                self._shutdown_event.wait(),
-                                timeout=backoff
-                            )
-                            # If we get here, shutdown was requested during backoff
-                            return
-                        except asyncio.TimeoutError:
-                            # Backoff completed, proceed with restart
-                            pass
-
-                    # SEAMLESS HANDOFF: Start new stream BEFORE stopping old
-                    # This eliminates viewer buffering during camera switches
-                    overlay_info = f" with {len(timed_overlays)} timed overlay(s)" if timed_overlays else ""
-
-                    if stream_running:
-                        # Use a temporary stream ID for the new stream
-                        temp_stream_id = timeline_id + 1000000
-                        reason = "camera changed"
-                        logger.info(f"🔄 Seamless handoff: {reason} - starting new stream before stopping old")
-                        
-                        try:
-                            # Step 1: Start NEW stream with temporary ID
-                            logger.info(f"▶️  Starting NEW FFmpeg stream (temp ID {temp_stream_id}) with camera {camera.name}{overlay_info}")
-                            await asyncio.wait_for(
-                                ffmpeg_manager.start_stream(
-                                    stream_id=temp_stream_id,
-                                    input_url=rtsp_url,
-                                    output_urls=output_urls,
-                                    profile=encoding_profile or EncodingProfile.reliability_profile(
-                                        ffmpeg_manager.hw_capabilities
-                                    ),
-                                    timed_overlays=timed_overlays,
-                                    timeline_duration=timeline_duration,
-                                    timeline_loop=timeline_loop
-                                ),
-                                timeout=30.0  # Reduced timeout for faster handoff
-                            )
-                            logger.info(f"✅ New FFmpeg stream {temp_stream_id} started, now stopping old stream")
-                            
-                            # Step 2: Stop OLD stream (while new one is already running)
-                            try:
-                                logger.debug(f"Stopping old stream {timeline_id}...")
-                                ffmpeg_manager.unregister_stream_died_callback(timeline_id)
-                                await asyncio.wait_for(
-                                    ffmpeg_manager.stop_stream(timeline_id),
-                                    timeout=10.0  # Quick stop since new stream is already running
-                                )
-                                logger.info(f"✅ Old stream {timeline_id} stopped")
-                            except asyncio.TimeoutError:
-                                logger.warning(f"Timeout stopping old FFmpeg - forcing kill")
-                                try:
-                                    if timeline_id in ffmpeg_manager.processes:
-                                        stream_proc_old = ffmpeg_manager.processes[timeline_id]
-                                        if stream_proc_old.process:
-                                            stream_proc_old.process.kill()
-                                            await stream_proc_old.process.wait()
-                                        stream_proc_old.process = None
-                                except Exception:
-                                    pass
-                            except KeyError:
-                                pass  # Already stopped
-                            except Exception as e:
-                                logger.warning(f"Error stopping old stream: {e}")
-                            
-                            # Step 3: Re-map the new stream to use the timeline_id
-                            # Move the process entry from temp_stream_id to timeline_id
-                            if temp_stream_id in ffmpeg_manager.processes:
-                                stream_proc = ffmpeg_manager.processes.pop(temp_stream_id)
-                                stream_proc.stream_id = timeline_id  # Update the stream_id field
-                                ffmpeg_manager.processes[timeline_id] = stream_proc
-                                
-                                # Also re-map the monitoring task
-                                if temp_stream_id in ffmpeg_manager._monitoring_tasks:
-                                    ffmpeg_manager._monitoring_tasks[timeline_id] = ffmpeg_manager._monitoring_tasks.pop(temp_stream_id)
-                                
-                                logger.debug(f"Re-mapped stream {temp_stream_id} → {timeline_id}")
-                            
-                            # Register callback for the (now remapped) stream
-                            ffmpeg_manager.register_stream_died_callback(
-                                timeline_id,
-                                self._on_ffmpeg_died
-                            )
-                            self._ffmpeg_start_times[timeline_id] = time.monotonic()
-
-                            logger.info(f"✅ Seamless handoff complete - now streaming from {camera.name}")
-                            
-                        except asyncio.TimeoutError:
-                            logger.error(f"❌ Timeout starting new FFmpeg stream - falling back to standard restart")
-                            # Clean up temp stream if it partially started
-                            try:
-                                if temp_stream_id in ffmpeg_manager.processes:
-                                    await ffmpeg_manager.stop_stream(temp_stream_id)
-                            except:
-                                pass
-                            # Fall back to standard stop-then-start
-                            await self._standard_ffmpeg_restart(
-                                timeline_id, ffmpeg_manager, rtsp_url, output_urls,
-                                encoding_profile, timed_overlays, timeline_duration, timeline_loop,
-                                camera.name, overlay_info
-                            )
-                        except Exception as e:
-                            logger.error(f"❌ Seamless handoff failed: {e} - falling back to standard restart")
-                            # Clean up temp stream if it partially started
-                            try:
-                                if temp_stream_id in ffmpeg_manager.processes:
-                                    await ffmpeg_manager.stop_stream(temp_stream_id)
-                            except:
-                                pass
-                            # Fall back to standard stop-then-start
-                            await self._standard_ffmpeg_restart(
-                                timeline_id, ffmpeg_manager, rtsp_url, output_urls,
-                                encoding_profile, timed_overlays, timeline_duration, timeline_loop,
-                                camera.name, overlay_info
-                            )
-                    else:
-                        # No existing stream - just start normally
-                        logger.info(f"▶️  Starting FFmpeg stream {timeline_id} with camera {camera.name}{overlay_info}")
-                        try:
-                            await asyncio.wait_for(
-                                ffmpeg_manager.start_stream(
-                                    stream_id=timeline_id,
-                                    input_url=rtsp_url,
-                                    output_urls=output_urls,
-                                    profile=encoding_profile or EncodingProfile.reliability_profile(
-                                        ffmpeg_manager.hw_capabilities
-                                    ),
-                                    timed_overlays=timed_overlays,
-                                    timeline_duration=timeline_duration,
-                                    timeline_loop=timeline_loop
-                                ),
-                                timeout=60.0
-                            )
-                            logger.info(f"✅ FFmpeg stream {timeline_id} started successfully")
-                            self._ffmpeg_start_times[timeline_id] = time.monotonic()
-
-                            # Register callback to detect when FFmpeg dies
-                            ffmpeg_manager.register_stream_died_callback(
-                                timeline_id,
-                                self._on_ffmpeg_died
-                            )
-                        except asyncio.TimeoutError:
-                            logger.error(f"❌ Timeout starting FFmpeg stream {timeline_id}")
-                            raise RuntimeError(f"Timeout starting FFmpeg stream {timeline_id}")
-                        except Exception as e:
-                            logger.error(f"❌ Failed to start FFmpeg stream {timeline_id}: {e}")
-                            traceback.print_exc()
-                            raise
+                        # If we get here, shutdown was requested during backoff
+                        return
+                    except asyncio.TimeoutError:
+                        # Backoff completed, proceed with restart
+                        pass
+
+                # SEAMLESS HANDOFF: Start new stream BEFORE stopping old
+                # This eliminates viewer buffering during camera switches
+                overlay_info = f" with {len(timed_overlays)} timed overlay(s)" if timed_overlays else ""
+
+                if stream_running:
+                    reason = "camera changed"
+                    log.info("🔄 Seamless handoff: %s - starting new stream before stopping old", reason)
                     
-                    # Notify watchdog manager about the stream (whether seamless or standard)
                     try:
-                        from services.watchdog_manager import get_watchdog_manager
-                        from models.destination import StreamingDestination
+                        # Start the new stream alongside the old one; the manager
+                        # swaps it in under timeline_id and stops the old process
+                        log.info("▶️  Starting NEW FFmpeg stream with camera %s%s", camera.name, overlay_info)
+                        handoff_started = time.monotonic()
+                        new_stream = await asyncio.wait_for(
+                            ffmpeg_manager.start_stream(
+                                stream_id=timeline_id,
+                                input_url=rtsp_url,
+                                output_urls=output_urls,
+                                profile=encoding_profile,
+                                timed_overlays=timed_overlays,
+                                timeline_duration=timeline_duration,
+                                timeline_loop=timeline_loop,
+                                replace=True
+                            ),
+                            timeout=30.0  # Reduced timeout for faster handoff
+                        )
+                        # start_stream(replace=True) returns once the new process
+                        # produced its first frame, so this is the real switch
+                        # latency (not just the spawn); a first-frame timeout
+                        # measures nothing and keeps the previous lead
+                        state = self.state.get(timeline_id)
+                        if state is not None and new_stream.first_frame.is_set():
+                            state.switch_lead = min(time.monotonic() - handoff_started, MAX_SWITCH_LEAD)
                         
-                        watchdog_manager = get_watchdog_manager()
+                        ffmpeg_manager.register_stream_died_callback(
+                            timeline_id,
+                            self._on_ffmpeg_died
+                        )
+                        self._mark_ffmpeg_started(timeline_id)
+
+                        log.info("✅ Seamless handoff complete - now streaming from %s", camera.name)
                         
-                        dest_ids = []
-                        dest_db = SessionLocal()
-                        try:
-                            for output_url in output_urls:
-                                destinations = dest_db.query(StreamingDestination).all()
-                                for dest in destinations:
-                                    if dest.get_full_rtmp_url() == output_url:
-                                        dest_ids.append(dest.id)
-                                        break
-                            
-                            if dest_ids:
-                                await watchdog_manager.notify_stream_started(
-                                    destination_ids=dest_ids,
-                                    stream_id=timeline_id,
-                                    db_session=dest_db
-                                )
-                                logger.info(f"🐕 Notified watchdog manager: stream {timeline_id} → destinations {dest_ids}")
-                        finally:
-                            dest_db.close()
                     except Exception as e:
-                        logger.warning(f"Failed to notify watchdog manager: {e}")
+                        if isinstance(e, asyncio.TimeoutError):
+                            log.error("❌ Timeout starting new FFmpeg stream - falling back to standard restart")
+                        else:
+                            log.error("❌ Seamless handoff failed: %s - falling back to standard restart", e)
+                        # Fall back to standard stop-then-start
+                        await self._standard_ffmpeg_restart(
+                            timeline_id, ffmpeg_manager, rtsp_url, output_urls,
+                            encoding_profile, timed_overlays, timeline_duration, timeline_loop,
+                            camera.name, overlay_info
+                        )
                 else:
-                    # Same camera, same overlays - just log that we're continuing
-                    logger.info(f"📹 Continuing stream (same camera, preset changed to '{preset.name if preset else 'none'}')")
+                    # No existing stream - just start normally
+                    log.info("▶️  Starting FFmpeg stream %s with camera %s%s", timeline_id, camera.name, overlay_info)
+                    try:
+                        await asyncio.wait_for(
+                            ffmpeg_manager.start_stream(
+                                stream_id=timeline_id,
+                                input_url=rtsp_url,
+                                output_urls=output_urls,
+                                profile=encoding_profile,
+                                timed_overlays=timed_overlays,
+                                timeline_duration=timeline_duration,
+                                timeline_loop=timeline_loop
+                            ),
+                            timeout=60.0
+                        )
+                        log.info("✅ FFmpeg stream %s started successfully", timeline_id)
+                        self._mark_ffmpeg_started(timeline_id)
+
+                        # Register callback to detect when FFmpeg dies
+                        ffmpeg_manager.register_stream_died_callback(
+                            timeline_id,
+                            self._on_ffmpeg_died
+                        )
+                    except asyncio.TimeoutError:
+                        # Logged once, by the segment loop
+                        raise RuntimeError(f"Timeout starting FFmpeg stream {timeline_id}")
                 
-                logger.info(f"⏱️  Waiting {duration}s for segment to complete...")
+                # Notify watchdog manager about the stream (whether seamless or standard).
+                # Best-effort, so it runs in the background instead of delaying the segment.
+                state = self.state.get(timeline_id)
+                if state is not None:
+                    if state.notify_task is not None:
+                        state.notify_task.cancel()
+                    state.notify_task = asyncio.create_task(
+                        self._notify_watchdog_async(timeline_id, output_urls)
+                    )
 
-                # ShortForge: capture clip + snapshot while camera is at this preset.
-                # Clip capture is synchronous (awaited) so it completes before we move on.
-                # ShortForge: clip capture + snapshot (with hard timeout so it can't stall the timeline)
-                sf_time = 0
-                _sf_enabled = False
+                # Join the PTZ move that overlapped the stream start (it logs its own
+                # failures; if the start raised, the move simply finishes on its own)
+                if ptz_task is not None:
+                    await ptz_task
+            else:
+                # Same camera, same overlays - just log that we're continuing
+                log.info("📹 Continuing stream (same camera, preset changed to '%s')", preset.name if preset else 'none')
+            
+            log.info("⏱️  Waiting %ss for segment to complete...", duration)
+
+            # ShortForge: capture clip + snapshot while camera is at this preset.
+            # Clip capture is synchronous (awaited) so it completes before we move on.
+            # ShortForge: clip capture + snapshot (with hard timeout so it can't stall the timeline)
+            sf_time = 0
+            _sf_enabled = False
+            if preset_id and camera.snapshot_url:
+                # Off the event loop like the camera/preset lookups; segments that
+                # can't capture anything don't query at all
                 try:
                     from models.shortforge import ShortForgeConfig as _SFC
-                    _sf_cfg = db.query(_SFC).first()
+                    _sf_cfg = await asyncio.to_thread(lambda: db.query(_SFC).first())
                     _sf_enabled = bool(_sf_cfg and _sf_cfg.enabled)
                 except Exception:
                     pass
-                if preset_id and camera.snapshot_url and _sf_enabled:
+            if preset_id and camera.snapshot_url and _sf_enabled:
+                try:
+                    from services.shortforge.clip_capture import get_clip_capture
+                    sf_capture = get_clip_capture()
+                    _enhance = _sf_cfg.image_enhance or "vivid"
+                    if _enhance == "ai_enhance":
+                        # AI enhance is slow (~30s API call) — grab snapshot now, process in background
+                        await asyncio.wait_for(
+                            sf_capture.capture_snapshot_only(preset_id, camera.snapshot_url),
+                            timeout=10
+                        )
+                        asyncio.create_task(sf_capture.process_snapshot_to_clip(preset_id, enhance=_enhance, duration=15))
+                    else:
+                        await asyncio.wait_for(
+                            sf_capture.capture_for_preset(preset_id, camera.snapshot_url, duration=15, enhance=_enhance),
+                            timeout=30
+                        )
+                    sf_time = 3  # snapshot capture is fast, only a few seconds
+                except asyncio.TimeoutError:
+                    log.warning("ShortForge clip capture timed out for preset %d", preset_id)
+                except Exception:
+                    log.exception("ShortForge clip capture failed")
+
+                # Snapshot for moment detection
+                if camera.snapshot_url:
                     try:
-                        from services.shortforge.clip_capture import get_clip_capture
-                        sf_capture = get_clip_capture()
-                        _enhance = _sf_cfg.image_enhance or "vivid"
-                        if _enhance == "ai_enhance":
-                            # AI enhance is slow (~30s API call) — grab snapshot now, process in background
-                            await asyncio.wait_for(
-                                sf_capture.capture_snapshot_only(preset_id, camera.snapshot_url),
-                                timeout=10
-                            )
-                            asyncio.create_task(sf_capture.process_snapshot_to_clip(preset_id, enhance=_enhance, duration=15))
-                        else:
-                            await asyncio.wait_for(
-                                sf_capture.capture_for_preset(preset_id, camera.snapshot_url, duration=15, enhance=_enhance),
-                                timeout=30
-                            )
-                        sf_time = 3  # snapshot capture is fast, only a few seconds
-                    except asyncio.TimeoutError:
-                        logger.warning("ShortForge clip capture timed out for preset %d", preset_id)
+                        from services.shortforge.moment_detector import get_moment_detector
+                        sf_detector = get_moment_detector()
+                        await sf_detector.evaluate(
+                            camera_id=camera.id,
+                            preset_id=preset_id,
+                            snapshot_url=camera.snapshot_url,
+                        )
                     except Exception:
-                        logger.exception("ShortForge clip capture failed")
-
-                    # Snapshot for moment detection
-                    if camera.snapshot_url:
-                        try:
-                            from services.shortforge.moment_detector import get_moment_detector
-                            sf_detector = get_moment_detector()
-                            await sf_detector.evaluate(
-                                camera_id=camera.id,
-                                preset_id=preset_id,
-                                snapshot_url=camera.snapshot_url,
-                            )
-                        except Exception:
-                            logger.exception("ShortForge evaluate failed")
-
-                # Wait remaining segment time
-                remaining = max(0, duration - sf_time - 2)
-                if remaining > 0:
-                    await asyncio.sleep(remaining)
-                logger.info(f"✅ Segment at t={seg_start:.2f}s ({camera.name}) completed successfully")
-
-                # Segment completed — FFmpeg survived, reset rapid failure backoff
-                if self._ffmpeg_rapid_failures.get(timeline_id, 0) > 0:
-                    logger.info(f"✅ FFmpeg stable — resetting rapid failure counter for timeline {timeline_id}")
-                    self._ffmpeg_rapid_failures[timeline_id] = 0
-
-                # Update heartbeat for stall detection
-                self._last_segment_time[timeline_id] = datetime.now(timezone.utc)
-                
+                        log.exception("ShortForge evaluate failed")
+
+            # Wait remaining segment time
+            if deadline is not None:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining < 0:
+                    log.warning("⏱️  Segment at t=%.2fs overran its deadline by %.2fs", seg_start, -remaining)
             else:
-                logger.warning("Unsupported action type for video cue")
-                
-        except Exception as e:
-            logger.error(f"❌ Error executing segment at t={seg_start:.2f}s: {e}")
-            traceback.print_exc()
-            raise  # Re-raise the exception to stop timeline execution
+                remaining = duration - sf_time - 2
+            if remaining > 0 and await self._wait_until(asyncio.get_running_loop().time() + remaining):
+                log.info("Shutdown requested during segment at t=%.2fs", seg_start)
+                return
+            log.info("✅ Segment at t=%.2fs (%s) completed successfully", seg_start, camera.name)
+
+            # Segment completed — FFmpeg survived, reset rapid failure backoff
+            state = self.state.get(timeline_id)
+            if state is not None and state.rapid_failures > 0:
+                log.info("✅ FFmpeg stable — resetting rapid failure counter for timeline %s", timeline_id)
+                state.rapid_failures = 0
+
+            # Update heartbeat for stall detection
+            self._mark_progress(timeline_id)
+            
+        else:
+            log.warning("Unsupported action type for video cue")
+            
     
     async def _standard_ffmpeg_restart(
         self,
@@ -1108,7 +1600,7 @@ class TimelineExecutor:
         ffmpeg_manager: FFmpegProcessManager,
         rtsp_url: str,
         output_urls: list[str],
-        encoding_profile: Optional[EncodingProfile],
+        encoding_profile: EncodingProfile,
         timed_overlays: Optional[List[Dict]],
         timeline_duration: float,
         timeline_loop: bool,
@@ -1119,7 +1611,7 @@ class TimelineExecutor:
         Standard stop-then-start FFmpeg restart (fallback when seamless handoff fails).
         This is the original behavior - stops old stream, then starts new one.
         """
-        logger.info(f"🔄 Standard FFmpeg restart for timeline {timeline_id}")
+        logger.info("🔄 Standard FFmpeg restart for timeline %s", timeline_id)
         
         # Stop existing stream
         try:
@@ -1129,7 +1621,7 @@ class TimelineExecutor:
                 timeout=30.0
             )
         except asyncio.TimeoutError:
-            logger.error(f"Timeout stopping FFmpeg for timeline {timeline_id} - forcing kill")
+            logger.error("Timeout stopping FFmpeg for timeline %s - forcing kill", timeline_id)
             try:
                 if timeline_id in ffmpeg_manager.processes:
                     proc = ffmpeg_manager.processes[timeline_id].process
@@ -1140,26 +1632,24 @@ class TimelineExecutor:
         except KeyError:
             pass  # Not running
         except Exception as e:
-            logger.error(f"Error stopping stream: {e}")
+            logger.error("Error stopping stream: %s", e)
         
         # Start new stream
-        logger.info(f"▶️  Starting FFmpeg stream {timeline_id} with camera {camera_name}{overlay_info}")
+        logger.info("▶️  Starting FFmpeg stream %s with camera %s%s", timeline_id, camera_name, overlay_info)
         await asyncio.wait_for(
             ffmpeg_manager.start_stream(
                 stream_id=timeline_id,
                 input_url=rtsp_url,
                 output_urls=output_urls,
-                profile=encoding_profile or EncodingProfile.reliability_profile(
-                    ffmpeg_manager.hw_capabilities
-                ),
+                profile=encoding_profile,
                 timed_overlays=timed_overlays,
                 timeline_duration=timeline_duration,
                 timeline_loop=timeline_loop
             ),
             timeout=60.0
         )
-        logger.info(f"✅ FFmpeg stream {timeline_id} started successfully")
-        self._ffmpeg_start_times[timeline_id] = time.monotonic()
+        logger.info("✅ FFmpeg stream %s started successfully", timeline_id)
+        self._mark_ffmpeg_started(timeline_id)
 
         # Register callback
         ffmpeg_manager.register_stream_died_callback(
@@ -1167,38 +1657,7 @@ class TimelineExecutor:
             self._on_ffmpeg_died
         )
             
-    async def _update_position_during_cue(
-        self,
-        timeline_id: int,
-        cue: TimelineCue,
-        cue_index: int,
-        total_cues: int,
-        loop_count: int,
-        duration: float
-    ):
-        """Continuously update playback position during cue execution"""
-        start_time = datetime.now(timezone.utc)
-        
-        try:
-            while True:
-                elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
-                current_time = cue.start_time + min(elapsed, duration)
-                
-                self.playback_positions[timeline_id] = {
-                    "current_time": current_time,
-                    "current_cue_id": cue.id,
-                    "current_cue_index": cue_index,
-                    "loop_count": loop_count,
-                    "total_cues": total_cues,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-                
-                await asyncio.sleep(0.5)  # Update every 500ms
-                
-        except asyncio.CancelledError:
-            pass
-
-    async def _update_position_during_segment(
+    def _begin_segment_position(
         self,
         timeline_id: int,
         start_time: float,
@@ -1208,37 +1667,46 @@ class TimelineExecutor:
         total_cues: int,
         loop_count: int,
     ):
-        """Continuously update playback position during a segment.
+        """Publish the playback position for a segment that is starting now.
 
-        Mirrors the cue-based updater but uses an explicit start_time/duration.
+        The position dict is created once per segment; get_playback_position
+        derives the elapsed time from _segment_clock on read, so nothing ticks.
         """
-        seg_start = datetime.now(timezone.utc)
-        try:
-            while True:
-                elapsed = (datetime.now(timezone.utc) - seg_start).total_seconds()
-                current_time = start_time + min(elapsed, duration)
-                self.playback_positions[timeline_id] = {
-                    "current_time": current_time,
-                    "current_cue_id": current_cue_id,
-                    "current_cue_index": current_cue_index,
-                    "loop_count": loop_count,
-                    "total_cues": total_cues,
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-                await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            pass
-    
-    def _build_rtsp_url(self, camera: Camera) -> str:
-        """Build RTSP URL for a camera"""
+        self._segment_clock[timeline_id] = (time.monotonic(), start_time, duration)
+        self.playback_positions[timeline_id] = {
+            "current_time": start_time,
+            "current_cue_id": current_cue_id,
+            "current_cue_index": current_cue_index,
+            "loop_count": loop_count,
+            "total_cues": total_cues,
+            "updated_at": time.time()  # Epoch seconds; formatted on read
+        }
+
+    def _camera_connection(self, camera: Camera) -> Tuple[Optional[str], str]:
+        """Return (decrypted password, RTSP URL) for a camera.
+
+        Cached per camera id and keyed by the connection fields, so the Fernet
+        decrypt runs once per camera configuration rather than per segment.
+        """
+        key = (camera.address, camera.port, camera.username, camera.password_enc, camera.stream_path)
+        cached = self._camera_cache.get(camera.id)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
         password = None
         if camera.password_enc:
             try:
                 password = decrypt(camera.password_enc)
-            except Exception:
-                pass
+            except Exception as e:
+                logger.error("Failed to decrypt password for camera %s: %s", camera.id, e)
 
-        return build_rtsp_url(camera.address, camera.port, camera.username, password, camera.stream_path)
+        rtsp_url = build_rtsp_url(camera.address, camera.port, camera.username, password, camera.stream_path)
+        self._camera_cache[camera.id] = (key, password, rtsp_url)
+        return password, rtsp_url
+
+    def _build_rtsp_url(self, camera: Camera) -> str:
+        """Build RTSP URL for a camera"""
+        return self._camera_connection(camera)[1]
 
 
 # Global instance
@@ -1254,6 +1722,20 @@ def get_timeline_executor() -> TimelineExecutor:
 
 
 def get_playback_position(timeline_id: int) -> Optional[dict]:
-    """Get current playback position for a timeline"""
+    """Get current playback position for a timeline (updated_at as ISO-8601)
+
+    current_time is computed on demand from the segment clock, clamped to the
+    segment end until the next segment begins.
+    """
     executor = get_timeline_executor()
-    return executor.playback_positions.get(timeline_id)
+    position = executor.playback_positions.get(timeline_id)
+    if position is None:
+        return None
+    position = dict(position)
+    clock = executor._segment_clock.get(timeline_id)
+    if clock is not None:
+        began, start_time, duration = clock
+        position["current_time"] = start_time + min(time.monotonic() - began, duration)
+        position["updated_at"] = time.time()
+    position["updated_at"] = datetime.fromtimestamp(position["updated_at"], timezone.utc).isoformat()
+    return position
@@ -5,7 +5,8 @@ Manages multiple stream watchdog instances, one per destination
 
 import asyncio
 import logging
-from typing import Dict, Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List, Set
 from sqlalchemy.orm import Session
 
 from services.local_stream_watchdog import LocalStreamWatchdog
@@ -26,6 +27,8 @@ class WatchdogManager:
         """Initialize watchdog manager"""
         self.watchdogs: Dict[int, LocalStreamWatchdog] = {}
         self.watchdog_tasks: Dict[int, asyncio.Task] = {}
+        # stream_id -> destination IDs whose watchdog monitors that stream
+        self._stream_to_dests: Dict[int, Set[int]] = defaultdict(set)
         self.running = False
     
     async def start(self, db_session: Session):
@@ -47,34 +50,43 @@ class WatchdogManager:
         
         # Try to start watchdogs for each destination
         # Note: Watchdogs will only start if a stream is actually running to that destination
+        from services.timeline_executor import get_timeline_executor
+        url_map = get_timeline_executor().ffmpeg_manager.get_url_to_stream_map()
         for dest in destinations:
-            await self.start_watchdog(dest)  # stream_id will be auto-detected
+            await self.start_watchdog(dest, url_map=url_map)  # stream_id will be auto-detected
         
         logger.info("Watchdog Manager started successfully")
     
-    async def start_watchdog(self, destination: StreamingDestination, stream_id: Optional[int] = None):
+    async def start_watchdog(
+        self,
+        destination: StreamingDestination,
+        stream_id: Optional[int] = None,
+        url_map: Optional[Dict[str, int]] = None
+    ):
         """
         Start watchdog for a specific destination stream
         
         Args:
             destination: Destination to monitor
             stream_id: ID of the stream to monitor (auto-detected if None)
+            url_map: Destination URL -> stream ID snapshot from
+                get_url_to_stream_map(), used for auto-detection when starting
+                many watchdogs at once
         """
         dest_id = destination.id
         
         # Auto-detect stream_id if not provided
         if stream_id is None:
-            # Use the FFmpegProcessManager from timeline_executor (not a new instance!)
-            from services.timeline_executor import get_timeline_executor
-            executor = get_timeline_executor()
             destination_url = destination.get_full_rtmp_url()
-            
-            # Search through all active FFmpeg managers for this destination
-            for tid, ffmpeg_manager in executor.ffmpeg_managers.items():
-                found_stream_id = ffmpeg_manager.find_stream_by_destination_url(destination_url)
-                if found_stream_id is not None:
-                    stream_id = found_stream_id
-                    break
+            if url_map is not None:
+                stream_id = url_map.get(destination_url)
+            else:
+                # Use the FFmpegProcessManager from timeline_executor (not a new instance!)
+                from services.timeline_executor import get_timeline_executor
+                executor = get_timeline_executor()
+                
+                # All timelines share one FFmpeg manager
+                stream_id = executor.ffmpeg_manager.find_stream_by_destination_url(destination_url)
             
             if stream_id is None:
                 logger.warning(
@@ -107,10 +119,12 @@ class WatchdogManager:
             
             # Store instance
             self.watchdogs[dest_id] = watchdog
+            self._stream_to_dests[stream_id].add(dest_id)
             
             # Start watchdog in background task
             task = asyncio.create_task(watchdog.start())
             self.watchdog_tasks[dest_id] = task
+            task.add_done_callback(lambda t, did=dest_id: self._on_watchdog_done(did, t))
             
             logger.info(f"Started local watchdog for destination {dest_id} ({destination.name}) monitoring stream {stream_id}")
             
@@ -129,12 +143,17 @@ class WatchdogManager:
             return
         
         try:
-            # Stop the watchdog
+            # Remove from tracking first: this check-and-remove has no await in
+            # between, so a concurrent start_watchdog for the same destination
+            # either sees the old entry gone or none of it
             watchdog = self.watchdogs[destination_id]
+            task = self.watchdog_tasks.get(destination_id)
+            self._forget_watchdog(destination_id, watchdog)
+            
+            # Stop the watchdog
             watchdog.stop()
             
             # Cancel the task
-            task = self.watchdog_tasks.get(destination_id)
             if task and not task.done():
                 task.cancel()
                 try:
@@ -142,16 +161,47 @@ class WatchdogManager:
                 except asyncio.CancelledError:
                     pass
             
-            # Remove from tracking
-            del self.watchdogs[destination_id]
-            if destination_id in self.watchdog_tasks:
-                del self.watchdog_tasks[destination_id]
-            
             logger.info(f"Stopped watchdog for destination {destination_id}")
             
         except Exception as e:
             logger.error(f"Error stopping watchdog for destination {destination_id}: {e}", exc_info=True)
     
+    def _forget_watchdog(self, destination_id: int, watchdog: LocalStreamWatchdog):
+        """Drop a watchdog from all tracking structures"""
+        if self.watchdogs.get(destination_id) is watchdog:
+            del self.watchdogs[destination_id]
+            self.watchdog_tasks.pop(destination_id, None)
+        dest_ids = self._stream_to_dests.get(watchdog.stream_id)
+        if dest_ids is not None:
+            dest_ids.discard(destination_id)
+            if not dest_ids:
+                del self._stream_to_dests[watchdog.stream_id]
+    
+    def _on_watchdog_done(self, destination_id: int, task: asyncio.Task):
+        """
+        Clean up after a watchdog task ends on its own
+        
+        A watchdog that dies outside stop_watchdog would otherwise stay in
+        self.watchdogs and block a restart for its destination.
+        """
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                f"Watchdog for destination {destination_id} failed: {task.exception()}",
+                exc_info=task.exception()
+            )
+        if self.watchdog_tasks.get(destination_id) is task:
+            self._forget_watchdog(destination_id, self.watchdogs[destination_id])
+    
+    async def _stop_watchdogs(self, destination_ids):
+        """
+        Stop several watchdogs concurrently
+        
+        Each stop waits for its task to unwind, so stopping them one by one
+        costs the sum of those waits; start_watchdog never awaits and needs no
+        fan-out.
+        """
+        await asyncio.gather(*(self.stop_watchdog(dest_id) for dest_id in destination_ids))
+    
     async def restart_watchdog(self, destination: StreamingDestination, stream_id: Optional[int] = None):
         """
         Restart watchdog for a destination
@@ -160,8 +210,8 @@ class WatchdogManager:
             destination: Destination to restart watchdog for
             stream_id: ID of the stream to monitor (auto-detected if None)
         """
+        # stop_watchdog returns only once the old task has run its cleanup
         await self.stop_watchdog(destination.id)
-        await asyncio.sleep(1)
         await self.start_watchdog(destination, stream_id)
     
     async def reload_from_db(self, db_session: Session):
@@ -182,21 +232,31 @@ class WatchdogManager:
             StreamingDestination.is_active == True
         ).all()
         
-        enabled_ids = {dest.id for dest in enabled_destinations if hasattr(dest, 'active_stream_id') and dest.active_stream_id}
+        # Resolve each destination's active stream once, from the running FFmpeg processes
+        from services.timeline_executor import get_timeline_executor
+        url_map = get_timeline_executor().ffmpeg_manager.get_url_to_stream_map()
+        active_streams: Dict[int, int] = {}
+        dest_by_id: Dict[int, StreamingDestination] = {}
+        for dest in enabled_destinations:
+            stream_id = url_map.get(dest.get_full_rtmp_url())
+            if stream_id is not None:
+                active_streams[dest.id] = stream_id
+                dest_by_id[dest.id] = dest
+        enabled_ids = dest_by_id.keys()
         running_ids = set(self.watchdogs.keys())
         
         # Stop watchdogs that should no longer run
         to_stop = running_ids - enabled_ids
         for dest_id in to_stop:
             logger.info(f"Stopping watchdog for destination {dest_id} (no longer enabled or no active stream)")
-            await self.stop_watchdog(dest_id)
+        await self._stop_watchdogs(to_stop)
         
         # Start new watchdogs
         to_start = enabled_ids - running_ids
-        for dest in enabled_destinations:
-            if dest.id in to_start and hasattr(dest, 'active_stream_id') and dest.active_stream_id:
-                logger.info(f"Starting new watchdog for destination {dest.id} ({dest.name})")
-                await self.start_watchdog(dest, dest.active_stream_id)
+        for dest_id in to_start:
+            dest = dest_by_id[dest_id]
+            logger.info(f"Starting new watchdog for destination {dest.id} ({dest.name})")
+            await self.start_watchdog(dest, active_streams[dest_id])
         
         logger.info("Watchdog configuration reload complete")
     
@@ -210,23 +270,14 @@ class WatchdogManager:
         Returns:
             Status dictionary
         """
-        if destination_id not in self.watchdogs:
+        watchdog = self.watchdogs.get(destination_id)
+        if watchdog is None:
             return {
                 "running": False,
                 "message": "Watchdog not running"
             }
         
-        watchdog = self.watchdogs[destination_id]
-        health_state = watchdog.health_state
-        
-        return {
-            "running": True,
-            "consecutive_unhealthy": health_state.consecutive_unhealthy,
-            "last_healthy_time": health_state.last_healthy_time.isoformat() if health_state.last_healthy_time else None,
-            "last_recovery_time": health_state.last_recovery_time.isoformat() if health_state.last_recovery_time else None,
-            "recovery_count": health_state.recovery_count,
-            "check_interval": watchdog.check_interval
-        }
+        return watchdog.status()
     
     def get_all_statuses(self) -> Dict[int, Dict]:
         """
@@ -236,8 +287,8 @@ class WatchdogManager:
             Dictionary mapping destination_id to status
         """
         return {
-            dest_id: self.get_watchdog_status(dest_id)
-            for dest_id in self.watchdogs.keys()
+            dest_id: watchdog.status()
+            for dest_id, watchdog in self.watchdogs.items()
         }
     
     def notify_intentional_restart(self, stream_id: int, duration_seconds: int = 30):
@@ -249,9 +300,8 @@ class WatchdogManager:
             stream_id: Stream being intentionally restarted
             duration_seconds: How long to suppress checks
         """
-        for dest_id, watchdog in self.watchdogs.items():
-            if watchdog.stream_id == stream_id:
-                watchdog.suppress_checks(duration_seconds)
+        for dest_id in self._stream_to_dests.get(stream_id, ()):
+            self.watchdogs[dest_id].suppress_checks(duration_seconds)
 
     async def notify_stream_started(self, destination_ids: List[int], stream_id: int, db_session: Session):
         """
@@ -265,11 +315,15 @@ class WatchdogManager:
         """
         logger.info(f"Stream {stream_id} started to {len(destination_ids)} destination(s)")
         
+        # Load all destinations in one query
+        destinations = {
+            dest.id: dest for dest in db_session.query(StreamingDestination).filter(
+                StreamingDestination.id.in_(destination_ids)
+            )
+        }
+        
         for dest_id in destination_ids:
-            # Get destination from database
-            destination = db_session.query(StreamingDestination).filter(
-                StreamingDestination.id == dest_id
-            ).first()
+            destination = destinations.get(dest_id)
             
             if not destination:
                 logger.warning(f"Destination {dest_id} not found")
@@ -292,23 +346,15 @@ class WatchdogManager:
         """
         logger.info(f"Stream {stream_id} stopped, stopping associated watchdogs")
         
-        # Find all watchdogs monitoring this stream
-        to_stop = []
-        for dest_id, watchdog in self.watchdogs.items():
-            if watchdog.stream_id == stream_id:
-                to_stop.append(dest_id)
-        
-        # Stop them
-        for dest_id in to_stop:
-            await self.stop_watchdog(dest_id)
+        # Stop all watchdogs monitoring this stream
+        await self._stop_watchdogs(list(self._stream_to_dests.get(stream_id, ())))
     
     async def stop_all(self):
         """Stop all watchdogs"""
         logger.info("Stopping all watchdogs")
         self.running = False
         
-        for dest_id in list(self.watchdogs.keys()):
-            await self.stop_watchdog(dest_id)
+        await self._stop_watchdogs(list(self.watchdogs.keys()))
         
         logger.info("All watchdogs stopped")
     
@@ -9,72 +9,192 @@ Data sources via TempestWeather:
 - Astronomy calculations (moon phase, solunar periods)
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
+import time
 import httpx
 from datetime import datetime
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from zoneinfo import ZoneInfo
 import base64
 
+from sqlalchemy.orm import Session
+
 logger = logging.getLogger(__name__)
 
+# Faster JSON decoding for TempestWeather payloads when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default TempestWeather URL (can be overridden in settings or TEMPEST_API_URL env var)
 DEFAULT_TEMPEST_URL = os.getenv("TEMPEST_API_URL", "http://host.docker.internal:8036")
 
+# How long a TempestWeather response is reused (seconds); conditions change on the order of minutes
+WEATHER_CACHE_TTL = float(os.getenv("WEATHER_CACHE_TTL", "60"))
 
-def get_tempest_api_url() -> str:
-    """Get the TempestWeather API URL from settings"""
-    try:
-        from models.database import SessionLocal, ReelForgeSettings
-        
-        db = SessionLocal()
-        try:
-            settings = db.query(ReelForgeSettings).first()
-            if settings and settings.tempest_api_url:
-                return settings.tempest_api_url
-        finally:
-            db.close()
-    except Exception as e:
-        logger.warning(f"Could not get TempestWeather URL from settings: {e}")
+# (api_url, units) -> (monotonic fetch time, raw /api/data JSON, body digest)
+_weather_cache: Dict[Tuple[str, str], Tuple[float, Dict, bytes]] = {}
+# (body digest, weather variables parsed from it); an unchanged body skips the parse
+_last_parsed: Optional[Tuple[bytes, Dict]] = None
+# (api_url, units) -> If-None-Match / If-Modified-Since headers from the last 200 response
+_weather_validators: Dict[Tuple[str, str], Dict[str, str]] = {}
+# In-flight async fetches, so concurrent misses share one upstream request
+_weather_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+_weather_sync_lock = threading.Lock()
+
+# Pooled clients reused across fetches (keep-alive to TempestWeather); see _get_*_client
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4)
+_async_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+_sync_client: Optional[httpx.Client] = None
+
+# Weather settings are re-read at most this often unless invalidated by a settings update
+SETTINGS_CACHE_TTL = 30.0
+
+# (monotonic read time, tempest_api_url, weather_enabled)
+_settings_cache: Optional[Tuple[float, str, bool]] = None
+# (monotonic read time, timezone from general Settings)
+_timezone_cache: Optional[Tuple[float, ZoneInfo]] = None
+# (timezone key, epoch minute, date/time template variables)
+_time_vars_cache: Optional[Tuple[str, int, Dict]] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Shared AsyncClient for the running event loop (a pool cannot cross loops)"""
+    global _async_client
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[0] is not loop or _async_client[1].is_closed:
+        _async_client = (loop, httpx.AsyncClient(timeout=10.0, limits=_HTTP_LIMITS))
+    return _async_client[1]
+
+
+def _get_sync_client() -> httpx.Client:
+    """Shared thread-safe Client for the synchronous fetch path"""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(timeout=10.0, limits=_HTTP_LIMITS)
+    return _sync_client
+
+
+async def aclose():
+    """Close the pooled HTTP clients (called on application shutdown)"""
+    global _async_client, _sync_client
+    if _async_client is not None:
+        await _async_client[1].aclose()
+        _async_client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+def invalidate_settings_cache():
+    """Drop cached weather settings and timezone (called after settings are saved)"""
+    global _settings_cache, _timezone_cache
+    _settings_cache = None
+    _timezone_cache = None
+
+
+def _first_row(model, db: Optional[Session]):
+    """First row of a settings table, using the caller's session when given"""
+    if db is not None:
+        return db.query(model).first()
     
-    return DEFAULT_TEMPEST_URL
+    from models.database import SessionLocal
+    
+    session = SessionLocal()
+    try:
+        return session.query(model).first()
+    finally:
+        session.close()
 
 
-def is_weather_enabled() -> bool:
-    """Check if weather integration is enabled in settings"""
+def _weather_settings(db: Optional[Session] = None) -> Tuple[str, bool]:
+    """Return (tempest_api_url, weather_enabled) from one ReelForgeSettings read, cached"""
+    global _settings_cache
+    cached = _settings_cache
+    if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+        return cached[1], cached[2]
+    
+    api_url, enabled = DEFAULT_TEMPEST_URL, True
     try:
-        from models.database import SessionLocal, ReelForgeSettings
+        from models.database import ReelForgeSettings
         
-        db = SessionLocal()
-        try:
-            settings = db.query(ReelForgeSettings).first()
-            if settings:
-                return settings.weather_enabled if settings.weather_enabled is not None else True
-        finally:
-            db.close()
-    except Exception:
-        pass
+        settings = _first_row(ReelForgeSettings, db)
+        if settings:
+            if settings.tempest_api_url:
+                api_url = settings.tempest_api_url
+            if settings.weather_enabled is not None:
+                enabled = settings.weather_enabled
+    except Exception as e:
+        logger.warning(f"Could not get weather settings: {e}")
+        return api_url, enabled
     
-    return True
+    _settings_cache = (time.monotonic(), api_url, enabled)
+    return api_url, enabled
+
+
+def get_tempest_api_url(db: Optional[Session] = None) -> str:
+    """Get the TempestWeather API URL from settings (db: reuse an open session on a cache miss)"""
+    return _weather_settings(db)[0]
 
 
-def get_timezone() -> ZoneInfo:
-    """Get the timezone from Settings (general app settings)"""
+def is_weather_enabled(db: Optional[Session] = None) -> bool:
+    """Check if weather integration is enabled in settings (db: reuse an open session on a cache miss)"""
+    return _weather_settings(db)[1]
+
+
+def get_timezone(db: Optional[Session] = None) -> ZoneInfo:
+    """Get the timezone from Settings (general app settings), cached like the weather settings"""
+    global _timezone_cache
+    cached = _timezone_cache
+    if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+        return cached[1]
+    
+    tz = ZoneInfo("America/New_York")
     try:
-        from models.database import SessionLocal, Settings
+        from models.database import Settings
         
-        db = SessionLocal()
-        try:
-            settings = db.query(Settings).first()
-            if settings and settings.timezone:
-                return ZoneInfo(settings.timezone)
-        finally:
-            db.close()
+        settings = _first_row(Settings, db)
+        if settings and settings.timezone:
+            tz = ZoneInfo(settings.timezone)
     except Exception as e:
         logger.warning(f"Could not get timezone from settings: {e}")
+        return tz
+    
+    _timezone_cache = (time.monotonic(), tz)
+    return tz
+
+
+def _time_variables() -> Dict:
+    """Date/time template variables, formatted once per minute"""
+    global _time_vars_cache
+    tz = get_timezone()
+    minute = int(time.time() // 60)
+    cached = _time_vars_cache
+    if cached is not None and cached[0] == tz.key and cached[1] == minute:
+        return cached[2]
     
-    return ZoneInfo("America/New_York")
+    now = datetime.now(tz)
+    hour = now.hour
+    if hour < 12:
+        time_of_day = "morning"
+    elif hour < 17:
+        time_of_day = "afternoon"
+    else:
+        time_of_day = "evening"
+    time_vars = {
+        "today_date": now.strftime("%B %d, %Y"),
+        "day_of_week": now.strftime("%A"),
+        "time_of_day": time_of_day,
+        "current_time": now.strftime("%I:%M %p").lstrip("0"),
+    }
+    _time_vars_cache = (tz.key, minute, time_vars)
+    return time_vars
 
 
 async def fetch_weather_data(units: str = "imperial") -> Optional[Dict]:
@@ -92,19 +212,85 @@ async def fetch_weather_data(units: str = "imperial") -> Optional[Dict]:
         return None
     
     api_url = get_tempest_api_url()
-    
+    key = (api_url, units)
+    entry = _cached_weather(key)
+    if entry is None:
+        fetch = _weather_inflight.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(_fetch_raw_weather(api_url, units))
+            _weather_inflight[key] = fetch
+            fetch.add_done_callback(lambda _: _weather_inflight.pop(key, None))
+        entry = await asyncio.shield(fetch)
+        if entry is None:
+            return None
+    
+    # Parse and flatten the data into template variables (time fields stay current)
+    return _parse_entry(*entry)
+
+
+def _decode_json(response: httpx.Response) -> Dict:
+    """Decode a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _conditional_headers(key: Tuple[str, str]) -> Optional[Dict[str, str]]:
+    """Validators for a conditional /api/data request, if there is a cached body to fall back on"""
+    if key in _weather_cache:
+        return _weather_validators.get(key)
+    return None
+
+
+def _store_response(key: Tuple[str, str], response: httpx.Response) -> Tuple[Dict, bytes]:
+    """Check, decode and cache a TempestWeather response; returns (data, body digest)"""
+    if response.status_code == 304 and key in _weather_cache:
+        # Not Modified: the cached body is current again
+        _, data, digest = _weather_cache[key]
+        _weather_cache[key] = (time.monotonic(), data, digest)
+        return data, digest
+    response.raise_for_status()
+    
+    validators = {}
+    if "ETag" in response.headers:
+        validators["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    _weather_validators[key] = validators
+    
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    data = _decode_json(response)
+    _weather_cache[key] = (time.monotonic(), data, digest)
+    return data, digest
+
+
+def _cached_weather(key: Tuple[str, str]) -> Optional[Tuple[Dict, bytes]]:
+    """Return a cached (data, digest) that is still within WEATHER_CACHE_TTL"""
+    entry = _weather_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < WEATHER_CACHE_TTL:
+        return entry[1], entry[2]
+    return None
+
+
+def _parse_entry(data: Dict, digest: bytes) -> Dict:
+    """parse_weather_data, reusing the last parse when the response body is unchanged"""
+    global _last_parsed
+    if _last_parsed is None or _last_parsed[0] != digest:
+        _last_parsed = (digest, _parse_weather_fields(data))
+    return {**_time_variables(), **_last_parsed[1]}
+
+
+async def _fetch_raw_weather(api_url: str, units: str) -> Optional[Tuple[Dict, bytes]]:
+    """Fetch /api/data from TempestWeather and cache it; None if the fetch fails"""
+    key = (api_url, units)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{api_url}/api/data",
-                params={"units": units}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Parse and flatten the data into template variables
-            return parse_weather_data(data, units)
-            
+        response = await _get_async_client().get(
+            f"{api_url}/api/data",
+            params={"units": units},
+            headers=_conditional_headers(key)
+        )
+        return _store_response(key, response)
+        
     except httpx.ConnectError:
         logger.warning(f"Could not connect to TempestWeather at {api_url}")
         return None
@@ -116,27 +302,58 @@ async def fetch_weather_data(units: str = "imperial") -> Optional[Dict]:
         return None
 
 
-def fetch_weather_data_sync(units: str = "imperial") -> Optional[Dict]:
-    """Synchronous version of fetch_weather_data"""
-    if not is_weather_enabled():
+def fetch_weather_data_sync(units: str = "imperial", db: Optional[Session] = None) -> Optional[Dict]:
+    """Synchronous version of fetch_weather_data (db: optional open session for settings reads)"""
+    if not is_weather_enabled(db):
         return None
     
-    api_url = get_tempest_api_url()
-    
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(
-                f"{api_url}/api/data",
-                params={"units": units}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return parse_weather_data(data, units)
-            
-    except Exception as e:
-        logger.error(f"Error fetching weather data: {e}")
-        return None
+    api_url = get_tempest_api_url(db)
+    key = (api_url, units)
+    
+    # One upstream request at a time; callers that waited reuse its result
+    with _weather_sync_lock:
+        entry = _cached_weather(key)
+        if entry is None:
+            try:
+                response = _get_sync_client().get(
+                    f"{api_url}/api/data",
+                    params={"units": units},
+                    headers=_conditional_headers(key)
+                )
+                entry = _store_response(key, response)
+            except Exception as e:
+                logger.error(f"Error fetching weather data: {e}")
+                return None
+    
+    return _parse_entry(*entry)
+
+
+# (template variable, TempestWeather key, default) per /api/data section
+_CURRENT_FIELDS = (
+    ("temperature", "temperature", "--"),
+    ("feels_like", "feels_like", "--"),
+    ("humidity", "humidity", "--"),
+    ("wind", "wind", "--"),
+    ("wind_gust", "wind_gust", "--"),
+    ("conditions", "conditions", ""),
+    ("pressure", "pressure", "--"),
+    ("uv_index", "uv_index", "--"),
+    ("rain_today", "rain_today", "--"),
+    ("location", "location_name", ""),
+)
+_FISHING_FIELDS = (
+    ("tide_stage", "tide_stage", "--"),
+    ("next_tide", "next_tide_event", "--"),
+    ("next_tide_time", "next_tide_time", "--"),
+    ("tide_height", "tide_height", "--"),
+    ("moon_phase", "moon_phase", "--"),
+    ("moon_illumination", "moon_illumination", "--"),
+    ("water_temp", "water_temp", "--"),
+    ("pressure_trend", "pressure_trend", "--"),
+    ("solunar_major", "solunar_major", "--"),
+    ("solunar_minor", "solunar_minor", "--"),
+)
+_SECTION_FIELDS = (("current", _CURRENT_FIELDS), ("fishing", _FISHING_FIELDS))
 
 
 def parse_weather_data(raw_data: Dict, units: str = "imperial") -> Dict:
@@ -150,49 +367,20 @@ def parse_weather_data(raw_data: Dict, units: str = "imperial") -> Dict:
     Returns:
         Dictionary of template variables
     """
+    # System variables (always available) - use timezone from Settings
+    return {**_time_variables(), **_parse_weather_fields(raw_data)}
+
+
+def _parse_weather_fields(raw_data: Dict) -> Dict:
+    """Weather, tide and forecast variables from a TempestWeather response (no time fields)"""
     variables = {}
     
-    # System variables (always available) - use timezone from Settings
-    tz = get_timezone()
-    now = datetime.now(tz)
-    variables["today_date"] = now.strftime("%B %d, %Y")
-    variables["day_of_week"] = now.strftime("%A")
-    hour = now.hour
-    if hour < 12:
-        variables["time_of_day"] = "morning"
-    elif hour < 17:
-        variables["time_of_day"] = "afternoon"
-    else:
-        variables["time_of_day"] = "evening"
-    variables["current_time"] = now.strftime("%I:%M %p").lstrip("0")
-    
-    # Parse current conditions
-    current = raw_data.get("current", {})
-    if current:
-        variables["temperature"] = current.get("temperature", "--")
-        variables["feels_like"] = current.get("feels_like", "--")
-        variables["humidity"] = current.get("humidity", "--")
-        variables["wind"] = current.get("wind", "--")
-        variables["wind_gust"] = current.get("wind_gust", "--")
-        variables["conditions"] = current.get("conditions", "")
-        variables["pressure"] = current.get("pressure", "--")
-        variables["uv_index"] = current.get("uv_index", "--")
-        variables["rain_today"] = current.get("rain_today", "--")
-        variables["location"] = current.get("location_name", "")
-    
-    # Parse fishing/tide data
-    fishing = raw_data.get("fishing", {})
-    if fishing:
-        variables["tide_stage"] = fishing.get("tide_stage", "--")
-        variables["next_tide"] = fishing.get("next_tide_event", "--")
-        variables["next_tide_time"] = fishing.get("next_tide_time", "--")
-        variables["tide_height"] = fishing.get("tide_height", "--")
-        variables["moon_phase"] = fishing.get("moon_phase", "--")
-        variables["moon_illumination"] = fishing.get("moon_illumination", "--")
-        variables["water_temp"] = fishing.get("water_temp", "--")
-        variables["pressure_trend"] = fishing.get("pressure_trend", "--")
-        variables["solunar_major"] = fishing.get("solunar_major", "--")
-        variables["solunar_minor"] = fishing.get("solunar_minor", "--")
+    # Parse current conditions and fishing/tide data
+    for section, fields in _SECTION_FIELDS:
+        data = raw_data.get(section, {})
+        if data:
+            for var_name, source_key, default in fields:
+                variables[var_name] = data.get(source_key, default)
     
     # Parse tides if separate
     tides = raw_data.get("tides", {})
@@ -202,7 +390,8 @@ def parse_weather_data(raw_data: Dict, units: str = "imperial") -> Dict:
             first_station = stations[0]
             # Always capture station name
             variables["tide_station_name"] = first_station.get("name", "")
-            if "tide_stage" not in variables or variables["tide_stage"] == "--":
+            # Station readings fill in when fishing data has no tide stage
+            if variables.get("tide_stage", "--") == "--":
                 variables["tide_stage"] = first_station.get("tide_type", "--")
                 variables["next_tide_time"] = first_station.get("tide_time", "--")
     
@@ -219,6 +408,15 @@ def parse_weather_data(raw_data: Dict, units: str = "imperial") -> Dict:
     return variables
 
 
+# (label, variable) for the simple "Label: value" lines of the prompt context
+_CONTEXT_WEATHER_LINES = (
+    ("Temperature", "temperature"),
+    ("Conditions", "conditions"),
+    ("Wind", "wind"),
+    ("Humidity", "humidity"),
+)
+
+
 def get_weather_context_for_prompt(weather_data: Optional[Dict]) -> str:
     """
     Format weather data as context for AI prompt.
@@ -232,37 +430,34 @@ def get_weather_context_for_prompt(weather_data: Optional[Dict]) -> str:
     if not weather_data:
         return ""
     
+    def known(key: str):
+        value = weather_data.get(key)
+        return value if value and value != "--" else None
+    
     lines = ["CURRENT CONDITIONS:"]
     
     # Location and time
-    if weather_data.get("location"):
+    if known("location"):
         lines.append(f"Location: {weather_data['location']}")
     lines.append(f"Date: {weather_data.get('today_date', 'N/A')} ({weather_data.get('day_of_week', '')})")
     lines.append(f"Time of day: {weather_data.get('time_of_day', 'N/A')}")
     
     # Weather
-    if weather_data.get("temperature") and weather_data["temperature"] != "--":
-        lines.append(f"Temperature: {weather_data['temperature']}")
-    if weather_data.get("conditions"):
-        lines.append(f"Conditions: {weather_data['conditions']}")
-    if weather_data.get("wind") and weather_data["wind"] != "--":
-        lines.append(f"Wind: {weather_data['wind']}")
-    if weather_data.get("humidity") and weather_data["humidity"] != "--":
-        lines.append(f"Humidity: {weather_data['humidity']}")
+    lines.extend(f"{label}: {weather_data[key]}" for label, key in _CONTEXT_WEATHER_LINES if known(key))
     
     # Tides (great for coastal content)
-    if weather_data.get("tide_stage") and weather_data["tide_stage"] != "--":
+    if known("tide_stage"):
         tide_info = f"Tide: {weather_data['tide_stage']}"
-        if weather_data.get("next_tide") and weather_data["next_tide"] != "--":
+        if known("next_tide"):
             tide_info += f" (next {weather_data['next_tide']} at {weather_data.get('next_tide_time', 'N/A')})"
         lines.append(tide_info)
     
     # Moon phase
-    if weather_data.get("moon_phase") and weather_data["moon_phase"] != "--":
+    if known("moon_phase"):
         lines.append(f"Moon: {weather_data['moon_phase']} ({weather_data.get('moon_illumination', '')})")
     
     # Water temp (for coastal/fishing content)
-    if weather_data.get("water_temp") and weather_data["water_temp"] != "--":
+    if known("water_temp"):
         lines.append(f"Water temperature: {weather_data['water_temp']}")
     
     return "\n".join(lines)
@@ -313,7 +508,10 @@ AVAILABLE_VARIABLES = {
     "forecast_conditions": "Today's forecast conditions",
 }
 
+# Read-only view handed to callers, so no per-call copy is needed
+_AVAILABLE_VARIABLES_VIEW = MappingProxyType(AVAILABLE_VARIABLES)
+
 
-def get_available_variables() -> Dict[str, str]:
-    """Return dictionary of available template variables and their descriptions"""
-    return AVAILABLE_VARIABLES.copy()
+def get_available_variables() -> Mapping[str, str]:
+    """Return read-only mapping of available template variables and their descriptions"""
+    return _AVAILABLE_VARIABLES_VIEW
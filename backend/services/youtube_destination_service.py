@@ -8,13 +8,18 @@ streaming destinations. Reuses OAuth patterns from youtube_shorts_service.py.
 import base64
 import logging
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 
+import requests
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,40 @@ YOUTUBE_DESTINATION_SCOPES = [
     "https://www.googleapis.com/auth/youtube.readonly",
 ]
 
+class _SharedCredentials(Credentials):
+    """
+    Credentials shared between concurrent API calls.
+
+    When several calls find the access token expired at once, only the first
+    refreshes it; the rest wait for that refresh and reuse its token.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self, request):
+        stale_token = self.token
+        with self._refresh_lock:
+            # Skip only if another caller replaced the token while we waited;
+            # a forced refresh (e.g. after a 401) still goes through
+            if self.token != stale_token and self.valid:
+                return
+            super().refresh(request)
+
+
+# (client_id, client_secret, refresh_token) -> Credentials, so the access token
+# minted by one API call is reused by the next until it expires
+_credentials_cache: Dict[Tuple[str, str, str], _SharedCredentials] = {}
+_credentials_lock = threading.Lock()
+_CREDENTIALS_CACHE_SIZE = 16
+
+# Token refreshes go through one keep-alive session to oauth2.googleapis.com
+# rather than a fresh connection inside each API client; see get_credentials
+_token_session = requests.Session()
+_token_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_token_request = Request(session=_token_session)
+
 _CLIENT_CONFIG_TEMPLATE = {
     "web": {
         "auth_uri": "https://accounts.google.com/o/oauth2/auth",
@@ -125,15 +164,36 @@ def get_credentials(
     client_secret: str,
     refresh_token: str,
 ) -> Credentials:
-    """Create a ``Credentials`` object from stored tokens."""
-    return Credentials(
-        token=None,
-        refresh_token=refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=client_id,
-        client_secret=client_secret,
-        scopes=YOUTUBE_DESTINATION_SCOPES,
-    )
+    """
+    Return a ``Credentials`` object for stored tokens.
+
+    The object is shared per token set: google-auth only refreshes it once its
+    access token expires, instead of on every broadcast call, and concurrent
+    callers share a single refresh.
+    """
+    key = (client_id, client_secret, refresh_token)
+    with _credentials_lock:
+        credentials = _credentials_cache.get(key)
+        if credentials is None:
+            if len(_credentials_cache) >= _CREDENTIALS_CACHE_SIZE:
+                # Oldest entry first; a reconnected destination leaves its old tokens behind
+                del _credentials_cache[next(iter(_credentials_cache))]
+            credentials = _SharedCredentials(
+                token=None,
+                refresh_token=refresh_token,
+                token_uri="https://oauth2.googleapis.com/token",
+                client_id=client_id,
+                client_secret=client_secret,
+                scopes=YOUTUBE_DESTINATION_SCOPES,
+            )
+            _credentials_cache[key] = credentials
+    if not credentials.valid:
+        try:
+            credentials.refresh(_token_request)
+        except Exception as exc:
+            # The API call retries the refresh and reports the error to its caller
+            logger.warning("YouTube token refresh failed: %s", exc)
+    return credentials
 
 
 def create_broadcast(
@@ -180,11 +240,29 @@ def create_broadcast(
         },
     }
 
-    broadcast = (
-        youtube.liveBroadcasts()
-        .insert(part="snippet,status,contentDetails", body=broadcast_body)
-        .execute()
-    )
+    # The stream does not depend on the broadcast, so it is created alongside it
+    # (on its own client: the underlying HTTP connection is not thread-safe)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        stream_future = (
+            pool.submit(_insert_stream, credentials, title, frame_rate, resolution)
+            if create_stream else None
+        )
+        try:
+            broadcast = (
+                youtube.liveBroadcasts()
+                .insert(part="snippet,status,contentDetails", body=broadcast_body)
+                .execute()
+            )
+        except Exception:
+            # Don't leave a stream that will never be bound on the channel
+            if stream_future is not None and stream_future.exception() is None:
+                orphan_id = stream_future.result()["id"]
+                try:
+                    youtube.liveStreams().delete(id=orphan_id).execute()
+                except Exception as exc:
+                    logger.warning("Failed to delete unbound stream %s: %s", orphan_id, exc)
+            raise
+        stream = stream_future.result() if stream_future is not None else None
 
     broadcast_id = broadcast["id"]
     video_id = broadcast_id  # broadcast ID is the video ID for live broadcasts
@@ -199,25 +277,7 @@ def create_broadcast(
         "watch_url": f"https://www.youtube.com/watch?v={video_id}",
     }
 
-    if create_stream:
-        # --- Create a stream ---
-        stream_body = {
-            "snippet": {
-                "title": f"{title} - stream",
-            },
-            "cdn": {
-                "frameRate": frame_rate,
-                "resolution": resolution,
-                "ingestionType": "rtmp",
-            },
-        }
-
-        stream = (
-            youtube.liveStreams()
-            .insert(part="snippet,cdn", body=stream_body)
-            .execute()
-        )
-
+    if stream is not None:
         stream_id = stream["id"]
         ingestion = stream.get("cdn", {}).get("ingestionInfo", {})
 
@@ -244,6 +304,26 @@ def create_broadcast(
     return result
 
 
+def _insert_stream(credentials: Credentials, title: str, frame_rate: str, resolution: str) -> Dict:
+    """Create an RTMP live stream for a broadcast titled *title*."""
+    youtube = build("youtube", "v3", credentials=credentials)
+    stream_body = {
+        "snippet": {
+            "title": f"{title} - stream",
+        },
+        "cdn": {
+            "frameRate": frame_rate,
+            "resolution": resolution,
+            "ingestionType": "rtmp",
+        },
+    }
+    return (
+        youtube.liveStreams()
+        .insert(part="snippet,cdn", body=stream_body)
+        .execute()
+    )
+
+
 def get_broadcast_status(credentials: Credentials, broadcast_id: str) -> Dict:
     """
     Check the lifecycle status of a broadcast.
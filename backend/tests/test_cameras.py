@@ -33,3 +33,13 @@ def test_get_cameras_authenticated(client, db_session):
     resp = client.get("/api/cameras", headers=headers)
     assert resp.status_code == 200
     assert isinstance(resp.json(), list)
+
+
+def test_decrypt_cached_memoizes_per_token():
+    from utils.crypto import decrypt_cached, encrypt
+
+    token = encrypt("camera-secret")
+    misses = decrypt_cached.cache_info().misses
+    assert decrypt_cached(token) == "camera-secret"
+    assert decrypt_cached(token) == "camera-secret"
+    assert decrypt_cached.cache_info().misses == misses + 1
@@ -0,0 +1,75 @@
+"""
+Tests for FFmpegProcessManager (services/ffmpeg_manager.py).
+"""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from services.ffmpeg_manager import FFmpegProcessManager, StreamStatus
+
+# Stand-in for FFmpeg: one progress line on stderr, then keep "streaming"
+FAKE_FFMPEG = "import sys, time; sys.stderr.write('frame=    1 fps=0.0\\n'); sys.stderr.flush(); time.sleep(30)"
+
+
+def _manager(script=FAKE_FFMPEG):
+    manager = FFmpegProcessManager()
+    manager.hw_capabilities = SimpleNamespace(max_concurrent_streams=4)
+    manager._build_ffmpeg_command = lambda *args, **kwargs: [sys.executable, "-c", script]
+    return manager
+
+
+def test_replace_stream_hands_over_stream_id():
+    manager = _manager()
+    profile = SimpleNamespace()
+
+    async def run():
+        old = await manager.start_stream(5, "rtsp://cam", ["rtmp://out"], profile)
+        old_monitor = manager._monitoring_tasks[5]
+        new = await manager.start_stream(5, "rtsp://cam2", ["rtmp://out"], profile, replace=True)
+        try:
+            assert manager.processes[5] is new
+            assert new.stream_id == 5 and new.status == StreamStatus.RUNNING
+            assert new.first_frame.is_set()
+            assert set(manager.processes) == {5}
+            assert set(manager._monitoring_tasks) == {5}
+            assert manager._monitoring_tasks[5] is not old_monitor
+            assert old_monitor.done()
+            assert old.status == StreamStatus.STOPPED and old.process is None
+        finally:
+            await manager.shutdown_all()
+
+    asyncio.run(run())
+
+
+def test_replace_stream_keeps_old_stream_when_replacement_dies():
+    manager = _manager()
+    profile = SimpleNamespace()
+
+    async def run():
+        old = await manager.start_stream(5, "rtsp://cam", ["rtmp://out"], profile)
+        manager._build_ffmpeg_command = lambda *args, **kwargs: [sys.executable, "-c", "pass"]
+        try:
+            with pytest.raises(RuntimeError):
+                await manager.start_stream(5, "rtsp://cam2", ["rtmp://out"], profile, replace=True)
+            assert manager.processes[5] is old
+            assert old.status == StreamStatus.RUNNING
+            assert set(manager.processes) == {5}  # The failed replacement is dropped
+        finally:
+            await manager.shutdown_all()
+
+    asyncio.run(run())
+
+
+def test_url_to_stream_map_covers_running_streams():
+    from services.ffmpeg_manager import StreamProcess
+
+    manager = FFmpegProcessManager()
+    manager.processes = {
+        1: StreamProcess(stream_id=1, status=StreamStatus.RUNNING, output_urls=["rtmp://a", "rtmp://b"]),
+        2: StreamProcess(stream_id=2, status=StreamStatus.STOPPED, output_urls=["rtmp://c"]),
+    }
+
+    assert manager.get_url_to_stream_map() == {"rtmp://a": 1, "rtmp://b": 1}
@@ -0,0 +1,43 @@
+"""
+Tests for the shared temp-file download helper (utils/http_download.py).
+"""
+
+import asyncio
+import os
+
+import httpx
+
+from utils.http_download import stream_to_temp_file
+
+
+def test_stream_to_temp_file_writes_body_and_suffix():
+    body = b"\x89PNG" + b"x" * 200_000
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "image/png"}, content=body)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await stream_to_temp_file(client, "http://example.test/img")
+
+    path, response = asyncio.run(run())
+    try:
+        assert response.status_code == 200
+        assert path.endswith(".png")
+        with open(path, "rb") as f:
+            assert f.read() == body
+    finally:
+        os.unlink(path)
+
+
+def test_stream_to_temp_file_non_200_creates_nothing():
+    def handler(request):
+        return httpx.Response(404)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await stream_to_temp_file(client, "http://example.test/img")
+
+    path, response = asyncio.run(run())
+    assert path is None
+    assert response.status_code == 404
@@ -0,0 +1,38 @@
+"""
+Tests for LocalStreamWatchdog (services/local_stream_watchdog.py).
+"""
+
+import asyncio
+
+from services.local_stream_watchdog import LocalStreamWatchdog
+
+
+def test_status_snapshot_rebuilt_only_on_state_change():
+    watchdog = LocalStreamWatchdog(destination_id=1, destination_name="YT", stream_id=3)
+
+    status = watchdog.status()
+    assert status["consecutive_unhealthy"] == 0
+    assert watchdog.status() is status
+
+    watchdog.health_state.mark_unhealthy()
+    updated = watchdog.status()
+    assert updated is not status
+    assert updated["consecutive_unhealthy"] == 1
+
+    watchdog.suppress_checks(5)
+    assert watchdog.status()["consecutive_unhealthy"] == 0
+
+
+def test_youtube_checks_share_one_http_session(monkeypatch):
+    from services import local_stream_watchdog
+
+    monkeypatch.setattr(local_stream_watchdog, "_http_session", None)
+
+    async def run():
+        session = local_stream_watchdog._get_http_session()
+        assert local_stream_watchdog._get_http_session() is session
+        await local_stream_watchdog.aclose()
+        assert session.closed
+        assert local_stream_watchdog._http_session is None
+
+    asyncio.run(run())
@@ -9,6 +9,7 @@ os.environ.setdefault("ENCRYPTION_KEY", "K9c_x2B0Gvt-ArEZK3JM4FxjYBhDA7eRmG1Ph8I
 from utils.logging_config import _redact, JSONFormatter, SecretRedactionFilter
 import json
 import logging
+import logging.handlers
 
 
 def test_redact_rtsp_password():
@@ -70,3 +71,71 @@ def test_redaction_filter():
     )
     filt.filter(record)
     assert "secret123" not in record.msg
+
+
+def test_bound_context_rendered_in_json():
+    from utils.logging_config import bind_logger
+
+    records = []
+
+    class _Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    base = logging.getLogger("test.bound_context")
+    handler = _Collect()
+    base.addHandler(handler)
+    base.setLevel(logging.INFO)
+    try:
+        log = bind_logger(base, timeline_id=7).bind(cue_id=3)
+        log.info("Segment at t=%.2fs", 1.5)
+    finally:
+        base.removeHandler(handler)
+        base.setLevel(logging.NOTSET)
+
+    parsed = json.loads(JSONFormatter().format(records[0]))
+    assert parsed["message"] == "Segment at t=1.50s"
+    assert parsed["context"] == {"timeline_id": 7, "cue_id": 3}
+
+
+def test_configure_logging_writes_through_queue_listener(monkeypatch, capsys):
+    from utils import logging_config
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    try:
+        logging_config.configure_logging()
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("queued").exception("failed with password=%s", "hunter2")
+        logging_config._stop_queue_listener()
+        parsed = json.loads(capsys.readouterr().err.strip().splitlines()[-1])
+        assert parsed["message"] == "failed with password=****"
+        assert "ValueError: boom" in parsed["exception"]
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+def test_bad_format_does_not_stop_queue_listener(monkeypatch, capsys):
+    from utils import logging_config
+
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    try:
+        logging_config.configure_logging()
+        log = logging.getLogger("queued")
+        log.warning("bad format %d with password=%s", "notint", "hunter2")
+        log.warning("still logging")
+        logging_config._stop_queue_listener()
+        err = capsys.readouterr().err
+        assert "hunter2" not in err
+        assert json.loads(err.strip().splitlines()[-1])["message"] == "still logging"
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
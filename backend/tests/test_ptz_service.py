@@ -0,0 +1,73 @@
+"""
+Tests for PTZ settle polling (services/ptz_service.py).
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from services.ptz_service import PTZService
+
+
+class _FakePTZ:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def create_type(self, name):
+        return SimpleNamespace()
+
+    def GetStatus(self, request):
+        self.calls += 1
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+
+def _status(pan_tilt, zoom):
+    return SimpleNamespace(MoveStatus=SimpleNamespace(PanTilt=pan_tilt, Zoom=zoom))
+
+
+def _settle(fake, timeout=1.0):
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await PTZService()._wait_until_stopped(fake, "profile", timeout=timeout, poll_interval=0.01)
+        return loop.time() - started
+
+    return asyncio.run(run())
+
+
+def test_wait_until_stopped_returns_once_idle():
+    fake = _FakePTZ([_status("MOVING", "IDLE"), _status("MOVING", "MOVING"), _status("IDLE", "IDLE")])
+    assert _settle(fake) < 0.5
+    assert fake.calls == 3
+
+
+def test_wait_until_stopped_waits_full_timeout_without_move_status():
+    assert _settle(_FakePTZ([SimpleNamespace(MoveStatus=None)]), timeout=0.2) >= 0.2
+    assert _settle(_FakePTZ([RuntimeError("not supported")]), timeout=0.2) >= 0.2
+
+
+def test_pose_recorded_after_preset_move_and_dropped_by_manual_move():
+    fake_ptz = _FakePTZ([_status("IDLE", "IDLE")])
+    fake_ptz.GotoPreset = lambda request: None
+    fake_ptz.ContinuousMove = lambda request: None
+    media = SimpleNamespace(GetProfiles=lambda: [SimpleNamespace(token="profile")])
+    camera = SimpleNamespace(create_ptz_service=lambda: fake_ptz, create_media_service=lambda: media)
+
+    service = PTZService()
+    service._onvif_available = True
+
+    async def get_camera(*args):
+        return camera
+
+    service.get_onvif_camera = get_camera
+
+    async def run():
+        assert await service.move_to_preset("10.0.0.5", 80, "u", "p", "3", pan=-1.0, tilt=-1.0, zoom=1.0)
+        assert service.last_pose("10.0.0.5", 80) == ("3", -1.0, -1.0, 1.0)
+        assert await service.continuous_move("10.0.0.5", 80, "u", "p", pan_speed=0.5)
+        assert service.last_pose("10.0.0.5", 80) is None
+
+    asyncio.run(run())
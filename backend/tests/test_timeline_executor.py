@@ -0,0 +1,648 @@
+"""
+Tests for TimelineExecutor helpers (services/timeline_executor.py).
+"""
+
+import asyncio
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import httpx
+
+from services.timeline_executor import TimelineExecutor, TimelineRuntimeState
+
+
+def _cue(cue_id, start, duration, **params):
+    return SimpleNamespace(id=cue_id, cue_order=cue_id, start_time=start,
+                           duration=duration, action_params=params)
+
+
+def _timeline(duration=60.0):
+    """Plain-object timeline: video cuts plus overlapping overlays."""
+    video = SimpleNamespace(track_type="video", is_enabled=True, cues=[
+        _cue(2, 20.0, 25.0, camera_id=2),
+        _cue(1, 0.0, 20.0, camera_id=1),
+    ])
+    overlay = SimpleNamespace(track_type="overlay", is_enabled=True, cues=[
+        _cue(10, 5.0, 30.0, asset_id=7),
+        _cue(11, 10.0, 5.0, asset_id=8),
+        _cue(12, 40.0, 20.0, asset_id=9),
+    ])
+    disabled = SimpleNamespace(track_type="overlay", is_enabled=False, cues=[
+        _cue(20, 0.0, 60.0, asset_id=99),
+    ])
+    return SimpleNamespace(duration=duration, tracks=[video, overlay, disabled])
+
+
+def test_fetch_cached_image_revalidates_with_etag():
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"cache-control": "max-age=0"})
+        return httpx.Response(
+            200, content=b"img",
+            headers={"content-type": "image/png", "etag": '"v1"', "cache-control": "max-age=0"},
+        )
+
+    executor = TimelineExecutor()
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await executor._fetch_cached_image(7, client, "http://example.test/w")
+            second = await executor._fetch_cached_image(7, client, "http://example.test/w")
+            return first, second
+
+    (path1, status1), (path2, status2) = asyncio.run(run())
+    try:
+        assert (status1, status2) == (200, 304)
+        assert path1 == path2
+        assert requests == [None, '"v1"']
+        # Cached downloads live in the shared dir, not a per-timeline one
+        assert os.path.dirname(path1) == executor._overlay_dir()
+    finally:
+        os.unlink(path1)
+
+
+def test_segments_with_cues_match_point_lookup():
+    executor = TimelineExecutor()
+    timeline = _timeline()
+    swept = executor._compute_segments_with_cues(timeline)
+
+    assert [(a, b) for a, b, _ in swept] == executor._compute_segments(timeline)
+    for seg_start, _, active in swept:
+        expected = executor._get_active_cues_at_time(timeline, seg_start)
+        for track_type in ("video", "overlay"):
+            assert sorted(c.id for c in active[track_type]) == sorted(c.id for c in expected[track_type])
+
+
+def test_publish_overlay_file_replaces_in_place(tmp_path):
+    executor = TimelineExecutor()
+    first = tmp_path / "a.png"
+    second = tmp_path / "b.png"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+
+    overlay_dir = executor._timeline_overlay_dir(3)
+    live = executor._publish_overlay_file(str(first), directory=overlay_dir)
+    try:
+        assert open(live, "rb").read() == b"first"
+        assert executor._publish_overlay_file(str(second), live) == live
+        assert open(live, "rb").read() == b"second"
+        assert os.path.dirname(live) == overlay_dir
+    finally:
+        shutil.rmtree(overlay_dir)
+
+
+def test_camera_connection_cached_until_fields_change():
+    from utils.crypto import encrypt
+
+    executor = TimelineExecutor()
+    camera = SimpleNamespace(id=1, address="10.0.0.5", port=554, username="admin",
+                             password_enc=encrypt("secret"), stream_path="/stream1")
+
+    password, url = executor._camera_connection(camera)
+    assert password == "secret"
+    assert "10.0.0.5" in url
+    assert executor._camera_connection(camera) == (password, url)
+
+    camera.password_enc = encrypt("rotated")
+    assert executor._camera_connection(camera)[0] == "rotated"
+
+
+def test_compute_segments_unique_sorted_boundaries():
+    segments = TimelineExecutor()._compute_segments(_timeline())
+    assert segments == [
+        (0.0, 5.0), (5.0, 10.0), (10.0, 15.0), (15.0, 20.0),
+        (20.0, 35.0), (35.0, 40.0), (40.0, 45.0), (45.0, 60.0),
+    ]
+    assert all(type(start) is float for start, _ in segments)
+
+
+def test_get_playback_position_formats_updated_at():
+    from services.timeline_executor import get_playback_position, get_timeline_executor
+
+    executor = get_timeline_executor()
+    executor.playback_positions[999] = {"current_time": 1.0, "updated_at": 0.0}
+    try:
+        position = get_playback_position(999)
+        assert position["updated_at"] == "1970-01-01T00:00:00+00:00"
+        assert executor.playback_positions[999]["updated_at"] == 0.0
+    finally:
+        del executor.playback_positions[999]
+    assert get_playback_position(999) is None
+
+
+def test_overlay_geometry_auto_sizes_once(tmp_path):
+    from PIL import Image
+
+    image_path = tmp_path / "logo.png"
+    Image.new("RGBA", (400, 200)).save(image_path)
+    executor = TimelineExecutor()
+    asset = SimpleNamespace(id=5, name="Logo", last_updated=None)
+    placement = (0.1, 0.2, 1.0, None, None)
+
+    geometry = executor._overlay_geometry(asset, str(image_path), placement, 1920, 1080)
+    assert geometry == {"norm_x": 0.1, "norm_y": 0.2, "opacity": 1.0, "width": 400, "height": 200}
+
+    os.unlink(image_path)  # A cache hit must not touch the image again
+    assert executor._overlay_geometry(asset, str(image_path), placement, 1920, 1080) is geometry
+
+
+def test_playback_position_computed_on_read():
+    from services.timeline_executor import get_playback_position, get_timeline_executor
+
+    executor = get_timeline_executor()
+    executor._begin_segment_position(
+        timeline_id=7, start_time=5.0, duration=0.02, current_cue_id=1,
+        current_cue_index=0, total_cues=1, loop_count=0,
+    )
+    try:
+        time.sleep(0.05)
+        position = get_playback_position(7)
+        assert position["current_time"] == 5.02  # clamped to the segment end
+        assert executor.playback_positions[7]["current_time"] == 5.0
+    finally:
+        del executor.playback_positions[7]
+        del executor._segment_clock[7]
+
+
+def test_load_assets_batches_lookup(db_session):
+    from models.database import Asset
+
+    assets = [Asset(name=f"Overlay {i}", type="static_image", is_active=True) for i in range(3)]
+    db_session.add_all(assets)
+    db_session.commit()
+    wanted = {assets[0].id, assets[2].id, 9999}
+
+    loaded = asyncio.run(TimelineExecutor()._load_assets(db_session, wanted))
+    assert set(loaded) == {assets[0].id, assets[2].id}
+    assert asyncio.run(TimelineExecutor()._load_assets(db_session, set())) == {}
+
+
+def test_download_assets_fetches_shared_asset_once():
+    executor = TimelineExecutor()
+    calls = []
+
+    async def fake_download(asset):
+        calls.append(asset.id)
+        return f"/tmp/{asset.id}.png"
+
+    executor._download_asset_image = fake_download
+    logo, radar = SimpleNamespace(id=1), SimpleNamespace(id=2)
+
+    result = asyncio.run(executor._download_assets([logo, radar, logo]))
+    assert result == {1: "/tmp/1.png", 2: "/tmp/2.png"}
+    assert sorted(calls) == [1, 2]
+
+
+def test_active_cues_bisect_matches_linear_scan():
+    executor = TimelineExecutor()
+    timeline = _timeline()
+    for tenth in range(0, 610, 5):
+        t = tenth / 10
+        active = executor._get_active_cues_at_time(timeline, t)
+        for track in timeline.tracks:
+            if not track.is_enabled:
+                continue
+            expected = {c.id for c in track.cues if c.start_time <= t < c.start_time + c.duration}
+            assert {c.id for c in active[track.track_type]} == expected
+    assert executor._get_overlay_ids_at_time(timeline, 12.0) == [7, 8]
+
+
+def test_concurrent_downloads_of_same_asset_are_coalesced():
+    executor = TimelineExecutor()
+    calls = []
+
+    async def slow_resolve(asset):
+        calls.append(asset.id)
+        await asyncio.sleep(0.01)
+        return f"/tmp/{asset.id}.png"
+
+    executor._resolve_asset_image = slow_resolve
+    asset = SimpleNamespace(id=3)
+
+    async def run():
+        return await asyncio.gather(*(executor._download_asset_image(asset) for _ in range(3)))
+
+    assert asyncio.run(run()) == ["/tmp/3.png"] * 3
+    assert calls == [3]
+    assert executor._inflight_downloads == {}
+
+
+def test_cached_segments_reused_until_timeline_changes():
+    executor = TimelineExecutor()
+    timeline = _timeline()
+    timeline.id, timeline.updated_at = 1, None
+
+    first = executor._cached_segments(timeline)
+    assert executor._cached_segments(timeline) is first
+
+    timeline.updated_at = "edited"
+    assert executor._cached_segments(timeline) is not first
+
+
+def test_aclose_releases_shared_http_client():
+    executor = TimelineExecutor()
+
+    async def run():
+        client = await executor._get_http()
+        assert await executor._get_http() is client
+        await executor.aclose()
+        return client
+
+    assert asyncio.run(run()).is_closed
+    assert executor._http is None
+
+
+def test_fetch_cached_image_refetches_edited_asset():
+    bodies = iter([b"old", b"new"])
+
+    def handler(request):
+        return httpx.Response(200, content=next(bodies), headers={"content-type": "image/png"})
+
+    executor = TimelineExecutor()
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            fetch = executor._fetch_cached_image
+            first, _ = await fetch(4, client, "http://example.test/w", revision=1, default_ttl=60)
+            cached, _ = await fetch(4, client, "http://example.test/w", revision=1, default_ttl=60)
+            edited, _ = await fetch(4, client, "http://example.test/w", revision=2, default_ttl=60)
+            return first, cached, edited
+
+    first, cached, edited = asyncio.run(run())
+    try:
+        assert cached == first
+        assert not os.path.exists(first)
+        with open(edited, "rb") as f:
+            assert f.read() == b"new"
+    finally:
+        os.unlink(edited)
+
+
+def test_shared_overlay_enabled_over_merged_intervals():
+    from services.ffmpeg_manager import EncodingProfile, FFmpegProcessManager
+    from services.hardware_detector import HardwareCapabilities
+    from services.timeline_executor import _merge_intervals
+
+    intervals = _merge_intervals([(40.0, 50.0), (0.0, 10.0), (10.0, 15.0)])
+    assert intervals == [(0.0, 15.0), (40.0, 50.0)]
+
+    caps = HardwareCapabilities(encoder="libx264", decoder=None, platform="linux",
+                                max_concurrent_streams=1, supports_hardware=False)
+    cmd = FFmpegProcessManager()._build_ffmpeg_command(
+        "rtsp://cam/stream", ["rtmp://out/live"], EncodingProfile.reliability_profile(caps),
+        timed_overlays=[{"path": "/tmp/logo.png", "norm_x": 0.0, "norm_y": 0.0, "intervals": intervals}],
+        timeline_duration=60.0, timeline_loop=True,
+    )
+    assert cmd.count("/tmp/logo.png") == 1
+    filter_complex = cmd[cmd.index("-filter_complex") + 1]
+    assert ("enable='between(mod(t\\,60.0)\\,0.0\\,15.0)+between(mod(t\\,60.0)\\,40.0\\,50.0)'"
+            in filter_complex)
+
+
+def test_load_cameras_and_presets_for_video_cues(db_session):
+    from models.database import Camera, Preset
+
+    camera = Camera(name="Dock", type="ptz", protocol="rtsp", address="10.0.0.5")
+    db_session.add(camera)
+    db_session.flush()
+    preset = Preset(camera_id=camera.id, name="Wide")
+    db_session.add(preset)
+    db_session.commit()
+    cues = [_cue(1, 0.0, 10.0, camera_id=camera.id, preset_id=preset.id),
+            _cue(2, 10.0, 10.0, camera_id=camera.id)]
+
+    cameras, presets = asyncio.run(TimelineExecutor()._load_cameras_and_presets(db_session, cues))
+    assert list(cameras) == [camera.id] and list(presets) == [preset.id]
+
+
+def test_rapid_failures_tracked_on_runtime_state():
+    async def run():
+        executor = TimelineExecutor()
+        task = asyncio.create_task(asyncio.sleep(0))
+        executor.state[5] = TimelineRuntimeState(task=task, destination_ids=[3])
+        executor._mark_ffmpeg_started(5)
+        await executor._on_ffmpeg_died(5, "boom")
+        await executor._on_ffmpeg_died(5, "boom")
+        assert executor.state[5].rapid_failures == 2
+        assert 5 in executor.active_timelines
+        # Unknown timelines are ignored rather than growing the state dict
+        executor._mark_progress(6)
+        await executor._on_ffmpeg_died(6, "boom")
+        assert 6 not in executor.state
+        await task
+
+    asyncio.run(run())
+
+
+def test_record_execution_status_persists_error(db_session):
+    import logging
+    from models.timeline import Timeline, TimelineExecution
+
+    timeline = Timeline(name="Harbor", duration=60.0)
+    db_session.add(timeline)
+    db_session.flush()
+    execution = TimelineExecution(timeline_id=timeline.id, status="running")
+    db_session.add(execution)
+    db_session.commit()
+
+    TimelineExecutor._record_execution_status(
+        db_session, execution, "error", logging.getLogger(__name__), "camera offline")
+    db_session.expire_all()
+    assert execution.status == "error"
+    assert execution.error_message == "camera offline"
+
+
+def test_cue_target_memoized_until_cues_change(monkeypatch):
+    import models.timeline as timeline_models
+    from services.timeline_executor import _cue_target
+
+    cue = _cue(1, 0.0, 10.0, camera_id=4, preset_id=9)
+    assert _cue_target(cue) == (4, 9)
+    cue.action_params = {"camera_id": 5}
+    assert _cue_target(cue) == (4, 9)
+    monkeypatch.setattr(timeline_models, "_cue_generation", timeline_models._cue_generation + 1)
+    assert _cue_target(cue) == (5, None)
+
+
+def test_overlay_filter_graph_reused_across_camera_switches():
+    from services.ffmpeg_manager import EncodingProfile, FFmpegProcessManager
+    from services.hardware_detector import HardwareCapabilities
+
+    caps = HardwareCapabilities(encoder="libx264", decoder=None, platform="linux",
+                                max_concurrent_streams=1, supports_hardware=False)
+    profile = EncodingProfile.reliability_profile(caps)
+    manager = FFmpegProcessManager()
+    overlays = [{"path": "/tmp/logo.png", "norm_x": 0.5, "norm_y": 0.0, "intervals": [(0.0, 5.0)]}]
+
+    def filter_for(url, timed):
+        cmd = manager._build_ffmpeg_command(url, ["rtmp://out/live"], profile, timed_overlays=timed,
+                                            timeline_duration=30.0, timeline_loop=True)
+        return cmd[cmd.index("-filter_complex") + 1]
+
+    first = filter_for("rtsp://cam1/stream", overlays)
+    assert filter_for("rtsp://cam2/stream", overlays) is first
+    # An equal but distinct overlay list (new run) builds its own graph
+    copy = [dict(overlays[0])]
+    rebuilt = filter_for("rtsp://cam1/stream", copy)
+    assert rebuilt == first and rebuilt is not first
+
+
+def test_wait_until_wakes_on_shutdown():
+    async def run():
+        executor = TimelineExecutor()
+        loop = asyncio.get_running_loop()
+        assert await executor._wait_until(loop.time() + 0.01) is False
+        loop.call_later(0.01, executor.request_shutdown)
+        started = loop.time()
+        assert await executor._wait_until(started + 30.0) is True
+        return loop.time() - started
+
+    assert asyncio.run(run()) < 1.0
+
+
+def test_static_image_mirrored_until_upload_changes(tmp_path):
+    executor = TimelineExecutor()
+    upload = tmp_path / "logo.png"
+    upload.write_bytes(b"v1")
+
+    local = executor._localize_static_image(3, str(upload))
+    try:
+        assert os.path.dirname(local) == executor._overlay_dir()
+        assert open(local, "rb").read() == b"v1"
+        assert executor._localize_static_image(3, str(upload)) == local
+
+        replacement = tmp_path / "new.png"
+        replacement.write_bytes(b"version2")
+        os.replace(replacement, upload)
+        assert executor._localize_static_image(3, str(upload)) == local
+        assert open(local, "rb").read() == b"version2"
+    finally:
+        os.unlink(local)
+
+
+def test_destination_ids_index_rebuilt_after_destination_change(db_session):
+    from models.destination import StreamingDestination
+    from utils.crypto import encrypt
+
+    dest = StreamingDestination(name="YT", platform="youtube",
+                                rtmp_url="rtmp://a.example/live", stream_key=encrypt("k1"))
+    db_session.add(dest)
+    db_session.commit()
+
+    executor = TimelineExecutor()
+    assert executor._destination_ids_for(["rtmp://a.example/live/k1", "rtmp://x/y"], db_session) == [dest.id]
+
+    dest.stream_key = encrypt("k2")
+    db_session.commit()
+    assert executor._destination_ids_for(["rtmp://a.example/live/k1"], db_session) == []
+    assert executor._destination_ids_for(["rtmp://a.example/live/k2"], db_session) == [dest.id]
+    # Fresh index: answered without touching the database
+    assert executor._destination_ids_for(["rtmp://a.example/live/k2"], db=None) == [dest.id]
+
+
+def test_camera_generation_ignores_health_check_updates(db_session):
+    from datetime import datetime, timezone
+    import models.database as database_models
+    from models.database import Camera
+
+    camera = Camera(name="Pier", type="stationary", protocol="rtsp", address="10.0.0.9")
+    db_session.add(camera)
+    db_session.commit()
+
+    before = database_models._camera_generation
+    camera.last_seen = datetime.now(timezone.utc)
+    db_session.commit()
+    assert database_models._camera_generation == before
+
+    camera.stream_path = "/stream2"
+    db_session.commit()
+    assert database_models._camera_generation == before + 1
+
+
+def test_move_camera_to_preset_skips_known_pose(monkeypatch):
+    import logging
+    import services.timeline_executor as executor_module
+
+    moves = []
+
+    class FakePTZ:
+        def last_pose(self, address, port):
+            return ("7", 0.1, 0.2, 1.0) if address == "10.0.0.5" else None
+
+        async def move_to_preset(self, **kwargs):
+            moves.append(kwargs["address"])
+            return True
+
+    monkeypatch.setattr(executor_module, "get_ptz_service", lambda: FakePTZ())
+    preset = SimpleNamespace(name="Dock", pan=0.1, tilt=0.2, zoom=1.0, camera_preset_token="7")
+    log = logging.getLogger(__name__)
+
+    async def run():
+        executor = TimelineExecutor()
+        for address in ("10.0.0.5", "10.0.0.6"):
+            camera = SimpleNamespace(address=address, onvif_port=80, username="u")
+            await executor._move_camera_to_preset(log, camera, preset, 7, "secret")
+
+    asyncio.run(run())
+    assert moves == ["10.0.0.6"]
+
+
+def test_switch_lead_only_before_camera_changes():
+    executor = TimelineExecutor()
+    segments = executor._compute_segments_with_cues(_timeline())
+    # Segments start at 0, 5, 10, 15, 20, 35, 40, 45; camera 1 until t=20, then camera 2
+    starts = [seg_start for seg_start, _, _ in segments]
+    before_switch = starts.index(15.0)
+    assert executor._switch_lead(1, segments, before_switch, 1, 5.0, True) == 1.5
+    assert executor._switch_lead(1, segments, 0, 1, 5.0, True) == 0.0
+    # Capped at half the segment; wraps to the first segment when looping
+    assert executor._switch_lead(1, segments, before_switch, 1, 2.0, True) == 1.0
+    last = len(segments) - 1
+    assert executor._switch_lead(1, segments, last, 2, 15.0, True) == 1.5
+    assert executor._switch_lead(1, segments, last, 2, 15.0, False) == 0.0
+
+
+def test_loop_epoch_carries_schedule_across_loops():
+    loop_epoch = TimelineExecutor._loop_epoch
+    # First loop: starts now, shifted back by a mid-timeline start
+    assert loop_epoch(100.0, None, None) == 100.0
+    assert loop_epoch(100.0, None, 12.0) == 88.0
+    # Last segment cut 1.5s early for the wrap-around handoff: the next loop keeps
+    # the fixed schedule, so loops stay timeline.duration long
+    assert loop_epoch(158.5, 160.0, None) == 160.0
+    assert loop_epoch(161.0, 160.0, None) == 160.0
+    # Gross overrun: restart the schedule instead of racing to catch up
+    assert loop_epoch(170.0, 160.0, None) == 170.0
+
+
+def _segment_camera_cue():
+    camera = SimpleNamespace(
+        id=2, name="Dock", address="10.0.0.2", port=554, username=None,
+        password_enc=None, stream_path="/stream1", snapshot_url=None,
+    )
+    cue = _cue(5, 20.0, 10.0, camera_id=2)
+    cue.action_type = "show_camera"
+    return camera, cue
+
+
+def test_seamless_handoff_stores_measured_switch_lead(db_session):
+    from services.ffmpeg_manager import StreamStatus
+
+    executor = TimelineExecutor()
+    camera, cue = _segment_camera_cue()
+
+    class FakeManager:
+        processes = {1: SimpleNamespace(status=StreamStatus.RUNNING)}
+
+        async def start_stream(self, **kwargs):
+            assert kwargs["replace"] is True
+            await asyncio.sleep(0.2)  # spawn plus time to first frame
+            first_frame = asyncio.Event()
+            first_frame.set()
+            return SimpleNamespace(first_frame=first_frame)
+
+        def register_stream_died_callback(self, stream_id, callback):
+            pass
+
+    async def run():
+        executor.state[1] = TimelineRuntimeState(task=None)
+        await executor._execute_segment(
+            timeline_id=1, seg_start=20.0, duration=10.0, video_cue=cue,
+            ffmpeg_manager=FakeManager(), output_urls=[], encoding_profile=None,
+            db=db_session, last_camera_preset=(1, None),
+            deadline=asyncio.get_running_loop().time(), cameras_by_id={2: camera},
+        )
+        return executor.state[1].switch_lead
+
+    lead = asyncio.run(run())
+    assert 0.2 <= lead < 1.0
+
+
+def test_segment_start_failure_left_to_loop_to_log(db_session, caplog):
+    import pytest
+
+    executor = TimelineExecutor()
+    camera, cue = _segment_camera_cue()
+
+    class FailingManager:
+        processes = {}
+
+        async def start_stream(self, **kwargs):
+            raise RuntimeError("encoder missing")
+
+    async def run():
+        executor.state[1] = TimelineRuntimeState(task=None)
+        await executor._execute_segment(
+            timeline_id=1, seg_start=20.0, duration=10.0, video_cue=cue,
+            ffmpeg_manager=FailingManager(), output_urls=[], encoding_profile=None,
+            db=db_session, last_camera_preset=(None, None), cameras_by_id={2: camera},
+        )
+
+    with pytest.raises(RuntimeError, match="encoder missing"):
+        asyncio.run(run())
+    assert not [r for r in caplog.records if r.levelname == "ERROR"]
+
+
+def test_concurrent_first_starts_register_one_run(monkeypatch):
+    executor = TimelineExecutor()
+    runs = []
+
+    async def slow_initialize():
+        await asyncio.sleep(0.05)
+
+    async def fake_execute(timeline_id, *args):
+        runs.append(timeline_id)
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(executor.ffmpeg_manager, "initialize", slow_initialize)
+    monkeypatch.setattr(executor, "_execute_timeline", fake_execute)
+
+    async def run():
+        results = await asyncio.gather(
+            executor.start_timeline(1, ["rtmp://a/live/key"]),
+            executor.start_timeline(1, ["rtmp://a/live/key"]),
+        )
+        await asyncio.sleep(0)
+        executor.state[1].task.cancel()
+        return results
+
+    assert sorted(asyncio.run(run())) == [False, True]
+    assert runs == [1]
+
+
+def test_shortforge_config_read_off_event_loop(db_session):
+    import threading
+    from sqlalchemy import event
+    from services.ffmpeg_manager import StreamStatus
+
+    executor = TimelineExecutor()
+    camera, cue = _segment_camera_cue()
+    camera.snapshot_url = "http://10.0.0.2/snapshot.jpg"
+    cue.action_params["preset_id"] = 4
+    preset = SimpleNamespace(id=4, name="Dock wide")
+    manager = SimpleNamespace(processes={1: SimpleNamespace(status=StreamStatus.RUNNING)})
+
+    threads = []
+    engine = db_session.get_bind()
+    listener = lambda *args: threads.append(threading.current_thread()) if "shortforge" in args[2] else None
+    event.listen(engine, "before_cursor_execute", listener)
+
+    async def run():
+        await executor._execute_segment(
+            timeline_id=1, seg_start=20.0, duration=10.0, video_cue=cue,
+            ffmpeg_manager=manager, output_urls=[], encoding_profile=None,
+            db=db_session, last_camera_preset=(2, None),
+            deadline=asyncio.get_running_loop().time(),
+            cameras_by_id={2: camera}, presets_by_id={4: preset},
+        )
+
+    try:
+        asyncio.run(run())
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert threads and threading.main_thread() not in threads
@@ -198,3 +198,33 @@ def test_timeline_broadcast_metadata(client, db_session):
     tl = resp.json()
     assert tl["broadcast_title"] == "Live from the Marina"
     assert tl["broadcast_privacy"] == "public"
+
+
+# ------------------------------------------------------------------
+# Model helpers
+# ------------------------------------------------------------------
+
+def test_cached_video_cues_sorted_and_invalidated(db_session):
+    from models.timeline import Timeline, TimelineTrack, TimelineCue
+
+    timeline = Timeline(name="Cue Cache", duration=60.0)
+    track = TimelineTrack(track_type="video")
+    timeline.tracks.append(track)
+    for order in (2, 1):
+        track.cues.append(TimelineCue(
+            cue_order=order, start_time=order * 10.0, duration=10.0,
+            action_type="show_camera", action_params={"camera_id": order},
+        ))
+    db_session.add(timeline)
+    db_session.commit()
+
+    cues = timeline.cached_video_cues
+    assert [c.cue_order for c in cues] == [1, 2]
+    assert timeline.cached_video_cues is cues
+
+    track.cues.append(TimelineCue(
+        cue_order=0, start_time=0.0, duration=10.0,
+        action_type="show_camera", action_params={"camera_id": 3},
+    ))
+    db_session.commit()
+    assert [c.cue_order for c in timeline.cached_video_cues] == [0, 1, 2]
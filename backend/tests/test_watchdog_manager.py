@@ -0,0 +1,152 @@
+"""
+Tests for WatchdogManager bookkeeping (services/watchdog_manager.py).
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from services.watchdog_manager import WatchdogManager
+
+
+def _destination(dest_id):
+    return SimpleNamespace(
+        id=dest_id, name=f"Dest {dest_id}", youtube_watch_url=None, watchdog_check_interval=30
+    )
+
+
+def test_stream_index_tracks_watchdogs():
+    manager = WatchdogManager()
+
+    async def run():
+        await manager.start_watchdog(_destination(1), stream_id=7)
+        await manager.start_watchdog(_destination(2), stream_id=7)
+        await manager.start_watchdog(_destination(3), stream_id=8)
+        assert manager._stream_to_dests == {7: {1, 2}, 8: {3}}
+
+        manager.notify_intentional_restart(7)
+        assert manager.watchdogs[1]._suppress_until is not None
+        assert manager.watchdogs[3]._suppress_until is None
+
+        await manager.notify_stream_stopped(7)
+        assert set(manager.watchdogs) == {3}
+        assert manager._stream_to_dests == {8: {3}}
+
+        await manager.stop_all()
+        assert manager._stream_to_dests == {}
+
+    asyncio.run(run())
+
+
+def test_notify_stream_started_loads_destinations_once(db_session):
+    from sqlalchemy import event
+    from models.destination import StreamingDestination
+
+    for dest_id, watch_url in ((1, "https://youtube.com/watch?v=a"), (2, None), (3, "https://youtube.com/watch?v=c")):
+        db_session.add(StreamingDestination(
+            id=dest_id, name=f"Dest {dest_id}", platform="youtube",
+            rtmp_url="rtmp://a.rtmp.youtube.com/live2", stream_key="key",
+            youtube_watch_url=watch_url,
+        ))
+    db_session.commit()
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    manager = WatchdogManager()
+
+    async def run():
+        try:
+            await manager.notify_stream_started([1, 2, 3, 4], stream_id=9, db_session=db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert set(manager.watchdogs) == {1, 3}
+        await manager.stop_all()
+
+    asyncio.run(run())
+    assert len(statements) == 1
+
+
+def test_watchdog_that_dies_is_forgotten(monkeypatch, caplog):
+    from services.local_stream_watchdog import LocalStreamWatchdog
+
+    async def crash(self):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(LocalStreamWatchdog, "start", crash)
+    manager = WatchdogManager()
+
+    async def run():
+        await manager.start_watchdog(_destination(1), stream_id=7)
+        await asyncio.wait({manager.watchdog_tasks[1]})
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert manager.watchdogs == {} and manager.watchdog_tasks == {}
+    assert manager._stream_to_dests == {}
+    assert "Watchdog for destination 1 failed: boom" in caplog.text
+
+
+def test_start_during_stop_keeps_new_watchdog():
+    manager = WatchdogManager()
+
+    async def run():
+        await manager.start_watchdog(_destination(1), stream_id=7)
+        stopping = asyncio.ensure_future(manager.stop_watchdog(1))
+        await asyncio.sleep(0)  # stop_watchdog is now waiting on the old task
+        await manager.start_watchdog(_destination(1), stream_id=7)
+        replacement = manager.watchdogs[1]
+        await stopping
+
+        assert manager.watchdogs == {1: replacement}
+        assert manager._stream_to_dests == {7: {1}}
+        await manager.stop_all()
+
+    asyncio.run(run())
+
+
+def test_reload_keeps_watchdogs_for_live_destinations(db_session, monkeypatch):
+    from models.destination import StreamingDestination
+    from services.ffmpeg_manager import StreamProcess, StreamStatus
+    from services.timeline_executor import get_timeline_executor
+    from utils.crypto import encrypt
+
+    for dest_id in (1, 2):
+        db_session.add(StreamingDestination(
+            id=dest_id, name=f"Dest {dest_id}", platform="youtube",
+            rtmp_url="rtmp://a.rtmp.youtube.com/live2", stream_key=encrypt(f"key{dest_id}"),
+        ))
+    db_session.commit()
+    ffmpeg_manager = get_timeline_executor().ffmpeg_manager
+    monkeypatch.setattr(ffmpeg_manager, "processes", {
+        9: StreamProcess(stream_id=9, status=StreamStatus.RUNNING,
+                         output_urls=["rtmp://a.rtmp.youtube.com/live2/key1"]),
+    })
+    manager = WatchdogManager()
+
+    async def run():
+        await manager.start_watchdog(_destination(2), stream_id=5)
+        await manager.reload_from_db(db_session)
+        assert set(manager.watchdogs) == {1}
+        assert manager.watchdogs[1].stream_id == 9
+        await manager.stop_all()
+
+    asyncio.run(run())
+
+
+def test_restart_replaces_watchdog_without_delay():
+    manager = WatchdogManager()
+
+    async def run():
+        await manager.start_watchdog(_destination(1), stream_id=7)
+        await asyncio.sleep(0)
+        old = manager.watchdogs[1]
+
+        await asyncio.wait_for(manager.restart_watchdog(_destination(1), stream_id=7), timeout=0.5)
+
+        assert manager.watchdogs[1] is not old
+        assert not old.running
+        assert manager._stream_to_dests == {7: {1}}
+        await manager.stop_all()
+
+    asyncio.run(run())
@@ -0,0 +1,193 @@
+"""
+Tests for the TempestWeather client (services/weather_data_service.py).
+"""
+
+import asyncio
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from services import weather_data_service
+
+PAYLOAD = {"current": {"temperature": "72°F", "conditions": "Sunny"}}
+
+
+@pytest.fixture
+def tempest_server(monkeypatch):
+    """Route weather requests to an in-memory TempestWeather answering with handler.
+
+    Calling the fixture installs the handler and returns the list of requests
+    it receives.
+    """
+    def install(handler):
+        requests = []
+
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        transport = httpx.MockTransport(record)
+        real_client, real_async_client = httpx.Client, httpx.AsyncClient
+        monkeypatch.setattr(httpx, "Client", lambda **kw: real_client(transport=transport, **kw))
+        monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: real_async_client(transport=transport, **kw))
+        monkeypatch.setattr(weather_data_service, "is_weather_enabled", lambda db=None: True)
+        monkeypatch.setattr(weather_data_service, "get_tempest_api_url", lambda db=None: "http://tempest")
+        monkeypatch.setattr(weather_data_service, "get_timezone", lambda: ZoneInfo("UTC"))
+        monkeypatch.setattr(weather_data_service, "_weather_cache", {})
+        monkeypatch.setattr(weather_data_service, "_last_parsed", None)
+        monkeypatch.setattr(weather_data_service, "_weather_validators", {})
+        monkeypatch.setattr(weather_data_service, "_async_client", None)
+        monkeypatch.setattr(weather_data_service, "_sync_client", None)
+        return requests
+
+    return install
+
+
+@pytest.fixture
+def tempest(tempest_server):
+    """In-memory TempestWeather that always serves PAYLOAD; returns its requests."""
+    return tempest_server(lambda request: httpx.Response(200, json=PAYLOAD))
+
+
+def test_sync_fetch_reuses_cached_response(tempest):
+    first = weather_data_service.fetch_weather_data_sync()
+    second = weather_data_service.fetch_weather_data_sync()
+
+    assert first["temperature"] == second["temperature"] == "72°F"
+    assert first is not second  # Parsed fresh, so time-of-day fields stay current
+    assert len(tempest) == 1
+
+
+def test_async_fetch_coalesces_concurrent_misses(tempest):
+    async def run():
+        return await asyncio.gather(*(weather_data_service.fetch_weather_data() for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert all(result["conditions"] == "Sunny" for result in results)
+    assert len(tempest) == 1
+
+    assert weather_data_service.fetch_weather_data_sync()["conditions"] == "Sunny"
+    assert len(tempest) == 1  # Shared with the sync path
+
+
+def test_unchanged_response_is_not_reparsed(tempest, monkeypatch):
+    parses = []
+    real_parse = weather_data_service._parse_weather_fields
+    monkeypatch.setattr(
+        weather_data_service, "_parse_weather_fields",
+        lambda raw: parses.append(raw) or real_parse(raw)
+    )
+    monkeypatch.setattr(weather_data_service, "WEATHER_CACHE_TTL", 0)
+
+    first = weather_data_service.fetch_weather_data_sync()
+    second = asyncio.run(weather_data_service.fetch_weather_data())
+
+    assert len(tempest) == 2
+    assert len(parses) == 1
+    assert first["temperature"] == second["temperature"]
+    assert second["temperature"] == "72°F"
+    assert "today_date" in second
+
+
+def test_expired_cache_revalidates_with_etag(tempest_server, monkeypatch):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=PAYLOAD, headers={"ETag": '"v1"'})
+
+    requests = tempest_server(handler)
+    monkeypatch.setattr(weather_data_service, "WEATHER_CACHE_TTL", 0)
+
+    first = weather_data_service.fetch_weather_data_sync()
+    second = weather_data_service.fetch_weather_data_sync()
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert second["temperature"] == first["temperature"] == "72°F"
+
+
+def test_clients_are_reused(tempest):
+    client = weather_data_service._get_sync_client()
+    assert weather_data_service._get_sync_client() is client
+
+    async def run():
+        first = weather_data_service._get_async_client()
+        assert weather_data_service._get_async_client() is first
+        await weather_data_service.aclose()
+        assert first.is_closed
+
+    asyncio.run(run())
+    assert client.is_closed
+
+
+def test_settings_cached_until_invalidated(db_session):
+    from models.database import ReelForgeSettings
+
+    weather_data_service.invalidate_settings_cache()
+    settings = ReelForgeSettings(tempest_api_url="http://tempest-a", weather_enabled=False)
+    db_session.add(settings)
+    db_session.commit()
+
+    assert weather_data_service.get_tempest_api_url(db_session) == "http://tempest-a"
+    assert weather_data_service.is_weather_enabled(db_session) is False
+
+    settings.tempest_api_url = "http://tempest-b"
+    db_session.commit()
+    assert weather_data_service.get_tempest_api_url(db_session) == "http://tempest-a"
+
+    weather_data_service.invalidate_settings_cache()
+    assert weather_data_service.get_tempest_api_url(db_session) == "http://tempest-b"
+    weather_data_service.invalidate_settings_cache()
+
+
+def test_time_variables_formatted_once_per_minute(monkeypatch):
+    monkeypatch.setattr(weather_data_service, "get_timezone", lambda: ZoneInfo("UTC"))
+    monkeypatch.setattr(weather_data_service, "_time_vars_cache", None)
+    monkeypatch.setattr(weather_data_service.time, "time", lambda: 1_700_000_000.0)
+
+    first = weather_data_service._time_variables()
+    assert set(first) == {"today_date", "day_of_week", "time_of_day", "current_time"}
+    assert weather_data_service._time_variables() is first
+
+    monkeypatch.setattr(weather_data_service.time, "time", lambda: 1_700_000_060.0)
+    assert weather_data_service._time_variables() is not first
+
+
+def test_parse_weather_data_maps_sections(monkeypatch):
+    monkeypatch.setattr(weather_data_service, "get_timezone", lambda: ZoneInfo("UTC"))
+    raw = {
+        "current": {"temperature": "70°F", "location_name": "Harbor"},
+        "fishing": {"next_tide_event": "High tide", "moon_phase": "Full"},
+        "tides": {"stations": [{"name": "SANDY HOOK"}]},
+    }
+
+    variables = weather_data_service.parse_weather_data(raw)
+    assert variables["temperature"] == "70°F"
+    assert variables["location"] == "Harbor"
+    assert variables["conditions"] == ""
+    assert variables["humidity"] == "--"
+    assert variables["next_tide"] == "High tide"
+    assert variables["moon_phase"] == "Full"
+    assert variables["tide_station_name"] == "SANDY HOOK"
+    assert "forecast_high" not in variables
+    assert variables["tide_stage"] == "--"
+
+    raw["tides"]["stations"][0].update(tide_type="Incoming", tide_time="3:10 PM")
+    variables = weather_data_service.parse_weather_data(raw)
+    assert variables["tide_stage"] == "Incoming"
+    assert variables["next_tide_time"] == "3:10 PM"
+
+    raw["fishing"].update(tide_stage="Outgoing", next_tide_time="9:00 PM")
+    variables = weather_data_service.parse_weather_data(raw)
+    assert variables["tide_stage"] == "Outgoing"
+    assert variables["next_tide_time"] == "9:00 PM"
+
+
+def test_available_variables_are_read_only():
+    variables = weather_data_service.get_available_variables()
+
+    assert variables is weather_data_service.get_available_variables()
+    assert variables["temperature"] == weather_data_service.AVAILABLE_VARIABLES["temperature"]
+    with pytest.raises(TypeError):
+        variables["temperature"] = "changed"
@@ -0,0 +1,144 @@
+"""
+Tests for YouTube destination OAuth helpers (services/youtube_destination_service.py).
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from services import youtube_destination_service
+
+
+@pytest.fixture(autouse=True)
+def token_endpoint(monkeypatch):
+    """Stand in for Google's token endpoint and record each refresh's transport."""
+    refreshes = []
+
+    def fake_refresh(self, request):
+        refreshes.append(request)
+        time.sleep(0.05)
+        self.token = f"access-{len(refreshes)}"
+        self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", fake_refresh)
+    monkeypatch.setattr(youtube_destination_service, "_credentials_cache", {})
+    return refreshes
+
+
+def test_credentials_shared_per_token_set(token_endpoint):
+    first = youtube_destination_service.get_credentials("client", "secret", "refresh-a")
+    assert first.token == "access-1"
+    assert token_endpoint == [youtube_destination_service._token_request]
+
+    assert youtube_destination_service.get_credentials("client", "secret", "refresh-a") is first
+    assert len(token_endpoint) == 1
+    other = youtube_destination_service.get_credentials("client", "secret", "refresh-b")
+    assert other is not first
+    assert other.token == "access-2"
+
+
+def test_failed_refresh_is_left_to_the_api_call(monkeypatch, caplog):
+    def failing_refresh(self, request):
+        raise RuntimeError("token endpoint unreachable")
+
+    monkeypatch.setattr(Credentials, "refresh", failing_refresh)
+
+    credentials = youtube_destination_service.get_credentials("client", "secret", "refresh")
+    assert credentials.token is None
+    assert "token endpoint unreachable" in caplog.text
+
+
+def test_credentials_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(youtube_destination_service, "_CREDENTIALS_CACHE_SIZE", 2)
+
+    oldest = youtube_destination_service.get_credentials("client", "secret", "refresh-1")
+    youtube_destination_service.get_credentials("client", "secret", "refresh-2")
+    youtube_destination_service.get_credentials("client", "secret", "refresh-3")
+
+    assert len(youtube_destination_service._credentials_cache) == 2
+    assert youtube_destination_service.get_credentials("client", "secret", "refresh-1") is not oldest
+
+
+def test_concurrent_refreshes_are_coalesced(token_endpoint):
+    credentials = youtube_destination_service.get_credentials("client", "secret", "refresh")
+    credentials.expiry = datetime.utcnow() - timedelta(seconds=1)
+
+    threads = [threading.Thread(target=credentials.refresh, args=(None,)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(token_endpoint) == 2
+    assert credentials.token == "access-2"
+
+    # An explicit refresh of a still-valid token (e.g. after a 401) is not skipped
+    credentials.refresh(None)
+    assert credentials.token == "access-3"
+
+
+class _FakeYouTube:
+    """Minimal googleapiclient stand-in that records which thread ran each call."""
+
+    def __init__(self, calls, fail=()):
+        self.calls = calls
+        self.fail = fail
+
+    def _request(self, name, response):
+        def execute():
+            self.calls.append((name, threading.current_thread().name))
+            time.sleep(0.05)
+            if name in self.fail:
+                raise RuntimeError(f"{name} failed")
+            return response
+        return type("Request", (), {"execute": staticmethod(execute)})()
+
+    def liveBroadcasts(self):
+        youtube = self
+        return type("LiveBroadcasts", (), {
+            "insert": lambda self, **kw: youtube._request("broadcast", {"id": "b1"}),
+            "bind": lambda self, **kw: youtube._request("bind", {}),
+        })()
+
+    def liveStreams(self):
+        youtube = self
+        ingestion = {"streamName": "key", "ingestionAddress": "rtmp://a.rtmp.youtube.com/live2"}
+        return type("LiveStreams", (), {
+            "insert": lambda self, **kw: youtube._request(
+                "stream", {"id": "s1", "cdn": {"ingestionInfo": ingestion}}
+            ),
+            "delete": lambda self, id: youtube._request(f"delete {id}", None),
+        })()
+
+
+def test_create_broadcast_inserts_stream_concurrently(monkeypatch):
+    calls = []
+    monkeypatch.setattr(youtube_destination_service, "build", lambda *a, **kw: _FakeYouTube(calls))
+    credentials = youtube_destination_service.get_credentials("client", "secret", "refresh")
+
+    result = youtube_destination_service.create_broadcast(credentials, "Harbor cam")
+
+    assert result["broadcast_id"] == "b1"
+    assert result["stream_id"] == "s1"
+    assert result["stream_key"] == "key"
+    threads = dict(calls)
+    assert threads["stream"] != threads["broadcast"]
+    assert calls[-1][0] == "bind"
+
+
+def test_create_broadcast_failure_deletes_created_stream(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        youtube_destination_service, "build", lambda *a, **kw: _FakeYouTube(calls, fail={"broadcast"})
+    )
+    credentials = youtube_destination_service.get_credentials("client", "secret", "refresh")
+
+    with pytest.raises(RuntimeError, match="broadcast failed"):
+        youtube_destination_service.create_broadcast(credentials, "Harbor cam")
+
+    names = [name for name, _ in calls]
+    assert "stream" in names
+    assert names[-1] == "delete s1"
+    assert "bind" not in names
@@ -11,7 +11,7 @@ Weather and environmental data integration via TempestWeather service.
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 
 from utils.crypto import decrypt
@@ -395,7 +395,7 @@ def generate_headlines_sync(ai_config: Dict, include_weather: bool = True) -> Li
 
 
 # Export available variables for frontend documentation
-def get_template_variables() -> Dict[str, str]:
+def get_template_variables() -> Mapping[str, str]:
     """Get available template variables for documentation"""
     if WEATHER_SERVICE_AVAILABLE:
         return get_available_variables()
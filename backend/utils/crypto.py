@@ -5,6 +5,7 @@ Requires ENCRYPTION_KEY environment variable to be set.
 """
 
 import os
+from functools import lru_cache
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -29,3 +30,13 @@ def decrypt(encrypted: str) -> str:
         return _fernet.decrypt(encrypted.encode()).decode()
     except InvalidToken:
         raise ValueError("Unable to decrypt value: not a valid Fernet token")
+
+
+@lru_cache(maxsize=64)
+def decrypt_cached(encrypted: str) -> str:
+    """decrypt() memoized per token, for credentials read on every poll or segment.
+
+    A Fernet token is immutable, so a changed secret arrives as a new token
+    and misses the cache. Failures are not cached.
+    """
+    return decrypt(encrypted)
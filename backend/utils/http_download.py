@@ -0,0 +1,56 @@
+"""Shared helper for downloading HTTP response bodies to temp files.
+
+Used by the timeline executors to fetch overlay images without holding the
+whole body in memory.
+"""
+
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+
+async def stream_to_temp_file(
+    client: httpx.AsyncClient,
+    url: str,
+    suffix: Optional[str] = None,
+    dir: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    follow_redirects: bool = False,
+) -> Tuple[Optional[str], httpx.Response]:
+    """Stream a GET response body straight into a temp file.
+
+    Chunks are written as they arrive so peak memory stays at one chunk
+    instead of the whole body.
+
+    Args:
+        client: HTTP client to issue the request with.
+        url: URL to fetch.
+        suffix: Temp file suffix; derived from the content-type when None.
+        dir: Directory for the temp file (system temp dir when None).
+        headers: Extra request headers (e.g. ``If-None-Match``).
+        follow_redirects: Whether to follow redirects.
+
+    Returns:
+        ``(temp file path or None, response)``; the path is None for any
+        status other than 200.
+    """
+    async with client.stream("GET", url, headers=headers, follow_redirects=follow_redirects) as response:
+        if response.status_code != 200:
+            return None, response
+        if suffix is None:
+            suffix = '.png' if 'png' in response.headers.get('content-type', '') else '.jpg'
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=dir)
+        try:
+            try:
+                async for chunk in response.aiter_bytes(65536):
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return path, response
@@ -6,13 +6,21 @@ Provides a JSON log formatter and a filter that masks sensitive data
 Usage:
     from utils.logging_config import configure_logging
     configure_logging()  # Call once at startup
+
+    from utils.logging_config import bind_logger
+    log = bind_logger(logger, timeline_id=42)
+    log.info("Segment started at t=%.2fs", seg_start)  # JSON output carries "context"
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 from datetime import datetime, timezone
+from typing import Any, MutableMapping, Optional, Tuple
 
 
 # Patterns to redact in log messages
@@ -43,13 +51,23 @@ class SecretRedactionFilter(logging.Filter):
     """Log filter that redacts sensitive data from log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if isinstance(record.msg, str):
-            record.msg = _redact(record.msg)
-        if record.args:
+        # Redact the rendered message: a secret split across a %-template and
+        # its args (e.g. "password=%s") is only visible once formatted
+        try:
+            message = record.getMessage()
+        except Exception:
+            # A malformed call must not raise here: filters run outside
+            # Handler.emit's error handling, on the queue listener thread.
+            # Redact the pieces and let emit report the formatting error.
+            if isinstance(record.msg, str):
+                record.msg = _redact(record.msg)
             if isinstance(record.args, dict):
-                record.args = {k: _redact(str(v)) if isinstance(v, str) else v for k, v in record.args.items()}
+                record.args = {k: _redact(v) if isinstance(v, str) else v for k, v in record.args.items()}
             elif isinstance(record.args, tuple):
-                record.args = tuple(_redact(str(a)) if isinstance(a, str) else a for a in record.args)
+                record.args = tuple(_redact(a) if isinstance(a, str) else a for a in record.args)
+            return True
+        record.msg = _redact(message)
+        record.args = None
         return True
 
 
@@ -63,11 +81,52 @@ class JSONFormatter(logging.Formatter):
             "logger": record.name,
             "message": record.getMessage(),
         }
+        context = getattr(record, "context", None)
+        if context:
+            log_entry["context"] = context
         if record.exc_info and record.exc_info[1]:
             log_entry["exception"] = self.formatException(record.exc_info)
         return json.dumps(log_entry, default=str)
 
 
+class ContextLogger(logging.LoggerAdapter):
+    """Logger adapter carrying bound key/value context.
+
+    The context is attached to each record as ``record.context`` (rendered by
+    JSONFormatter) instead of being interpolated into the message, so callers
+    keep lazy %-style formatting and pay nothing for dropped records.
+    """
+
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> Tuple[Any, MutableMapping[str, Any]]:
+        extra = kwargs.get("extra") or {}
+        kwargs["extra"] = {**extra, "context": self.extra}
+        return msg, kwargs
+
+    def bind(self, **context: Any) -> "ContextLogger":
+        """Return a new adapter with additional bound context."""
+        return ContextLogger(self.logger, {**self.extra, **context})
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to the listener unmodified.
+
+    The queue never leaves the process, so the stock prepare() step (which
+    flattens the message and drops exc_info for pickling) is unnecessary and
+    would strip the fields JSONFormatter renders.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def bind_logger(logger: logging.Logger, **context: Any) -> ContextLogger:
+    """Wrap a stdlib logger with bound structured context."""
+    return ContextLogger(logger, context)
+
+
 def configure_logging() -> None:
     """Configure structured logging for the application.
 
@@ -81,6 +140,8 @@ def configure_logging() -> None:
     root.setLevel(getattr(logging, log_level, logging.INFO))
 
     # Remove any existing handlers
+    global _queue_listener
+    _stop_queue_listener()
     root.handlers.clear()
 
     handler = logging.StreamHandler()
@@ -94,8 +155,23 @@ def configure_logging() -> None:
 
     # Add secret redaction filter
     handler.addFilter(SecretRedactionFilter())
-    root.addHandler(handler)
+
+    # Format and write on a listener thread so logging calls made from the
+    # event loop never block on stream I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(_InProcessQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
 
     # Quiet down noisy third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None